@@ -1,6 +1,29 @@
 from abc import ABC, abstractmethod
 import pandas as pd
 
+from ..profile import DatasetProfile
+
+
+class AnalyzerState(ABC):
+    """Mergeable accumulator for chunked (out-of-core) analysis.
+
+    ``update`` sees each chunk once, ``merge`` folds in a state built from other
+    chunks, and ``finalize`` returns the same dict ``BaseAnalyzer.run`` would. The
+    shared ``StreamingProfile`` (rows, nulls, distinct counts, duplicates) is
+    accumulated separately and handed to ``finalize``.
+    """
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        pass
+
+    def merge(self, other: "AnalyzerState") -> "AnalyzerState":
+        return self
+
+    @abstractmethod
+    def finalize(self, profile: DatasetProfile) -> dict:
+        pass
+
+
 class BaseAnalyzer(ABC):
 
     name = "base"
@@ -10,8 +33,12 @@ class BaseAnalyzer(ABC):
 
         self,
         df: pd.DataFrame,
-        profile: dict,
+        profile: DatasetProfile,
         target_column: str | None = None
     ) -> dict:
 
         pass
+
+    def streaming_state(self, target_column: str | None = None) -> AnalyzerState | None:
+        # Analyzers that return None here run on a row sample in chunked mode.
+        return None
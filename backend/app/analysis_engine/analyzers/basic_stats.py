@@ -1,6 +1,43 @@
 import pandas as pd
 
-from .base import BaseAnalyzer
+from ..profile import DatasetProfile
+from .base import AnalyzerState, BaseAnalyzer
+
+
+def _basic_stats_report(profile: DatasetProfile, dtype_counts: dict, memory_bytes: float) -> dict:
+    rows = profile.rows
+    constant_columns = [
+        col for col in profile.column_names if profile.distinct_count(col, dropna=False) <= 1
+    ]
+    duplicate_ratio = float(profile.duplicate_count / rows) if rows else 0.0
+
+    return {
+        "rows": int(rows),
+        "columns": int(profile.columns),
+        "numeric_columns": int(len(profile.numeric_columns)),
+        "categorical_columns": int(len(profile.categorical_columns)),
+        "constant_columns": constant_columns,
+        "duplicate_ratio": round(duplicate_ratio, 4),
+        "dtype_distribution": dtype_counts,
+        "estimated_memory_mb": round(float(memory_bytes) / (1024 * 1024), 2),
+        "cardinality": profile.cardinality_summary(),
+    }
+
+
+class BasicStatsState(AnalyzerState):
+    def __init__(self) -> None:
+        self.memory_bytes = 0
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        self.memory_bytes += int(chunk.memory_usage(deep=True, index=False).sum())
+
+    def merge(self, other: "BasicStatsState") -> "BasicStatsState":
+        self.memory_bytes += other.memory_bytes
+        return self
+
+    def finalize(self, profile: DatasetProfile) -> dict:
+        dtype_counts = pd.Series(profile.column_dtypes, dtype="object").value_counts().to_dict()
+        return _basic_stats_report(profile, dtype_counts, self.memory_bytes)
 
 
 class BasicStatsAnalyzer(BaseAnalyzer):
@@ -9,30 +46,12 @@ class BasicStatsAnalyzer(BaseAnalyzer):
     def run(
         self,
         df: pd.DataFrame,
-        profile: dict,
+        profile: DatasetProfile,
         target_column: str | None = None,
     ) -> dict:
-        rows = profile["rows"]
-        columns = profile["columns"]
-        numeric_cols = df.select_dtypes(include="number").columns.to_list()
-        categorical_cols = df.select_dtypes(exclude="number").columns.to_list()
-
-        constant_columns = [
-            col for col in df.columns if df[col].nunique(dropna=False) <= 1
-        ]
-
-        duplicate_ratio = float(df.duplicated().mean()) if rows else 0.0
-        memory_mb = float(df.memory_usage(deep=True).sum()) / (1024 * 1024)
-
+        memory_bytes = df.memory_usage(deep=True).sum()
         dtype_counts = df.dtypes.astype(str).value_counts().to_dict()
+        return _basic_stats_report(profile, dtype_counts, memory_bytes)
 
-        return {
-            "rows": int(rows),
-            "columns": int(columns),
-            "numeric_columns": int(len(numeric_cols)),
-            "categorical_columns": int(len(categorical_cols)),
-            "constant_columns": constant_columns,
-            "duplicate_ratio": round(duplicate_ratio, 4),
-            "dtype_distribution": dtype_counts,
-            "estimated_memory_mb": round(memory_mb, 2),
-        }
+    def streaming_state(self, target_column: str | None = None) -> BasicStatsState:
+        return BasicStatsState()
@@ -2,11 +2,21 @@ import logging
 
 import pandas as pd
 
-from .base import BaseAnalyzer
+from ..profile import DatasetProfile
+from .base import AnalyzerState, BaseAnalyzer
 
 logger = logging.getLogger(__name__)
 
 
+class CategoricalState(AnalyzerState):
+    # Distinct counts are accumulated by the shared StreamingProfile.
+    def __init__(self, analyzer: "CategoricalAnalyzer") -> None:
+        self.analyzer = analyzer
+
+    def finalize(self, profile: DatasetProfile) -> dict:
+        return self.analyzer.run(profile.df, profile)
+
+
 class CategoricalAnalyzer(BaseAnalyzer):
     name = "categorical"
     HIGH_CARDINALITY_THRESHOLD = 0.5
@@ -14,32 +24,35 @@ class CategoricalAnalyzer(BaseAnalyzer):
     def run(
         self,
         df: pd.DataFrame,
-        profile: dict,
+        profile: DatasetProfile,
         target_column: str | None = None,
     ) -> dict:
         logger.info("Running categorical analyzer")
 
-        categorical_df = df.select_dtypes(exclude="number")
-        if categorical_df.empty:
+        categorical_columns = profile.categorical_columns
+        if not categorical_columns:
             return {"skipped": True, "reason": "no_categorical_columns"}
 
-        rows = len(df)
+        rows = profile.rows
         if rows == 0:
             return {
                 "threshold": self.HIGH_CARDINALITY_THRESHOLD,
                 "unique_ratio": {},
+                "cardinality_method": {},
                 "high_cardinality_columns": [],
                 "constant_columns": [],
             }
 
         unique_ratio: dict[str, float] = {}
+        cardinality_method: dict[str, str] = {}
         high_cardinality_columns: list[str] = []
         constant_columns: list[str] = []
 
-        for column in categorical_df.columns:
-            unique_count = df[column].nunique(dropna=False)
+        for column in categorical_columns:
+            unique_count = profile.distinct_count(column, dropna=False)
             ratio = unique_count / rows
             unique_ratio[column] = round(float(ratio), 4)
+            cardinality_method[column] = profile.cardinality_method(column)
 
             if ratio >= self.HIGH_CARDINALITY_THRESHOLD:
                 high_cardinality_columns.append(column)
@@ -50,6 +63,10 @@ class CategoricalAnalyzer(BaseAnalyzer):
         return {
             "threshold": self.HIGH_CARDINALITY_THRESHOLD,
             "unique_ratio": unique_ratio,
+            "cardinality_method": cardinality_method,
             "high_cardinality_columns": high_cardinality_columns,
             "constant_columns": constant_columns,
         }
+
+    def streaming_state(self, target_column: str | None = None) -> CategoricalState:
+        return CategoricalState(self)
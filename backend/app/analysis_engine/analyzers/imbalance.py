@@ -2,18 +2,75 @@ import logging
 
 import pandas as pd
 
-from .base import BaseAnalyzer
+from ..profile import DatasetProfile
+from .base import AnalyzerState, BaseAnalyzer
 
 logger = logging.getLogger(__name__)
 
 
+def _imbalance_report(target_column: str, value_counts: dict, total: int) -> dict:
+    if total == 0:
+        return {
+            "target_column": target_column,
+            "num_classes": 0,
+            "class_distribution": {},
+            "minority_ratio": 0.0,
+            "imbalance_detected": False,
+        }
+
+    class_distribution = {
+        str(k): round(float(v / total), 4) for k, v in value_counts.items()
+    }
+
+    minority_ratio = min(class_distribution.values()) if class_distribution else 0.0
+    imbalance_flag = minority_ratio < 0.1 if class_distribution else False
+
+    return {
+        "target_column": target_column,
+        "num_classes": len(class_distribution),
+        "class_distribution": class_distribution,
+        "minority_ratio": round(float(minority_ratio), 4),
+        "imbalance_detected": imbalance_flag,
+    }
+
+
+class ImbalanceState(AnalyzerState):
+    def __init__(self, target_column: str | None) -> None:
+        self.target_column = target_column
+        self.value_counts = pd.Series(dtype="int64")
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        if self.target_column in chunk.columns:
+            counts = chunk[self.target_column].value_counts(dropna=False)
+            self.value_counts = self.value_counts.add(counts, fill_value=0)
+
+    def merge(self, other: "ImbalanceState") -> "ImbalanceState":
+        self.value_counts = self.value_counts.add(other.value_counts, fill_value=0)
+        return self
+
+    def finalize(self, profile: DatasetProfile) -> dict:
+        if profile.rows == 0:
+            return {"skipped": True, "reason": "empty_dataframe"}
+        if not self.target_column:
+            return {"skipped": True, "reason": "no_target_column"}
+        if self.target_column not in profile.column_names:
+            raise ValueError(f"Target column {self.target_column} not found")
+
+        counts = self.value_counts
+        if profile.column_dtypes.get(self.target_column) == "float64":
+            # Match a single full parse, where one NaN turns every class label into a float.
+            counts = counts.groupby(counts.index.map(float), dropna=False).sum()
+        counts = counts.astype("int64").sort_values(ascending=False, kind="stable")
+        return _imbalance_report(self.target_column, counts.to_dict(), profile.rows)
+
+
 class ImbalanceAnalyzer(BaseAnalyzer):
     name = "imbalance"
 
     def run(
         self,
         df: pd.DataFrame,
-        profile: dict,
+        profile: DatasetProfile,
         target_column: str | None = None,
     ) -> dict:
         logger.info("Running imbalance analyzer")
@@ -28,28 +85,8 @@ class ImbalanceAnalyzer(BaseAnalyzer):
             raise ValueError(f"Target column {target_column} not found")
 
         target = df[target_column]
-        total = len(target)
-        if total == 0:
-            return {
-                "target_column": target_column,
-                "num_classes": 0,
-                "class_distribution": {},
-                "minority_ratio": 0.0,
-                "imbalance_detected": False,
-            }
-
         value_counts = target.value_counts(dropna=False).to_dict()
-        class_distribution = {
-            str(k): round(float(v / total), 4) for k, v in value_counts.items()
-        }
-
-        minority_ratio = min(class_distribution.values()) if class_distribution else 0.0
-        imbalance_flag = minority_ratio < 0.1 if class_distribution else False
+        return _imbalance_report(target_column, value_counts, len(target))
 
-        return {
-            "target_column": target_column,
-            "num_classes": len(class_distribution),
-            "class_distribution": class_distribution,
-            "minority_ratio": round(float(minority_ratio), 4),
-            "imbalance_detected": imbalance_flag,
-        }
+    def streaming_state(self, target_column: str | None = None) -> ImbalanceState:
+        return ImbalanceState(target_column)
@@ -1,20 +1,124 @@
 import logging
 
+import numpy as np
 import pandas as pd
+from scipy import sparse
 
+from ..profile import DatasetProfile
 from .base import BaseAnalyzer
 
 logger = logging.getLogger(__name__)
 
 
+def _pearson_column(values: np.ndarray, target: np.ndarray) -> float:
+    valid = ~np.isnan(values) & ~np.isnan(target)
+    if valid.sum() < 2:
+        return float("nan")
+    x = values[valid] - values[valid].mean()
+    y = target[valid] - target[valid].mean()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return float(np.clip(x @ y / np.sqrt((x @ x) * (y @ y)), -1.0, 1.0))
+
+
+def _pearson_with_target(features: np.ndarray, target: np.ndarray) -> np.ndarray:
+    """Pairwise-complete Pearson r of every column with the target (like ``DataFrame.corrwith``).
+
+    ``features`` is centered in place and nothing else of its size is allocated:
+    complete columns take one matrix-vector product, columns with missing values
+    are computed one at a time.
+    """
+    target_valid = ~np.isnan(target)
+    weights = target_valid.astype(np.float64)
+    rows = int(target_valid.sum())
+    if rows < 2:
+        return np.full(features.shape[1], np.nan)
+
+    # NaN anywhere in a column (where the target is present or not) propagates into its sum.
+    means = (features.T @ weights) / rows
+    incomplete = np.isnan(means)
+    features -= np.where(incomplete, 0.0, means)
+    target_centered = np.where(target_valid, target - np.nanmean(target), 0.0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        numerator = features.T @ target_centered
+        features_ss = np.einsum("ij,ij,i->j", features, features, weights)
+        r = numerator / np.sqrt(features_ss * (target_centered @ target_centered))
+    r = np.clip(r, -1.0, 1.0)
+    for col in np.flatnonzero(incomplete):
+        r[col] = _pearson_column(features[:, col], target)
+    return r
+
+
+def _correlation_ratio(values: np.ndarray, groups: np.ndarray) -> np.ndarray:
+    """Correlation ratio (eta) of each numeric column given integer group codes.
+
+    Group sums for all columns come from one one-hot product; rows with a missing
+    value or group are left out per column.
+    """
+    rows = len(groups)
+    group_count = int(groups.max()) + 1 if rows else 0
+    one_hot = sparse.csr_matrix((np.ones(rows), (groups, np.arange(rows))), shape=(group_count, rows))
+    valid = ~np.isnan(values)
+    x = np.where(valid, values, 0.0)
+    counts = one_hot @ valid.astype(np.float64)
+    sums = one_hot @ x
+    total = counts.sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        grand_mean = sums.sum(axis=0) / total
+        # Groups with no values in a column contribute nothing (0 * nan -> nansum).
+        between = np.nansum(counts * (sums / counts - grand_mean) ** 2, axis=0)
+        total_ss = (np.where(valid, x - grand_mean, 0.0) ** 2).sum(axis=0)
+        eta = np.sqrt(between / total_ss)
+    return np.where(total_ss > 0, np.clip(eta, 0.0, 1.0), np.nan)
+
+
+def _cramers_v(left: np.ndarray, right: np.ndarray) -> float:
+    """Bias-corrected Cramer's V (Bergsma) from the contingency table of two code arrays."""
+    valid = (left >= 0) & (right >= 0)
+    left, right = left[valid], right[valid]
+    n = len(left)
+    if n < 2:
+        return float("nan")
+    _, left = np.unique(left, return_inverse=True)
+    _, right = np.unique(right, return_inverse=True)
+    rows, cols = int(left.max()) + 1, int(right.max()) + 1
+    if rows < 2 or cols < 2:
+        return float("nan")
+    observed = np.bincount(left * cols + right, minlength=rows * cols).reshape(rows, cols)
+    expected = observed.sum(axis=1, keepdims=True) * observed.sum(axis=0, keepdims=True) / n
+    chi2 = float(((observed - expected) ** 2 / expected).sum())
+    phi2 = max(0.0, chi2 / n - (rows - 1) * (cols - 1) / (n - 1))
+    rows_corrected = rows - (rows - 1) ** 2 / (n - 1)
+    cols_corrected = cols - (cols - 1) ** 2 / (n - 1)
+    denominator = min(rows_corrected - 1, cols_corrected - 1)
+    if denominator <= 0:
+        return float("nan")
+    return float(min(np.sqrt(phi2 / denominator), 1.0))
+
+
 class LeakageAnalyzer(BaseAnalyzer):
+    """Association of every feature with the target, flagging near-perfect ones.
+
+    Only feature-vs-target statistics are computed, so cost is linear in the number
+    of columns: Pearson r for numeric pairs, the correlation ratio (eta) between a
+    numeric and a categorical side, and bias-corrected Cramer's V for categorical
+    pairs. Categoricals with more than ``MAX_CATEGORY_LEVELS`` levels (or mostly
+    unique values) are skipped: they match any target trivially and identifier
+    risk is reported by structural_risk.
+    """
+
     name = "leakage"
     CORRELATION_THRESHOLD = 0.9
+    MAX_CATEGORY_LEVELS = 200
+
+    def _low_cardinality(self, profile: DatasetProfile, column: str) -> bool:
+        distinct = profile.distinct_count(column)
+        return distinct <= self.MAX_CATEGORY_LEVELS and distinct <= 0.5 * profile.non_null_count(column)
 
     def run(
         self,
         df: pd.DataFrame,
-        profile: dict,
+        profile: DatasetProfile,
         target_column: str | None = None,
     ) -> dict:
         logger.info("Running leakage analyzer")
@@ -28,26 +132,65 @@ class LeakageAnalyzer(BaseAnalyzer):
         if target_column not in df.columns:
             raise ValueError(f"Target column '{target_column}' not found")
 
-        numeric_df = df.select_dtypes(include="number")
-        if target_column not in numeric_df.columns:
-            return {"skipped": True, "reason": "target_not_numeric"}
+        target_numeric = target_column in profile.numeric_columns
+        if not target_numeric and not self._low_cardinality(profile, target_column):
+            return {"skipped": True, "reason": "target_high_cardinality"}
 
-        correlations = (
-            numeric_df.corr(numeric_only=True)[target_column].drop(labels=[target_column])
-        )
-
-        suspicious_features: dict[str, float] = {}
-        for feature, corr in correlations.items():
-            if pd.isna(corr):
+        numeric_features = [col for col in profile.numeric_columns if col != target_column]
+        categorical_features = []
+        skipped_features = []
+        for col in profile.categorical_columns:
+            if col == target_column:
                 continue
-            if abs(corr) >= self.CORRELATION_THRESHOLD:
-                suspicious_features[feature] = round(float(corr), 4)
+            if self._low_cardinality(profile, col):
+                categorical_features.append(col)
+            else:
+                skipped_features.append(col)
+
+        scores: dict[str, float] = {}
+        methods: dict[str, str] = {}
+
+        def record(columns, values, method):
+            for col, value in zip(columns, values):
+                if not pd.isna(value):
+                    scores[col] = float(value)
+                    methods[col] = method
 
-        leakage_detected = len(suspicious_features) > 0
+        if target_numeric:
+            target = df[target_column].to_numpy(dtype=np.float64, na_value=np.nan)
+            if numeric_features:
+                block = df[numeric_features].to_numpy(dtype=np.float64, na_value=np.nan)
+                record(numeric_features, _pearson_with_target(block, target), "pearson")
+            for col in categorical_features:
+                codes = pd.factorize(df[col])[0]
+                valid = codes >= 0
+                eta = _correlation_ratio(target[valid][:, None], codes[valid])
+                record([col], eta, "correlation_ratio")
+        else:
+            target_codes = pd.factorize(df[target_column])[0]
+            valid = target_codes >= 0
+            if numeric_features:
+                block = df[numeric_features].to_numpy(dtype=np.float64, na_value=np.nan)
+                record(
+                    numeric_features,
+                    _correlation_ratio(block[valid], target_codes[valid]),
+                    "correlation_ratio",
+                )
+            for col in categorical_features:
+                record([col], [_cramers_v(pd.factorize(df[col])[0], target_codes)], "cramers_v")
+
+        suspicious_features = {
+            col: round(score, 4)
+            for col, score in scores.items()
+            if abs(score) >= self.CORRELATION_THRESHOLD
+        }
 
         return {
             "target_column": target_column,
             "threshold": self.CORRELATION_THRESHOLD,
+            "target_type": "numeric" if target_numeric else "categorical",
             "suspicious_features": suspicious_features,
-            "leakage_detected": leakage_detected,
+            "methods": {col: methods[col] for col in suspicious_features},
+            "skipped_high_cardinality": skipped_features,
+            "leakage_detected": len(suspicious_features) > 0,
         }
@@ -1,12 +1,81 @@
 import logging
 
+import numpy as np
 import pandas as pd
 
-from .base import BaseAnalyzer
+from ..profile import DatasetProfile
+from ..sketches import KLLSketch
+from .base import AnalyzerState, BaseAnalyzer
 
 logger = logging.getLogger(__name__)
 
 
+def _iqr_bounds(sketches: list[KLLSketch]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    quartiles = np.array([sketch.quantiles([0.25, 0.75]) for sketch in sketches]).reshape(-1, 2)
+    iqr = quartiles[:, 1] - quartiles[:, 0]
+    lower = quartiles[:, 0] - 1.5 * iqr
+    upper = quartiles[:, 1] + 1.5 * iqr
+    # Degenerate spreads (constant or empty columns) never flag outliers.
+    usable = (iqr != 0) & ~np.isnan(iqr)
+    return lower, upper, usable
+
+
+def _outlier_report(
+    columns: list[str],
+    ratios: np.ndarray,
+    sketches: list[KLLSketch],
+    threshold: float,
+) -> dict:
+    outlier_ratios = {col: round(float(ratio), 4) for col, ratio in zip(columns, ratios)}
+    high_outlier_columns = [
+        col
+        for col, ratio in outlier_ratios.items()
+        if ratio >= threshold
+    ]
+    return {
+        "threshold": threshold,
+        "outlier_ratios": outlier_ratios,
+        "high_outlier_columns": high_outlier_columns,
+        "quantile_summaries": {col: sketch.summary() for col, sketch in zip(columns, sketches)},
+    }
+
+
+class OutlierState(AnalyzerState):
+    """One KLL sketch per numeric column; outlier shares are read off the sketch CDF."""
+
+    def __init__(self, threshold: float) -> None:
+        self.threshold = threshold
+        self.sketches: dict[str, KLLSketch] = {}
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        for column in chunk.select_dtypes(include="number").columns:
+            values = chunk[column].to_numpy(dtype=np.float64, na_value=np.nan)
+            self.sketches.setdefault(column, KLLSketch()).update(values)
+
+    def merge(self, other: "OutlierState") -> "OutlierState":
+        for column, sketch in other.sketches.items():
+            if column in self.sketches:
+                self.sketches[column].merge(sketch)
+            else:
+                self.sketches[column] = sketch
+        return self
+
+    def finalize(self, profile: DatasetProfile) -> dict:
+        columns = profile.numeric_columns
+        if not columns:
+            return {"skipped": True, "reason": "no_numeric_columns"}
+
+        sketches = [self.sketches.get(column, KLLSketch()) for column in columns]
+        lower, upper, usable = _iqr_bounds(sketches)
+        ratios = np.zeros(len(columns))
+        for idx, sketch in enumerate(sketches):
+            if usable[idx] and profile.rows:
+                outside = sketch.fraction_below(lower[idx]) + sketch.fraction_above(upper[idx])
+                # Sketch fractions are over non-null values; nulls count as inliers.
+                ratios[idx] = float(outside) * sketch.count / profile.rows
+        return _outlier_report(columns, ratios, sketches, self.threshold)
+
+
 class OutlierAnalyzer(BaseAnalyzer):
     name = "outliers"
     OUTLIER_RATIO_THRESHOLD = 0.05
@@ -14,42 +83,27 @@ class OutlierAnalyzer(BaseAnalyzer):
     def run(
         self,
         df: pd.DataFrame,
-        profile: dict,
+        profile: DatasetProfile,
         target_column: str | None = None,
     ) -> dict:
         logger.info("Running outlier analyzer")
 
-        numeric_df = df.select_dtypes(include="number")
+        numeric_df = profile.numeric_frame()
         if numeric_df.empty:
             return {"skipped": True, "reason": "no_numeric_columns"}
 
-        q1 = numeric_df.quantile(0.25)
-        q3 = numeric_df.quantile(0.75)
-        iqr = q3 - q1
-
-        lower_bound = q1 - 1.5 * iqr
-        upper_bound = q3 + 1.5 * iqr
-
-        outlier_ratios: dict[str, float] = {}
-        for column in numeric_df.columns:
-            col = numeric_df[column]
-
-            if iqr[column] == 0 or pd.isna(iqr[column]):
-                outlier_ratios[column] = 0.0
-                continue
-
-            mask = (col < lower_bound[column]) | (col > upper_bound[column])
-            ratio = float(mask.mean()) if len(col) else 0.0
-            outlier_ratios[column] = round(ratio, 4)
+        block = numeric_df.to_numpy(dtype=np.float64, na_value=np.nan)
+        sketches = []
+        for idx in range(block.shape[1]):
+            sketch = KLLSketch()
+            sketch.update(block[:, idx])
+            sketches.append(sketch)
 
-        high_outlier_columns = [
-            col
-            for col, ratio in outlier_ratios.items()
-            if ratio >= self.OUTLIER_RATIO_THRESHOLD
-        ]
+        lower, upper, usable = _iqr_bounds(sketches)
+        # One comparison over the whole block; NaN compares False, so nulls are inliers.
+        outside = (block < lower) | (block > upper)
+        ratios = np.where(usable, outside.sum(axis=0) / max(len(block), 1), 0.0)
+        return _outlier_report(numeric_df.columns.tolist(), ratios, sketches, self.OUTLIER_RATIO_THRESHOLD)
 
-        return {
-            "threshold": self.OUTLIER_RATIO_THRESHOLD,
-            "outlier_ratios": outlier_ratios,
-            "high_outlier_columns": high_outlier_columns,
-        }
+    def streaming_state(self, target_column: str | None = None) -> OutlierState:
+        return OutlierState(self.OUTLIER_RATIO_THRESHOLD)
@@ -1,12 +1,21 @@
+from app.storage.file_storage import read_columnar_cache, write_columnar_cache
 from app.utils.csv_ingestion import load_tolerant_csv
 
-def load_dataframe(file_path: str):
+def load_dataframe(file_path: str, nrows: int | None = None):
 
     try :
+        cached = read_columnar_cache(file_path)
+        if cached is not None:
+            return cached
+
+        if nrows is not None:
+            # Partial reads (e.g. plotting a file analyzed in chunked mode) are not cached.
+            return load_tolerant_csv(file_path, nrows=nrows)
+
         df, warnings = load_tolerant_csv(file_path)
+        write_columnar_cache(file_path, df, warnings)
         return df, warnings
 
     except Exception as e:
 
         raise RuntimeError(f"Dataset load failed: {e}")        
-
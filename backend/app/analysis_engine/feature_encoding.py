@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from .profile import DatasetProfile, build_dataset_profile
+
+
+MAX_CATEGORIES_PER_COLUMN = 50
+MIN_CATEGORY_COUNT = 5
+MISSING_TOKEN = "__MISSING__"
+OTHER_TOKEN = "__OTHER__"
+
+
+class EncodedFeatures:
+    """Shared design matrix: median-imputed numerics followed by capped one-hot categoricals.
+
+    ``category_codes`` keeps the same capped categories as one integer code column
+    per categorical column, for models with native categorical support.
+    """
+
+    def __init__(
+        self,
+        matrix: sparse.csr_matrix,
+        feature_names: list[str],
+        numeric_feature_count: int,
+        metadata: dict[str, Any],
+        category_codes: np.ndarray | None = None,
+        categorical_columns: list[str] | None = None,
+    ):
+        self.matrix = matrix
+        self.feature_names = feature_names
+        self.numeric_feature_count = numeric_feature_count
+        self.metadata = metadata
+        self.categorical_columns = categorical_columns or []
+        if category_codes is None:
+            category_codes = np.empty((matrix.shape[0], 0), dtype=np.int16)
+        self.category_codes = category_codes
+
+    @property
+    def empty(self) -> bool:
+        return self.matrix.shape[0] == 0 or self.matrix.shape[1] == 0
+
+    def take(self, positions: np.ndarray) -> sparse.csr_matrix:
+        return self.matrix[positions]
+
+    def take_ordinal(self, positions: np.ndarray) -> np.ndarray:
+        """Dense rows of numerics followed by one category-code column per categorical."""
+        numeric = self.matrix[positions][:, : self.numeric_feature_count].toarray()
+        return np.hstack([numeric, self.category_codes[positions].astype(np.float64)])
+
+    @property
+    def ordinal_categorical_mask(self) -> np.ndarray:
+        return np.r_[
+            np.zeros(self.numeric_feature_count, dtype=bool),
+            np.ones(len(self.categorical_columns), dtype=bool),
+        ]
+
+
+def _encode_categorical(
+    series: pd.Series,
+    max_categories: int,
+    min_count: int,
+) -> tuple[np.ndarray, list[str], bool]:
+    codes, uniques = pd.factorize(series.astype("string").fillna(MISSING_TOKEN), sort=False)
+    counts = np.bincount(codes, minlength=len(uniques))
+
+    order = np.argsort(-counts, kind="stable")
+    keep = order[:max_categories]
+    keep = keep[counts[keep] >= min_count] if len(uniques) > max_categories else keep
+    bucketed = len(keep) < len(uniques)
+
+    mapping = np.full(len(uniques), len(keep), dtype=np.int64)
+    mapping[keep] = np.arange(len(keep))
+    labels = [str(uniques[idx]) for idx in keep]
+    if bucketed:
+        labels.append(OTHER_TOKEN)
+    return mapping[codes], labels, bucketed
+
+
+def encode_features(
+    df: pd.DataFrame,
+    target_column: str | None,
+    profile: DatasetProfile | None = None,
+    max_categories: int = MAX_CATEGORIES_PER_COLUMN,
+    min_count: int = MIN_CATEGORY_COUNT,
+) -> EncodedFeatures | None:
+    """Encode every non-target column once into a CSR matrix shared by all model-based stages.
+
+    Rare categories are bucketed into ``__OTHER__`` when a column has more than
+    ``max_categories`` levels, which keeps high-cardinality strings from exploding
+    the feature space.
+    """
+    if not target_column or target_column not in df.columns:
+        return None
+
+    profile = profile or build_dataset_profile(df)
+    started = time.perf_counter()
+    rows = len(df)
+    numeric_cols = [col for col in profile.numeric_columns if col != target_column]
+    categorical_cols = [col for col in profile.categorical_columns if col != target_column]
+
+    numeric = df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+    if numeric.size:
+        medians = df[numeric_cols].median().fillna(0.0).to_numpy(dtype=np.float64)
+        nan_rows, nan_cols = np.nonzero(np.isnan(numeric))
+        numeric[nan_rows, nan_cols] = medians[nan_cols]
+    blocks = [sparse.csr_matrix(numeric.reshape(rows, len(numeric_cols)))]
+    feature_names = list(numeric_cols)
+
+    bucketed_columns: list[str] = []
+    col_indices: list[np.ndarray] = []
+    ordinal_codes: list[np.ndarray] = []
+    offset = 0
+    for col in categorical_cols:
+        codes, labels, bucketed = _encode_categorical(df[col], max_categories, min_count)
+        col_indices.append(codes + offset)
+        ordinal_codes.append(codes.astype(np.int16))
+        feature_names.extend(f"{col}_{label}" for label in labels)
+        offset += len(labels)
+        if bucketed:
+            bucketed_columns.append(col)
+
+    if col_indices:
+        indices = np.stack(col_indices, axis=1).ravel()
+        indptr = np.arange(0, rows * len(col_indices) + 1, len(col_indices))
+        data = np.ones(len(indices), dtype=np.float64)
+        blocks.append(sparse.csr_matrix((data, indices, indptr), shape=(rows, offset)))
+
+    matrix = sparse.hstack(blocks, format="csr")
+    category_codes = np.empty((rows, 0), dtype=np.int16)
+    if ordinal_codes:
+        category_codes = np.stack(ordinal_codes, axis=1)
+
+    matrix_bytes = matrix.data.nbytes + matrix.indices.nbytes + matrix.indptr.nbytes
+    metadata = {
+        "rows": int(rows),
+        "features": int(matrix.shape[1]),
+        "numeric_features": len(numeric_cols),
+        "categorical_columns": len(categorical_cols),
+        "one_hot_features": int(offset),
+        "bucketed_columns": bucketed_columns[:20],
+        "max_categories_per_column": max_categories,
+        "nnz": int(matrix.nnz),
+        "matrix_memory_mb": round(matrix_bytes / (1024 * 1024), 3),
+        "category_codes_memory_mb": round(category_codes.nbytes / (1024 * 1024), 3),
+        "dense_equivalent_mb": round(rows * matrix.shape[1] * 8 / (1024 * 1024), 3),
+        "encode_seconds": round(time.perf_counter() - started, 4),
+    }
+    return EncodedFeatures(
+        matrix,
+        feature_names,
+        len(numeric_cols),
+        metadata,
+        category_codes=category_codes,
+        categorical_columns=categorical_cols,
+    )
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+_MB = 1024 * 1024
+
+
+def _current_rss_mb() -> float | None:
+    try:
+        with open("/proc/self/statm") as handle:
+            resident_pages = int(handle.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / _MB
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def process_peak_rss_mb() -> float | None:
+    """Highest RSS of this process since it started (not per stage or per run)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is kilobytes on Linux and bytes on macOS.
+    return peak / _MB if sys.platform == "darwin" else peak / 1024
+
+
+def _round(value: float | None, digits: int = 3) -> float | None:
+    return None if value is None else round(value, digits)
+
+
+class StageTimer:
+    """Wall time, CPU time and memory for one stage.
+
+    ``cpu_seconds`` is the CPU time of the calling thread, so work a stage hands to
+    its own worker threads (e.g. ``n_jobs=-1`` estimators) is not included. RSS and
+    tracemalloc are process-wide: when stages run concurrently their memory figures
+    overlap, so run with ``max_workers=1`` for clean per-stage attribution.
+
+    The tracemalloc peak is process-global too and resetting it would wipe the peak of
+    any concurrent stage, so ``traced_peak_mb`` is only measured with ``measure_peak``
+    (callers set it when nothing else runs alongside). Otherwise only the approximate
+    ``traced_delta_mb`` is reported.
+    """
+
+    def __init__(self, measure_peak: bool = False) -> None:
+        self.measure_peak = measure_peak
+        self.metrics: dict[str, Any] = {}
+
+    def start(self) -> "StageTimer":
+        self._wall = time.perf_counter()
+        self._cpu = time.thread_time()
+        self._rss = _current_rss_mb()
+        self._tracing = tracemalloc.is_tracing()
+        if self._tracing and self.measure_peak:
+            tracemalloc.reset_peak()
+        if self._tracing:
+            self._traced, _ = tracemalloc.get_traced_memory()
+        return self
+
+    def stop(self, status: str = "ok") -> dict[str, Any]:
+        rss = _current_rss_mb()
+        self.metrics = {
+            "status": status,
+            "wall_seconds": _round(time.perf_counter() - self._wall, 4),
+            "cpu_seconds": _round(time.thread_time() - self._cpu, 4),
+            "rss_mb": _round(rss, 1),
+            "rss_delta_mb": _round(rss - self._rss, 1) if rss is not None and self._rss is not None else None,
+        }
+        if self._tracing and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            self.metrics["traced_delta_mb"] = _round((current - self._traced) / _MB)
+            if self.measure_peak:
+                self.metrics["traced_peak_mb"] = _round(max(peak - self._traced, 0) / _MB)
+        return self.metrics
+
+
+class StageFailed(Exception):
+    """Raised by ``run_measured`` so the metrics of a failing stage survive the executor."""
+
+    def __init__(self, name: str, metrics: dict[str, Any]):
+        super().__init__(name, metrics)
+        self.name = name
+        self.metrics = metrics
+
+    def __str__(self) -> str:
+        return f"stage {self.name} failed"
+
+
+def run_measured(
+    name: str,
+    func,
+    kwargs: dict[str, Any],
+    measure_peak: bool = False,
+) -> tuple[Any, dict[str, Any]]:
+    """Call ``func(**kwargs)`` and return ``(value, metrics)``; module-level so process pools can pickle it."""
+    timer = StageTimer(measure_peak).start()
+    try:
+        value = func(**kwargs)
+    except Exception as exc:
+        raise StageFailed(name, timer.stop("failed")) from exc
+    return value, timer.stop()
+
+
+def log_stage_metrics(name: str, metrics: dict[str, Any]) -> None:
+    logger.info(
+        "stage=%s status=%s wall=%ss cpu=%ss rss_delta_mb=%s traced_delta_mb=%s traced_peak_mb=%s",
+        name,
+        metrics.get("status"),
+        metrics.get("wall_seconds"),
+        metrics.get("cpu_seconds"),
+        metrics.get("rss_delta_mb"),
+        metrics.get("traced_delta_mb"),
+        metrics.get("traced_peak_mb"),
+    )
@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import signal
+import tempfile
+import time
+import traceback
+from typing import Any, Callable
+
+import numpy as np
+from scipy import sparse
+
+from .feature_encoding import EncodedFeatures
+
+logger = logging.getLogger(__name__)
+
+_POLL_SECONDS = 0.1
+_MB = 1024 * 1024
+
+DEFAULT_ISOLATION_CPU_COUNT = 2
+DEFAULT_ISOLATION_MEMORY_MB = 4096.0
+DEFAULT_ISOLATION_WALL_SECONDS = 300.0
+
+
+class ResourceLimits:
+    """Limits for one isolated stage; ``None`` disables a limit.
+
+    ``cpu_count`` pins the worker (and the thread pools / joblib workers it
+    starts) to that many cores, ``memory_mb`` caps the resident memory of the
+    worker and its children, ``wall_seconds`` its run time.
+    """
+
+    def __init__(
+        self,
+        cpu_count: int | None = DEFAULT_ISOLATION_CPU_COUNT,
+        memory_mb: float | None = DEFAULT_ISOLATION_MEMORY_MB,
+        wall_seconds: float | None = DEFAULT_ISOLATION_WALL_SECONDS,
+    ):
+        self.cpu_count = int(cpu_count) if cpu_count and cpu_count > 0 else None
+        self.memory_mb = memory_mb if memory_mb and memory_mb > 0 else None
+        self.wall_seconds = wall_seconds if wall_seconds and wall_seconds > 0 else None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"cpu_count": self.cpu_count, "memory_mb": self.memory_mb, "wall_seconds": self.wall_seconds}
+
+
+class ResourceLimitExceeded(Exception):
+    def __init__(self, limit: str, detail: str):
+        super().__init__(limit, detail)
+        self.limit = limit
+        self.detail = detail
+
+
+def resource_limit_result(exc: ResourceLimitExceeded) -> dict[str, Any]:
+    return {"skipped": True, "reason": "resource_limit_exceeded", "limit": exc.limit, "detail": exc.detail}
+
+
+# Large inputs are written once with ``np.save`` and memory-mapped read-only by the
+# worker instead of being pickled through the pipe.
+
+
+class _SpilledArray:
+    def __init__(self, array: np.ndarray, directory: str, name: str):
+        self.path = os.path.join(directory, f"{name}.npy")
+        np.save(self.path, np.ascontiguousarray(array), allow_pickle=False)
+
+    def load(self) -> np.ndarray:
+        return np.load(self.path, mmap_mode="r")
+
+
+class _SpilledCSR:
+    def __init__(self, matrix: sparse.spmatrix, directory: str, name: str):
+        matrix = matrix.tocsr()
+        self.shape = matrix.shape
+        self.parts = [
+            _SpilledArray(getattr(matrix, part), directory, f"{name}.{part}")
+            for part in ("data", "indices", "indptr")
+        ]
+
+    def load(self) -> sparse.csr_matrix:
+        data, indices, indptr = (part.load() for part in self.parts)
+        return sparse.csr_matrix((data, indices, indptr), shape=self.shape, copy=False)
+
+
+class _SpilledEncoded:
+    def __init__(self, encoded: EncodedFeatures, directory: str, name: str):
+        self.matrix = _SpilledCSR(encoded.matrix, directory, f"{name}.matrix")
+        self.category_codes = _SpilledArray(encoded.category_codes, directory, f"{name}.category_codes")
+        self.feature_names = encoded.feature_names
+        self.numeric_feature_count = encoded.numeric_feature_count
+        self.metadata = encoded.metadata
+        self.categorical_columns = encoded.categorical_columns
+
+    def load(self) -> EncodedFeatures:
+        return EncodedFeatures(
+            self.matrix.load(),
+            self.feature_names,
+            self.numeric_feature_count,
+            self.metadata,
+            category_codes=self.category_codes.load(),
+            categorical_columns=self.categorical_columns,
+        )
+
+
+_SPILLED = (_SpilledArray, _SpilledCSR, _SpilledEncoded)
+
+
+def _spill(value: Any, directory: str, name: str) -> Any:
+    if isinstance(value, EncodedFeatures):
+        return _SpilledEncoded(value, directory, name)
+    if sparse.issparse(value):
+        return _SpilledCSR(value, directory, name)
+    if isinstance(value, np.ndarray) and value.dtype != object and value.nbytes >= _MB:
+        return _SpilledArray(value, directory, name)
+    return value
+
+
+def _child_pids(pid: int) -> list[int]:
+    """Every live descendant of ``pid`` (e.g. joblib workers), from /proc."""
+    parents: dict[int, list[int]] = {}
+    try:
+        entries = os.listdir("/proc")
+    except OSError:
+        return []
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as handle:
+                # The command name may contain spaces; ppid is the second field after it.
+                ppid = int(handle.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        parents.setdefault(ppid, []).append(int(entry))
+    found: list[int] = []
+    frontier = [pid]
+    while frontier:
+        children = parents.get(frontier.pop(), [])
+        found.extend(children)
+        frontier.extend(children)
+    return found
+
+
+def _rss_mb(pid: int) -> float:
+    try:
+        with open(f"/proc/{pid}/statm") as handle:
+            return int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / _MB
+    except (OSError, ValueError, IndexError):
+        return 0.0
+
+
+def _kill_tree(pid: int) -> None:
+    for target in [*_child_pids(pid), pid]:
+        try:
+            os.kill(target, signal.SIGKILL)
+        except OSError:
+            pass
+
+
+def _isolated_main(func: Callable[..., Any], kwargs: dict[str, Any], cpu_count: int | None, conn) -> None:
+    try:
+        if cpu_count:
+            if hasattr(os, "sched_setaffinity"):
+                cores = sorted(os.sched_getaffinity(0))[:cpu_count]
+                os.sched_setaffinity(0, cores)
+            from threadpoolctl import threadpool_limits
+
+            threadpool_limits(cpu_count)
+        kwargs = {name: value.load() if isinstance(value, _SPILLED) else value for name, value in kwargs.items()}
+        conn.send(("ok", func(**kwargs)))
+    except MemoryError:
+        conn.send(("memory", traceback.format_exc()))
+    except BaseException as exc:
+        conn.send(("error", (repr(exc), traceback.format_exc())))
+    finally:
+        conn.close()
+
+
+def run_isolated(func: Callable[..., Any], kwargs: dict[str, Any], limits: ResourceLimits) -> Any:
+    """Call ``func(**kwargs)`` in a fresh worker process under ``limits``.
+
+    Matrices and large arrays reach the worker as read-only memory-mapped ``.npy``
+    files (in ``tempfile``'s directory, so ``TMPDIR=/dev/shm`` keeps them in shared
+    memory); everything else is pickled. The worker is killed, together with any
+    processes it started, as soon as it passes a limit, and
+    ``ResourceLimitExceeded`` is raised. Exceptions inside ``func`` surface as
+    ``RuntimeError`` carrying the worker's traceback.
+    """
+    context = multiprocessing.get_context("spawn")
+    started = time.monotonic()
+    peak_rss = 0.0
+    with tempfile.TemporaryDirectory(prefix="sentinel-isolated-") as directory:
+        payload = {name: _spill(value, directory, name) for name, value in kwargs.items()}
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(
+            target=_isolated_main,
+            args=(func, payload, limits.cpu_count, sender),
+            name=f"isolated-{getattr(func, '__name__', 'stage')}",
+            daemon=False,
+        )
+        process.start()
+        sender.close()
+        message = None
+        try:
+            while message is None:
+                if receiver.poll(_POLL_SECONDS):
+                    try:
+                        message = receiver.recv()
+                    except EOFError:
+                        break
+                    continue
+                if not process.is_alive() and not receiver.poll():
+                    break
+
+                elapsed = time.monotonic() - started
+                if limits.wall_seconds is not None and elapsed > limits.wall_seconds:
+                    raise ResourceLimitExceeded(
+                        "wall_time", f"ran {elapsed:.1f}s, limit {limits.wall_seconds:g}s"
+                    )
+                if limits.memory_mb is not None:
+                    rss = sum(_rss_mb(pid) for pid in [process.pid, *_child_pids(process.pid)])
+                    peak_rss = max(peak_rss, rss)
+                    if rss > limits.memory_mb:
+                        raise ResourceLimitExceeded(
+                            "memory", f"resident {rss:.0f}MB, limit {limits.memory_mb:g}MB"
+                        )
+        finally:
+            if process.is_alive() and message is None:
+                _kill_tree(process.pid)
+            process.join()
+            receiver.close()
+
+    logger.info(
+        "isolated %s wall=%.2fs peak_rss_mb=%.0f exitcode=%s",
+        process.name,
+        time.monotonic() - started,
+        peak_rss,
+        process.exitcode,
+    )
+    if message is None:
+        if process.exitcode == -signal.SIGKILL:
+            # Killed from outside (typically the kernel OOM killer) before it could reply.
+            raise ResourceLimitExceeded("process_killed", "worker was killed by SIGKILL")
+        raise RuntimeError(f"isolated {process.name} exited with code {process.exitcode} without a result")
+    status, value = message
+    if status == "ok":
+        return value
+    if status == "memory":
+        raise ResourceLimitExceeded("memory", "worker raised MemoryError")
+    error, worker_traceback = value
+    raise RuntimeError(f"isolated {process.name} failed: {error}\n{worker_traceback}")
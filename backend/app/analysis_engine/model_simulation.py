@@ -1,51 +1,423 @@
 from __future__ import annotations
 
+import time
 from typing import Any
 
 import numpy as np
 import pandas as pd
 
+from .feature_encoding import EncodedFeatures, encode_features
+from .profile import DatasetProfile
+
 
 MAX_SIMULATION_ROWS = 100_000
 
+# "hist_gradient_boosting": one early-stopped HistGradientBoosting model on native
+# categoricals. "forest": random forest plus logistic regression on the one-hot matrix.
+SIMULATION_ENGINES = ("hist_gradient_boosting", "forest")
+DEFAULT_SIMULATION_ENGINE = "hist_gradient_boosting"
+
+HGB_MAX_ITER = 200
+HGB_EARLY_STOPPING_ROUNDS = 10
 
-def _prepare_xy(df: pd.DataFrame, target_column: str) -> tuple[pd.DataFrame, pd.Series]:
-    sample_df = df.copy()
-    if len(sample_df) > MAX_SIMULATION_ROWS:
-        sample_df = sample_df.sample(n=MAX_SIMULATION_ROWS, random_state=42)
+# "adaptive" trains on geometrically growing subsamples until the validation metric
+# moves by at most LEARNING_CURVE_TOLERANCE; "fixed" trains once on every sampled row.
+SIMULATION_SAMPLING_MODES = ("adaptive", "fixed")
+DEFAULT_SIMULATION_SAMPLING = "adaptive"
+LEARNING_CURVE_START_ROWS = 5_000
+LEARNING_CURVE_GROWTH = 2
+LEARNING_CURVE_TOLERANCE = 0.005
+DEFAULT_SIMULATION_TIME_BUDGET_SECONDS = 120.0
 
-    y = sample_df[target_column]
-    x = sample_df.drop(columns=[target_column], errors="ignore")
+# "holdout" scores on one 80/20 split; "cross_validation" scores forests out-of-bag and
+# every other model with k-fold cross-validation, reporting the spread across folds.
+SIMULATION_VALIDATION_MODES = ("holdout", "cross_validation")
+DEFAULT_SIMULATION_VALIDATION = "holdout"
+CV_FOLDS = 5
+DEFAULT_CV_JOBS = -1
 
-    numeric_cols = x.select_dtypes(include="number").columns.tolist()
-    for col in numeric_cols:
-        x[col] = x[col].fillna(x[col].median())
+# Train-side scores (for overfitting_gap) come from at most this many training rows.
+TRAIN_SCORE_MAX_ROWS = 20_000
 
-    categorical_cols = [col for col in x.columns if col not in numeric_cols]
-    for col in categorical_cols:
-        x[col] = x[col].astype("string").fillna("__MISSING__")
 
-    x = pd.get_dummies(x, columns=categorical_cols, drop_first=False)
+def _prepare_xy(
+    df: pd.DataFrame,
+    target_column: str,
+    encoded: EncodedFeatures,
+    engine: str,
+):
+    positions = np.arange(len(df))
+    if len(df) > MAX_SIMULATION_ROWS:
+        rng = np.random.default_rng(42)
+        positions = np.sort(rng.choice(len(df), size=MAX_SIMULATION_ROWS, replace=False))
+
+    y = df[target_column].iloc[positions]
+    if engine == "hist_gradient_boosting":
+        x = encoded.take_ordinal(positions)
+    else:
+        x = encoded.take(positions)
     return x, y
 
 
+def _hist_gradient_boosting(task_type: str, encoded: EncodedFeatures):
+    from sklearn.ensemble import HistGradientBoostingClassifier, HistGradientBoostingRegressor
+
+    params = {
+        "max_iter": HGB_MAX_ITER,
+        "early_stopping": True,
+        "validation_fraction": 0.1,
+        "n_iter_no_change": HGB_EARLY_STOPPING_ROUNDS,
+        # Shallower, smoother trees than the defaults keep the train/validation gap
+        # comparable to the forest engine's on small samples.
+        "max_leaf_nodes": 15,
+        "min_samples_leaf": 40,
+        "l2_regularization": 1.0,
+        "categorical_features": encoded.ordinal_categorical_mask,
+        "random_state": 42,
+    }
+    if task_type == "classification":
+        return HistGradientBoostingClassifier(class_weight="balanced", **params)
+    return HistGradientBoostingRegressor(**params)
+
+
+def _logistic_regression():
+    from sklearn.linear_model import LogisticRegression
+
+    return LogisticRegression(max_iter=500, n_jobs=None, class_weight="balanced")
+
+
+def _random_forest(task_type: str, oob_score: bool = False):
+    from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
+
+    if task_type == "classification":
+        return RandomForestClassifier(
+            n_estimators=150,
+            max_depth=8,
+            random_state=42,
+            n_jobs=-1,
+            class_weight="balanced_subsample",
+            oob_score=oob_score,
+        )
+    return RandomForestRegressor(
+        n_estimators=150,
+        max_depth=10,
+        random_state=42,
+        n_jobs=-1,
+        oob_score=oob_score,
+    )
+
+
+def _train_score_positions(y_train: np.ndarray, classification: bool) -> np.ndarray:
+    """Rows of the training split used for train-side scores, capped at ``TRAIN_SCORE_MAX_ROWS``."""
+    rows = len(y_train)
+    if rows <= TRAIN_SCORE_MAX_ROWS:
+        return np.arange(rows)
+    rng = np.random.default_rng(42)
+    positions = np.sort(rng.choice(rows, size=TRAIN_SCORE_MAX_ROWS, replace=False))
+    if classification and len(np.unique(y_train[positions])) < len(np.unique(y_train)):
+        return np.arange(rows)
+    return positions
+
+
+def _auc(y_true: np.ndarray, proba: np.ndarray, binary: bool) -> float:
+    from sklearn.metrics import roc_auc_score
+
+    if binary:
+        return float(roc_auc_score(y_true, proba[:, 1]))
+    return float(roc_auc_score(y_true, proba, multi_class="ovr"))
+
+
+def _classification_scores(y_true: np.ndarray, proba: np.ndarray, labels: np.ndarray, binary: bool) -> dict:
+    from sklearn.metrics import accuracy_score, precision_recall_fscore_support
+
+    pred = labels[proba.argmax(axis=1)]
+    precision, recall, _, _ = precision_recall_fscore_support(
+        y_true,
+        pred,
+        average="binary" if binary else "weighted",
+        zero_division=0,
+    )
+    return {
+        "validation_auc": round(_auc(y_true, proba, binary), 4),
+        "accuracy": round(float(accuracy_score(y_true, pred)), 4),
+        "precision": round(float(precision), 4),
+        "recall": round(float(recall), 4),
+    }
+
+
+def _regression_scores(y_true: np.ndarray, pred: np.ndarray) -> dict:
+    from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+
+    return {
+        "validation_r2": round(float(r2_score(y_true, pred)), 4),
+        "mae": round(float(mean_absolute_error(y_true, pred)), 4),
+        "rmse": round(float(np.sqrt(mean_squared_error(y_true, pred))), 4),
+    }
+
+
+def _train_auc(model, x_train, y_train, binary: bool) -> float:
+    positions = _train_score_positions(y_train, classification=True)
+    return round(_auc(y_train[positions], model.predict_proba(x_train[positions]), binary), 4)
+
+
+def _train_r2(model, x_train, y_train) -> float:
+    from sklearn.metrics import r2_score
+
+    positions = _train_score_positions(y_train, classification=False)
+    return round(float(r2_score(y_train[positions], model.predict(x_train[positions]))), 4)
+
+
+def _classifier_metrics(model, x_train, y_train, x_val, y_val, binary: bool) -> dict[str, float]:
+    return {
+        "train_auc": _train_auc(model, x_train, y_train, binary),
+        **_classification_scores(y_val, model.predict_proba(x_val), model.classes_, binary),
+    }
+
+
+def _regressor_metrics(model, x_train, y_train, x_val, y_val) -> dict[str, float]:
+    return {
+        "train_r2": _train_r2(model, x_train, y_train),
+        **_regression_scores(y_val, model.predict(x_val)),
+    }
+
+
+def _boosting_details(model) -> dict[str, Any]:
+    return {"iterations": int(model.n_iter_), "early_stopped": bool(model.n_iter_ < HGB_MAX_ITER)}
+
+
+def _fit_classifiers(engine: str, encoded: EncodedFeatures, x_train, y_train, x_val, y_val, binary: bool) -> dict:
+    if engine == "hist_gradient_boosting":
+        hgb = _hist_gradient_boosting("classification", encoded)
+        hgb.fit(x_train, y_train)
+        return {
+            "hist_gradient_boosting": {
+                **_classifier_metrics(hgb, x_train, y_train, x_val, y_val, binary),
+                **_boosting_details(hgb),
+            }
+        }
+
+    lr = _logistic_regression()
+    rf = _random_forest("classification")
+
+    lr.fit(x_train, y_train)
+    rf.fit(x_train, y_train)
+    return {
+        "logistic_regression": _classifier_metrics(lr, x_train, y_train, x_val, y_val, binary),
+        "random_forest": _classifier_metrics(rf, x_train, y_train, x_val, y_val, binary),
+    }
+
+
+def _fit_regressors(engine: str, encoded: EncodedFeatures, x_train, y_train, x_val, y_val) -> dict:
+    if engine == "hist_gradient_boosting":
+        model = _hist_gradient_boosting("regression", encoded)
+        model.fit(x_train, y_train)
+        return {
+            "hist_gradient_boosting_regressor": {
+                **_regressor_metrics(model, x_train, y_train, x_val, y_val),
+                **_boosting_details(model),
+            }
+        }
+
+    model = _random_forest("regression")
+    model.fit(x_train, y_train)
+    return {"random_forest_regressor": _regressor_metrics(model, x_train, y_train, x_val, y_val)}
+
+
+def _cv_folds(y: np.ndarray, classification: bool) -> list[tuple[np.ndarray, np.ndarray]]:
+    from sklearn.model_selection import KFold, StratifiedKFold
+
+    splitter_cls = StratifiedKFold if classification else KFold
+    splitter = splitter_cls(n_splits=CV_FOLDS, shuffle=True, random_state=42)
+    return list(splitter.split(np.zeros(len(y)), y))
+
+
+def _fold_metrics(estimator, x, y, train_idx, val_idx, classification: bool, binary: bool) -> dict:
+    from sklearn.base import clone
+
+    model = clone(estimator).fit(x[train_idx], y[train_idx])
+    if classification:
+        metrics = _classifier_metrics(model, x[train_idx], y[train_idx], x[val_idx], y[val_idx], binary)
+    else:
+        metrics = _regressor_metrics(model, x[train_idx], y[train_idx], x[val_idx], y[val_idx])
+    if hasattr(model, "n_trees_per_iteration_"):
+        metrics.update(_boosting_details(model))
+    return metrics
+
+
+def _summarize_folds(fold_metrics: list[dict], score_key: str) -> dict[str, Any]:
+    """Mean of every per-fold metric, plus the standard deviation of ``score_key``."""
+    summary: dict[str, Any] = {}
+    for key in fold_metrics[0]:
+        values = [metrics[key] for metrics in fold_metrics]
+        if isinstance(values[0], bool):
+            summary[key] = all(values)
+        elif isinstance(values[0], int):
+            summary[key] = int(round(np.mean(values)))
+        else:
+            summary[key] = round(float(np.mean(values)), 4)
+    summary[f"{score_key}_std"] = round(float(np.std([metrics[score_key] for metrics in fold_metrics])), 4)
+    summary["validation"] = f"{len(fold_metrics)}_fold_cv"
+    return summary
+
+
+def _cross_validate(estimator, x, y, folds, classification: bool, binary: bool, cv_jobs: int) -> dict[str, Any]:
+    from joblib import Parallel, delayed
+
+    score_key = "validation_auc" if classification else "validation_r2"
+    fold_metrics = Parallel(n_jobs=cv_jobs)(
+        delayed(_fold_metrics)(estimator, x, y, train_idx, val_idx, classification, binary)
+        for train_idx, val_idx in folds
+    )
+    return _summarize_folds(fold_metrics, score_key)
+
+
+def _out_of_bag(forest, x, y, folds, classification: bool, binary: bool) -> dict[str, Any]:
+    """Fit a forest on every row and score it on its out-of-bag predictions.
+
+    The spread is taken over the same folds the other models are cross-validated
+    on, applied to the out-of-bag predictions; rows that were never out of bag
+    are left out.
+    """
+    forest.fit(x, y)
+    if classification:
+        oob = forest.oob_decision_function_
+        covered = np.isfinite(oob).all(axis=1)
+        score_key = "validation_auc"
+        train = {"train_auc": _train_auc(forest, x, y, binary)}
+
+        def scores(idx):
+            return _classification_scores(y[idx], oob[idx], forest.classes_, binary)
+
+    else:
+        oob = forest.oob_prediction_
+        covered = np.isfinite(oob)
+        score_key = "validation_r2"
+        train = {"train_r2": _train_r2(forest, x, y)}
+
+        def scores(idx):
+            return _regression_scores(y[idx], oob[idx])
+
+    overall = scores(np.flatnonzero(covered))
+    per_fold = [scores(idx)[score_key] for idx in (val_idx[covered[val_idx]] for _, val_idx in folds) if len(idx)]
+    return {
+        **train,
+        **overall,
+        f"{score_key}_std": round(float(np.std(per_fold)), 4) if per_fold else 0.0,
+        "validation": "out_of_bag",
+    }
+
+
+def _validate_models(engine: str, encoded: EncodedFeatures, x, y, task_type: str, binary: bool, cv_jobs: int) -> dict:
+    classification = task_type == "classification"
+    folds = _cv_folds(y, classification)
+    if engine == "hist_gradient_boosting":
+        name = "hist_gradient_boosting" if classification else "hist_gradient_boosting_regressor"
+        estimator = _hist_gradient_boosting(task_type, encoded)
+        return {name: _cross_validate(estimator, x, y, folds, classification, binary, cv_jobs)}
+
+    forest = _random_forest(task_type, oob_score=True)
+    if not classification:
+        return {"random_forest_regressor": _out_of_bag(forest, x, y, folds, classification, binary)}
+    return {
+        "logistic_regression": _cross_validate(_logistic_regression(), x, y, folds, classification, binary, cv_jobs),
+        "random_forest": _out_of_bag(forest, x, y, folds, classification, binary),
+    }
+
+
+def _train_sizes(rows: int, sampling: str) -> list[int]:
+    if sampling != "adaptive":
+        return [rows]
+    sizes = []
+    size = LEARNING_CURVE_START_ROWS
+    while size < rows:
+        sizes.append(size)
+        size *= LEARNING_CURVE_GROWTH
+    return sizes + [rows]
+
+
+def _learning_curve(fit, x_train, y_train, score_key: str, sampling: str, time_budget: float, classes: int = 0):
+    """Fit on growing prefixes of the (already shuffled) training split.
+
+    Stops once two consecutive points differ by at most the tolerance, or when the
+    next, roughly twice as long, fit would overrun ``time_budget`` seconds. Returns
+    the last fit's models, the curve points and why it stopped.
+    """
+    started = time.perf_counter()
+    sizes = _train_sizes(len(y_train), sampling)
+    models: dict = {}
+    points: list[dict[str, Any]] = []
+    stopped = "all_rows"
+    for idx, size in enumerate(sizes):
+        y_part = y_train[:size]
+        if classes and len(np.unique(y_part)) < classes and size < sizes[-1]:
+            continue
+        fit_started = time.perf_counter()
+        models = fit(x_train[:size], y_part)
+        fit_seconds = time.perf_counter() - fit_started
+        best = max(models.values(), key=lambda metrics: metrics[score_key])
+        points.append(
+            {
+                "train_rows": int(size),
+                "validation_score": best[score_key],
+                "seconds": round(fit_seconds, 4),
+            }
+        )
+        if idx == len(sizes) - 1:
+            break
+        if len(points) >= 2 and abs(points[-1]["validation_score"] - points[-2]["validation_score"]) <= (
+            LEARNING_CURVE_TOLERANCE
+        ):
+            stopped = "converged"
+            break
+        elapsed = time.perf_counter() - started
+        if elapsed + LEARNING_CURVE_GROWTH * fit_seconds > time_budget:
+            stopped = "time_budget"
+            break
+
+    gains = [later["validation_score"] - earlier["validation_score"] for earlier, later in zip(points, points[1:])]
+    curve = {
+        "mode": sampling,
+        "tolerance": LEARNING_CURVE_TOLERANCE,
+        "time_budget_seconds": time_budget,
+        "stopped": stopped,
+        "points": points,
+        # Still gaining more than the tolerance at the last step: more data would likely help.
+        "still_improving": bool(gains) and gains[-1] > LEARNING_CURVE_TOLERANCE,
+    }
+    return models, curve
+
+
+def _holdout_split(x, y, stratify=None):
+    from sklearn.model_selection import train_test_split
+
+    return train_test_split(x, y, test_size=0.2, random_state=42, stratify=stratify)
+
+
 def run_model_simulation(
     df: pd.DataFrame,
     target_column: str | None,
     task_type: str,
+    profile: DatasetProfile | None = None,
+    encoded_features: EncodedFeatures | None = None,
+    simulation_engine: str = DEFAULT_SIMULATION_ENGINE,
+    simulation_sampling: str = DEFAULT_SIMULATION_SAMPLING,
+    simulation_time_budget: float = DEFAULT_SIMULATION_TIME_BUDGET_SECONDS,
+    simulation_validation: str = DEFAULT_SIMULATION_VALIDATION,
+    simulation_cv_jobs: int = DEFAULT_CV_JOBS,
 ) -> dict[str, Any]:
+    """Fit quick baseline models to estimate learnability and overfitting risk.
+
+    ``simulation_engine`` picks the models (see ``SIMULATION_ENGINES``); either way
+    the result has the same ``models`` / ``baseline_score`` / ``overfitting_gap``
+    shape, with the engine recorded under ``engine``. With the default "holdout"
+    ``simulation_validation``, ``simulation_sampling`` decides how much of the
+    sample is trained on and the resulting points are reported under
+    ``learning_curve``. "cross_validation" instead scores forests out-of-bag and
+    the other models over ``CV_FOLDS`` folds (run on ``simulation_cv_jobs``
+    joblib workers), adding the spread as ``baseline_score_std``; classification
+    targets with a class smaller than ``CV_FOLDS`` fall back to holdout.
+    """
     try:
-        from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
-        from sklearn.linear_model import LogisticRegression
-        from sklearn.metrics import (
-            accuracy_score,
-            mean_absolute_error,
-            mean_squared_error,
-            precision_recall_fscore_support,
-            r2_score,
-            roc_auc_score,
-        )
-        from sklearn.model_selection import train_test_split
         from sklearn.preprocessing import LabelEncoder
     except Exception as exc:
         return {"skipped": True, "reason": f"sklearn_unavailable: {exc}"}
@@ -56,12 +428,20 @@ def run_model_simulation(
         return {"skipped": True, "reason": "target_column_not_found"}
     if task_type not in {"classification", "regression"}:
         return {"skipped": True, "reason": "unsupported_task_type"}
+    if simulation_engine not in SIMULATION_ENGINES:
+        simulation_engine = DEFAULT_SIMULATION_ENGINE
+    if simulation_validation not in SIMULATION_VALIDATION_MODES:
+        simulation_validation = DEFAULT_SIMULATION_VALIDATION
 
-    x, y = _prepare_xy(df, target_column)
+    encoded = encoded_features or encode_features(df, target_column, profile)
+    if encoded is None or encoded.empty:
+        return {"skipped": True, "reason": "insufficient_rows_after_cleanup"}
+
+    x, y = _prepare_xy(df, target_column, encoded, simulation_engine)
     mask = ~y.isna()
-    x = x.loc[mask]
+    x = x[mask.to_numpy()]
     y = y.loc[mask]
-    if len(x) < 100 or x.empty:
+    if x.shape[0] < 100 or x.shape[1] == 0:
         return {"skipped": True, "reason": "insufficient_rows_after_cleanup"}
 
     if task_type == "classification":
@@ -70,78 +450,33 @@ def run_model_simulation(
             return {"skipped": True, "reason": "target_has_single_class"}
         le = LabelEncoder()
         y_encoded = le.fit_transform(y_text)
-        stratify = y_encoded if len(np.unique(y_encoded)) > 1 else None
-        x_train, x_val, y_train, y_val = train_test_split(
-            x,
-            y_encoded,
-            test_size=0.2,
-            random_state=42,
-            stratify=stratify,
-        )
+        binary = len(le.classes_) == 2
 
-        lr = LogisticRegression(max_iter=500, n_jobs=None, class_weight="balanced")
-        rf = RandomForestClassifier(
-            n_estimators=150,
-            max_depth=8,
-            random_state=42,
-            n_jobs=-1,
-            class_weight="balanced_subsample",
-        )
+        if simulation_validation == "cross_validation" and np.bincount(y_encoded).min() >= CV_FOLDS:
+            models = _validate_models(
+                simulation_engine, encoded, x, y_encoded, task_type, binary, simulation_cv_jobs
+            )
+            curve = None
+            train_rows_used = int(x.shape[0])
+            validation = {"mode": "cross_validation", "folds": CV_FOLDS}
+        else:
+            stratify = y_encoded if len(np.unique(y_encoded)) > 1 else None
+            x_train, x_val, y_train, y_val = _holdout_split(x, y_encoded, stratify)
 
-        lr.fit(x_train, y_train)
-        rf.fit(x_train, y_train)
-
-        lr_pred = lr.predict(x_val)
-        rf_pred = rf.predict(x_val)
-        lr_train_pred = lr.predict(x_train)
-        rf_train_pred = rf.predict(x_train)
-
-        lr_proba = lr.predict_proba(x_val)
-        rf_proba = rf.predict_proba(x_val)
-        lr_train_proba = lr.predict_proba(x_train)
-        rf_train_proba = rf.predict_proba(x_train)
-
-        average = "binary" if len(le.classes_) == 2 else "weighted"
-        lr_precision, lr_recall, _, _ = precision_recall_fscore_support(
-            y_val,
-            lr_pred,
-            average=average,
-            zero_division=0,
-        )
-        rf_precision, rf_recall, _, _ = precision_recall_fscore_support(
-            y_val,
-            rf_pred,
-            average=average,
-            zero_division=0,
-        )
+            def fit(x_part, y_part):
+                return _fit_classifiers(simulation_engine, encoded, x_part, y_part, x_val, y_val, binary)
 
-        if len(le.classes_) == 2:
-            lr_auc_val = roc_auc_score(y_val, lr_proba[:, 1])
-            rf_auc_val = roc_auc_score(y_val, rf_proba[:, 1])
-            lr_auc_train = roc_auc_score(y_train, lr_train_proba[:, 1])
-            rf_auc_train = roc_auc_score(y_train, rf_train_proba[:, 1])
-        else:
-            lr_auc_val = roc_auc_score(y_val, lr_proba, multi_class="ovr")
-            rf_auc_val = roc_auc_score(y_val, rf_proba, multi_class="ovr")
-            lr_auc_train = roc_auc_score(y_train, lr_train_proba, multi_class="ovr")
-            rf_auc_train = roc_auc_score(y_train, rf_train_proba, multi_class="ovr")
-
-        models = {
-            "logistic_regression": {
-                "train_auc": round(float(lr_auc_train), 4),
-                "validation_auc": round(float(lr_auc_val), 4),
-                "accuracy": round(float(accuracy_score(y_val, lr_pred)), 4),
-                "precision": round(float(lr_precision), 4),
-                "recall": round(float(lr_recall), 4),
-            },
-            "random_forest": {
-                "train_auc": round(float(rf_auc_train), 4),
-                "validation_auc": round(float(rf_auc_val), 4),
-                "accuracy": round(float(accuracy_score(y_val, rf_pred)), 4),
-                "precision": round(float(rf_precision), 4),
-                "recall": round(float(rf_recall), 4),
-            },
-        }
+            models, curve = _learning_curve(
+                fit,
+                x_train,
+                y_train,
+                "validation_auc",
+                simulation_sampling,
+                simulation_time_budget,
+                classes=len(le.classes_),
+            )
+            train_rows_used = curve["points"][-1]["train_rows"]
+            validation = {"mode": "holdout", "validation_fraction": 0.2}
 
         best_model_name = max(
             models.keys(),
@@ -153,11 +488,16 @@ def run_model_simulation(
 
         return {
             "task_type": "classification",
-            "sample_size": int(len(x)),
+            "engine": simulation_engine,
+            "validation": validation,
+            "sample_size": int(x.shape[0]),
+            "train_rows_used": train_rows_used,
             "models": models,
             "best_model": best_model_name,
+            "learning_curve": curve,
             "baseline_metric": "roc_auc",
             "baseline_score": round(float(learnability_score), 4),
+            "baseline_score_std": best.get("validation_auc_std"),
             "overfitting_gap": round(float(overfit_gap), 4),
             "high_overfitting_risk": overfit_gap >= 0.12,
             "weak_learnability": learnability_score < 0.6,
@@ -165,45 +505,45 @@ def run_model_simulation(
 
     y_num = pd.to_numeric(y, errors="coerce")
     valid = ~y_num.isna()
-    x = x.loc[valid]
+    x = x[valid.to_numpy()]
     y_num = y_num.loc[valid]
-    if len(x) < 100:
+    if x.shape[0] < 100:
         return {"skipped": True, "reason": "insufficient_numeric_target_rows"}
+    y_values = y_num.to_numpy(dtype=np.float64)
 
-    x_train, x_val, y_train, y_val = train_test_split(
-        x,
-        y_num,
-        test_size=0.2,
-        random_state=42,
-    )
+    if simulation_validation == "cross_validation":
+        models = _validate_models(simulation_engine, encoded, x, y_values, task_type, False, simulation_cv_jobs)
+        curve = None
+        train_rows_used = int(x.shape[0])
+        validation = {"mode": "cross_validation", "folds": CV_FOLDS}
+    else:
+        x_train, x_val, y_train, y_val = _holdout_split(x, y_values)
 
-    rf = RandomForestRegressor(
-        n_estimators=150,
-        max_depth=10,
-        random_state=42,
-        n_jobs=-1,
-    )
-    rf.fit(x_train, y_train)
-    val_pred = rf.predict(x_val)
-    train_pred = rf.predict(x_train)
+        def fit(x_part, y_part):
+            return _fit_regressors(simulation_engine, encoded, x_part, y_part, x_val, y_val)
+
+        models, curve = _learning_curve(
+            fit, x_train, y_train, "validation_r2", simulation_sampling, simulation_time_budget
+        )
+        train_rows_used = curve["points"][-1]["train_rows"]
+        validation = {"mode": "holdout", "validation_fraction": 0.2}
 
-    val_r2 = r2_score(y_val, val_pred)
-    train_r2 = r2_score(y_train, train_pred)
+    model_name, metrics = next(iter(models.items()))
+    val_r2 = metrics["validation_r2"]
+    train_r2 = metrics["train_r2"]
 
     return {
         "task_type": "regression",
-        "sample_size": int(len(x)),
-        "models": {
-            "random_forest_regressor": {
-                "train_r2": round(float(train_r2), 4),
-                "validation_r2": round(float(val_r2), 4),
-                "mae": round(float(mean_absolute_error(y_val, val_pred)), 4),
-                "rmse": round(float(mean_squared_error(y_val, val_pred, squared=False)), 4),
-            }
-        },
-        "best_model": "random_forest_regressor",
+        "engine": simulation_engine,
+        "validation": validation,
+        "sample_size": int(x.shape[0]),
+        "train_rows_used": train_rows_used,
+        "models": models,
+        "best_model": model_name,
+        "learning_curve": curve,
         "baseline_metric": "r2",
         "baseline_score": round(float(val_r2), 4),
+        "baseline_score_std": metrics.get("validation_r2_std"),
         "overfitting_gap": round(float(train_r2 - val_r2), 4),
         "high_overfitting_risk": (train_r2 - val_r2) >= 0.2,
         "weak_learnability": val_r2 < 0.2,
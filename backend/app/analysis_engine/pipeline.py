@@ -1,4 +1,6 @@
 import logging
+import time
+import tracemalloc
 
 from app.analysis_engine.data_loader import load_dataframe
 from app.analysis_engine.analyzers.basic_stats import BasicStatsAnalyzer
@@ -9,19 +11,165 @@ from app.analysis_engine.analyzers.outliers import OutlierAnalyzer
 from app.analysis_engine.analyzers.categorical import CategoricalAnalyzer
 from app.analysis_engine.summary import build_summary
 from app.analysis_engine.profile import build_dataset_profile
+from app.analysis_engine.feature_encoding import encode_features
 from app.analysis_engine.target_diagnostics import run_target_diagnostics
-from app.analysis_engine.model_simulation import run_model_simulation
+from app.analysis_engine.model_simulation import (
+    DEFAULT_SIMULATION_ENGINE,
+    DEFAULT_SIMULATION_SAMPLING,
+    DEFAULT_SIMULATION_TIME_BUDGET_SECONDS,
+    DEFAULT_SIMULATION_VALIDATION,
+    DEFAULT_CV_JOBS,
+    run_model_simulation,
+)
+from app.analysis_engine.isolation import (
+    ResourceLimitExceeded,
+    ResourceLimits,
+    resource_limit_result,
+    run_isolated,
+)
+from app.analysis_engine.plot_data import build_plot_data
 from app.analysis_engine.structural_risk import run_structural_risk_analysis
 from app.analysis_engine.recommendations import build_recommendations
 from app.analysis_engine.scoring_v2 import compute_score_v2
+from app.analysis_engine.stages import Stage, run_stage_graph
+from app.analysis_engine.instrumentation import StageTimer, log_stage_metrics, process_peak_rss_mb
+from app.analysis_engine.streaming import DEFAULT_CHUNK_ROWS, DEFAULT_SAMPLE_ROWS, scan_csv_in_chunks
+from app.analysis_engine.sketches import DEFAULT_DISTINCT_EXACT_MAX_ROWS, DEFAULT_DISTINCT_RELATIVE_ERROR
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever report contents change so cached reports for identical uploads are not reused.
+ENGINE_VERSION = "2.15.4"
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_STAGE_TIMEOUT_SECONDS = 600.0
+
+ANALYZERS = [
+    BasicStatsAnalyzer(),
+    MissingAnalyzer(),
+    ImbalanceAnalyzer(),
+    LeakageAnalyzer(),
+    OutlierAnalyzer(),
+    CategoricalAnalyzer(),
+]
+
+# Report sections produced by the DAG, in report order.
+V2_SECTIONS = ("target_diagnostics", "model_simulation", "structural_risk")
+ANALYSIS_SECTIONS = tuple(analyzer.name for analyzer in ANALYZERS) + V2_SECTIONS
+
+
+def _task_type(target_diagnostics: dict) -> str:
+    return target_diagnostics.get("task_type", "unknown")
+
+
+def _recommendations(**sections) -> dict:
+    return build_recommendations(sections)
+
+
+def _scores(**sections) -> tuple[int, dict]:
+    return compute_score_v2(sections)
+
+
+def _model_simulation(
+    df,
+    target_column,
+    task_type,
+    profile,
+    encoded_features=None,
+    isolation: ResourceLimits | None = None,
+    **options,
+) -> dict:
+    if isolation is None or encoded_features is None:
+        return run_model_simulation(df, target_column, task_type, profile, encoded_features, **options)
+    # The encoded matrix carries every feature; the worker only needs the target column.
+    kwargs = {
+        "df": df[[target_column]],
+        "target_column": target_column,
+        "task_type": task_type,
+        "encoded_features": encoded_features,
+        **options,
+    }
+    try:
+        return run_isolated(run_model_simulation, kwargs, isolation)
+    except ResourceLimitExceeded as exc:
+        return resource_limit_result(exc)
+
+
+def _row_index(profile):
+    return profile.row_index
+
+
+def _column_types(profile) -> dict[str, str]:
+    return profile.datetime_formats()
+
+
+# Every stage declares its inputs; the scheduler derives order and parallelism from them.
+PIPELINE_STAGES = [
+    *[
+        Stage(analyzer.name, analyzer.run, requires=("df", "profile", "target_column"))
+        for analyzer in ANALYZERS
+    ],
+    # One hash pass shared by basic_stats (duplicate count) and structural_risk.
+    Stage("row_index", _row_index, requires=("profile",)),
+    # Datetime formats detected (and columns parsed) once, cached on the profile.
+    Stage("column_types", _column_types, requires=("profile",)),
+    Stage("encoded_features", encode_features, requires=("df", "target_column", "profile")),
+    Stage(
+        "target_diagnostics",
+        run_target_diagnostics,
+        requires=("df", "target_column", "profile"),
+        uses=("encoded_features", "signal_engine", "isolation"),
+    ),
+    Stage("task_type", _task_type, requires=("target_diagnostics",)),
+    Stage(
+        "model_simulation",
+        _model_simulation,
+        requires=("df", "target_column", "task_type", "profile"),
+        uses=(
+            "encoded_features",
+            "simulation_engine",
+            "simulation_sampling",
+            "simulation_time_budget",
+            "simulation_validation",
+            "simulation_cv_jobs",
+            "isolation",
+        ),
+        heavy=True,
+    ),
+    Stage(
+        "structural_risk",
+        run_structural_risk_analysis,
+        requires=("df", "target_column", "profile"),
+        uses=("row_index", "column_types"),
+    ),
+    # Plot-ready aggregates, so plots never re-read the uploaded file.
+    Stage("plot_data", build_plot_data, requires=("df", "target_column", "profile"), uses=("outliers",)),
+    Stage("recommendations", _recommendations, uses=ANALYSIS_SECTIONS),
+    Stage("scores", _scores, uses=ANALYSIS_SECTIONS),
+]
+
 
 def run_pipeline(
 
     file_path: str,
-    target_column: str | None = None
+    target_column: str | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    stage_timeout: float = DEFAULT_STAGE_TIMEOUT_SECONDS,
+    heavy_executor: str = "thread",
+    only_stages: set[str] | None = None,
+    trace_memory: bool = False,
+    chunked: bool = False,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    sample_rows: int = DEFAULT_SAMPLE_ROWS,
+    distinct_exact_max_rows: int | None = DEFAULT_DISTINCT_EXACT_MAX_ROWS,
+    distinct_error: float = DEFAULT_DISTINCT_RELATIVE_ERROR,
+    signal_engine: str = "auto",
+    simulation_engine: str = DEFAULT_SIMULATION_ENGINE,
+    simulation_sampling: str = DEFAULT_SIMULATION_SAMPLING,
+    simulation_time_budget: float = DEFAULT_SIMULATION_TIME_BUDGET_SECONDS,
+    simulation_validation: str = DEFAULT_SIMULATION_VALIDATION,
+    simulation_cv_jobs: int = DEFAULT_CV_JOBS,
+    isolation: ResourceLimits | None = None,
 
 ):
 
@@ -30,24 +178,142 @@ def run_pipeline(
 
     Responsible for:
 
-    - loading dataframe
-    - executing analyzers
+    - loading dataframe (or, with ``chunked``, streaming the file in ``chunk_rows``
+      chunks: chunk-capable analyzers see every row, the remaining stages a
+      ``sample_rows`` uniform sample)
+    - distinct counts: exact up to ``distinct_exact_max_rows`` rows, HyperLogLog
+      estimates (``distinct_error`` relative error) beyond
+    - target signal via ``signal_engine`` ("knn", "histogram" or "auto")
+    - baseline models via ``simulation_engine`` ("hist_gradient_boosting" or "forest"),
+      trained on a learning curve (``simulation_sampling="adaptive"``, bounded by
+      ``simulation_time_budget`` seconds) or once on the whole sample ("fixed"),
+      scored on a holdout split or, with ``simulation_validation="cross_validation"``,
+      out-of-bag / k-fold on ``simulation_cv_jobs`` workers
+    - with ``isolation``, model simulation and mutual information run in a separate
+      worker process under its CPU/memory/wall-time limits (wall time capped at
+      ``stage_timeout``); a stage that passes a
+      limit reports ``reason="resource_limit_exceeded"`` instead of failing
+    - executing the analysis stage DAG (concurrently, with per-stage timeouts;
+      ``heavy_executor="process"`` kills a heavy stage's process when it times out)
     - aggregating report
     - graceful failure handling
+    - per-stage timing/memory under report["performance"]
     """
 
-    report = {}
+    report = {"engine_version": ENGINE_VERSION}
+    started = time.perf_counter()
+    if isolation is not None and (isolation.wall_seconds is None or isolation.wall_seconds > stage_timeout):
+        # An isolated worker must not outlive the stage that is waiting for it.
+        isolation = ResourceLimits(isolation.cpu_count, isolation.memory_mb, stage_timeout)
+    owns_tracing = trace_memory and not tracemalloc.is_tracing()
+    if owns_tracing:
+        tracemalloc.start()
+
+    try:
+        report, score_v2 = _analyze(
+            report,
+            file_path,
+            target_column,
+            max_workers,
+            stage_timeout,
+            heavy_executor,
+            only_stages,
+            chunked,
+            chunk_rows,
+            sample_rows,
+            distinct_exact_max_rows,
+            distinct_error,
+            signal_engine,
+            simulation_engine,
+            simulation_sampling,
+            simulation_time_budget,
+            simulation_validation,
+            simulation_cv_jobs,
+            isolation,
+            # Resetting the traced peak is only safe when nothing else allocates alongside.
+            owns_tracing and max_workers <= 1,
+        )
+    finally:
+        if owns_tracing:
+            tracemalloc.stop()
+
+    report["performance"]["total_seconds"] = round(time.perf_counter() - started, 4)
+    # Lifetime high-water mark of the worker process, so reported once per run, not per stage.
+    peak_rss = process_peak_rss_mb()
+    report["performance"]["process_peak_rss_mb"] = None if peak_rss is None else round(peak_rss, 1)
+    logger.info(
+        "pipeline file=%s total=%ss slowest_stage=%s",
+        file_path,
+        report["performance"]["total_seconds"],
+        report["performance"]["slowest_stage"],
+    )
+    return report, score_v2
 
-    failed_analyzers = []
-   
 
+def _analyze(
+    report: dict,
+    file_path: str,
+    target_column: str | None,
+    max_workers: int,
+    stage_timeout: float,
+    heavy_executor: str,
+    only_stages: set[str] | None,
+    chunked: bool,
+    chunk_rows: int,
+    sample_rows: int,
+    distinct_exact_max_rows: int | None,
+    distinct_error: float,
+    signal_engine: str,
+    simulation_engine: str,
+    simulation_sampling: str,
+    simulation_time_budget: float,
+    simulation_validation: str,
+    simulation_cv_jobs: int,
+    isolation: ResourceLimits | None,
+    measure_peak: bool,
+):
+    stage_metrics: dict[str, dict] = {}
+    streamed: dict = {}
+    streamed_failed: list[str] = []
+    report["analysis_mode"] = {"mode": "in_memory"}
 
     # Load Dataset
 
     try:
 
-        df, ingestion_warnings = load_dataframe(file_path)
-        profile = build_dataset_profile(df)
+        if chunked:
+            timer = StageTimer(measure_peak).start()
+            scan = scan_csv_in_chunks(
+                file_path,
+                ANALYZERS,
+                target_column,
+                chunk_rows=chunk_rows,
+                sample_rows=sample_rows,
+                distinct_exact_max_rows=distinct_exact_max_rows,
+                distinct_error=distinct_error,
+            )
+            stage_metrics["chunked_scan"] = timer.stop()
+            log_stage_metrics("chunked_scan", stage_metrics["chunked_scan"])
+
+            df, profile, ingestion_warnings = scan.sample, scan.profile, scan.warnings
+            streamed, streamed_failed = scan.outputs, scan.failed
+            report["analysis_mode"] = {
+                "mode": "chunked",
+                "chunk_rows": chunk_rows,
+                "chunks": scan.chunks,
+                "sample_rows": len(df),
+                "streamed_sections": sorted([*streamed, *streamed_failed]),
+            }
+        else:
+            timer = StageTimer(measure_peak).start()
+            df, ingestion_warnings = load_dataframe(file_path)
+            stage_metrics["load"] = timer.stop()
+
+            timer = StageTimer(measure_peak).start()
+            profile = build_dataset_profile(df, distinct_exact_max_rows, distinct_error)
+            stage_metrics["profile"] = timer.stop()
+            for name in ("load", "profile"):
+                log_stage_metrics(name, stage_metrics[name])
 
     except Exception as e:
 
@@ -60,72 +326,86 @@ def run_pipeline(
         raise RuntimeError(str(e))
 
 
-    analyzers = [
-
-        
-        BasicStatsAnalyzer(),
-        MissingAnalyzer(),
-        ImbalanceAnalyzer(),    
-        LeakageAnalyzer(),    
-        OutlierAnalyzer(),
-        CategoricalAnalyzer(),
-
-    ]
-
-
-    # Execute analyzers
-
-    for analyzer in analyzers:
-
-        try:
-
-            result = analyzer.run(
-
-                df,
-                profile,
-                target_column
-
-            )
-
-            report[analyzer.name] = result
-
-        except Exception:
-
-            logger.exception(
-
-                f"{analyzer.name} failed"
-
-            )
-
-            failed_analyzers.append(
-
-                analyzer.name
-
-            )
+    # Execute the stage DAG
+
+    # Sections already produced by the chunked scan are handed to the DAG as inputs.
+    settled = set(streamed) | set(streamed_failed)
+    run = run_stage_graph(
+        [stage for stage in PIPELINE_STAGES if stage.name not in settled],
+        {
+            "df": df,
+            "profile": profile,
+            "target_column": target_column,
+            "signal_engine": signal_engine,
+            "simulation_engine": simulation_engine,
+            "simulation_sampling": simulation_sampling,
+            "simulation_time_budget": simulation_time_budget,
+            "simulation_validation": simulation_validation,
+            "simulation_cv_jobs": simulation_cv_jobs,
+            "isolation": isolation,
+            **streamed,
+        },
+        only=only_stages,
+        max_workers=max_workers,
+        stage_timeout=stage_timeout,
+        heavy_executor=heavy_executor,
+        measure_peak=measure_peak,
+    )
+    outputs = {**streamed, **run.outputs}
+    stage_metrics.update(run.metrics)
+    report["performance"] = {
+        "max_workers": max_workers,
+        "heavy_executor": heavy_executor,
+        "stages": stage_metrics,
+        "slowest_stage": max(stage_metrics, key=lambda name: stage_metrics[name].get("wall_seconds") or 0),
+    }
 
+    for analyzer in ANALYZERS:
+        if analyzer.name in outputs:
+            report[analyzer.name] = outputs[analyzer.name]
 
-    report["failed_analyzers"] = failed_analyzers
+    failed = streamed_failed + run.failed
+    analyzer_names = {analyzer.name for analyzer in ANALYZERS}
+    report["failed_analyzers"] = [name for name in failed if name in analyzer_names]
+    # Internal stages (row_index, encoded_features, plot_data, ...) and V2 sections.
+    report["failed_stages"] = [name for name in failed if name not in analyzer_names]
     report["ingestion"] = {
         "warnings": ingestion_warnings,
     }
 
-
-    # V2 - target aware diagnostics
-    target_diagnostics = run_target_diagnostics(df, target_column)
-    report["target_diagnostics"] = target_diagnostics
-
-    # V2 - modeling risk simulation
-    task_type = target_diagnostics.get("task_type", "unknown")
-    report["model_simulation"] = run_model_simulation(df, target_column, task_type)
-
-    # V2 - structural risk
-    report["structural_risk"] = run_structural_risk_analysis(df, target_column)
+    encoded = outputs.get("encoded_features")
+    if encoded is not None:
+        # At least the encoded arrays themselves; more when the stage grew RSS further.
+        output_mb = encoded.metadata["matrix_memory_mb"] + encoded.metadata["category_codes_memory_mb"]
+        rss_delta_mb = stage_metrics.get("encoded_features", {}).get("rss_delta_mb") or 0.0
+        report["feature_encoding"] = {
+            **encoded.metadata,
+            "peak_memory_mb": round(max(output_mb, rss_delta_mb), 3),
+        }
+
+    if "plot_data" in outputs:
+        report["plot_data"] = outputs["plot_data"]
+
+
+    # V2 - target aware diagnostics, modeling risk simulation, structural risk
+    for name in V2_SECTIONS:
+        if name in outputs:
+            report[name] = outputs[name]
+        elif name in run.skipped:
+            report[name] = {"skipped": True, "reason": run.skipped[name]}
+        elif name in run.failed:
+            reason = "stage_timeout" if name in run.timed_out else "stage_failed"
+            report[name] = {"skipped": True, "reason": reason}
+
+    if only_stages is not None and "scores" not in outputs:
+        # Partial runs return just the requested sections (and their dependencies).
+        return report, None
 
     # V2 - recommendations
-    report["recommendations"] = build_recommendations(report)
+    report["recommendations"] = outputs.get("recommendations", {})
 
     # V2-only scoring.
-    score_v2, score_v2_meta = compute_score_v2(report)
+    score_v2, score_v2_meta = outputs["scores"]
     report["scores"] = {
         "v2": score_v2,
         "v2_meta": score_v2_meta,
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from .profile import DatasetProfile, build_dataset_profile
+
+MISSING_TOP_COLUMNS = 15
+MISSING_MASK_ROWS = 500
+TARGET_TOP_VALUES = 20
+HISTOGRAM_COLUMNS = 20
+HISTOGRAM_BINS = 30
+CORRELATION_TOP_COLUMNS = 20
+# Correlations (and reports predating plot_data) use at most this many rows.
+PLOT_SAMPLE_ROWS = 120_000
+
+
+def _finite_or_none(values) -> list[float | None]:
+    return [round(float(value), 4) if np.isfinite(value) else None for value in values]
+
+
+def _missing(profile: DatasetProfile) -> dict[str, Any]:
+    ratios = (profile.null_counts / profile.rows) if profile.rows else profile.null_counts.astype(float)
+    columns = ratios.sort_values(ascending=False, kind="stable").head(MISSING_TOP_COLUMNS).index.tolist()
+    mask = profile.null_mask[columns].head(MISSING_MASK_ROWS).to_numpy()
+    return {
+        "columns": columns,
+        "missing_ratio": {col: round(float(ratios[col]), 4) for col in columns},
+        "mask_rows": int(mask.shape[0]),
+        # Null positions within the first ``mask_rows`` rows, per column.
+        "null_rows": {col: np.flatnonzero(mask[:, idx]).tolist() for idx, col in enumerate(columns)},
+    }
+
+
+def _target_counts(df: pd.DataFrame, target_column: str | None) -> dict[str, Any] | None:
+    if not target_column or target_column not in df.columns:
+        return None
+    counts = df[target_column].astype("string").value_counts(dropna=False).head(TARGET_TOP_VALUES)
+    return {
+        "column": target_column,
+        "labels": [None if pd.isna(label) else str(label) for label in counts.index],
+        "counts": [int(count) for count in counts.to_numpy()],
+    }
+
+
+def _histograms(df: pd.DataFrame, profile: DatasetProfile, outliers: dict | None) -> list[dict[str, Any]]:
+    summaries = (outliers or {}).get("quantile_summaries") or {}
+    histograms = []
+    for col in profile.numeric_columns[:HISTOGRAM_COLUMNS]:
+        values = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+        values = values[np.isfinite(values)]
+        summary = summaries.get(col) or {}
+        # The outlier sketches already know every column's range (over all rows in chunked mode).
+        if summary.get("count"):
+            value_range = (summary["min"], summary["max"])
+        elif values.size:
+            value_range = (float(values.min()), float(values.max()))
+        else:
+            histograms.append({"column": col, "edges": [], "counts": []})
+            continue
+        counts, edges = np.histogram(values, bins=HISTOGRAM_BINS, range=value_range)
+        histograms.append(
+            {
+                "column": col,
+                "edges": [round(float(edge), 6) for edge in edges],
+                "counts": counts.tolist(),
+            }
+        )
+    return histograms
+
+
+def _correlation(df: pd.DataFrame, profile: DatasetProfile) -> dict[str, Any] | None:
+    if not profile.numeric_columns:
+        return None
+    numeric = df[profile.numeric_columns]
+    if len(numeric) > PLOT_SAMPLE_ROWS:
+        numeric = numeric.sample(n=PLOT_SAMPLE_ROWS, random_state=42)
+    corr = numeric.corr().abs()
+    columns = corr.mean().sort_values(ascending=False).head(CORRELATION_TOP_COLUMNS).index.tolist()
+    matrix = corr.loc[columns, columns].to_numpy()
+    return {"columns": columns, "matrix": [_finite_or_none(row) for row in matrix]}
+
+
+def build_plot_data(
+    df: pd.DataFrame,
+    target_column: str | None,
+    profile: DatasetProfile | None = None,
+    outliers: dict | None = None,
+) -> dict[str, Any]:
+    """Compact, JSON-friendly aggregates every report plot is drawn from.
+
+    Stored in the report so plots can be rendered (and re-rendered) without
+    touching the uploaded file: missingness of the top columns with a sampled
+    null mask, target value counts, per-column histograms and the top-20
+    absolute correlation submatrix (over a ``PLOT_SAMPLE_ROWS`` row sample).
+    """
+    profile = profile or build_dataset_profile(df)
+    return {
+        "rows": int(profile.rows),
+        "missing": _missing(profile),
+        "target_counts": _target_counts(df, target_column),
+        "numeric_histograms": _histograms(df, profile, outliers),
+        "correlation": _correlation(df, profile),
+    }
@@ -1,19 +1,163 @@
+import threading
+from functools import cached_property
+
 import pandas as pd
 
+from .row_index import RowIndex
+from .type_inference import parse_datetimes
+from .sketches import (
+    DEFAULT_DISTINCT_EXACT_MAX_ROWS,
+    DEFAULT_DISTINCT_RELATIVE_ERROR,
+    HyperLogLog,
+    hash_series,
+)
+
+
+class DatasetProfile:
+    """Per-dataset column statistics shared by every analysis stage.
+
+    Cheap facts are set eagerly; anything that scans the data is computed on first
+    access and cached, so each statistic costs at most one pass per dataset.
+    Dict-style access (``profile["rows"]``) is kept for existing analyzers.
+
+    Past ``distinct_exact_max_rows`` rows, distinct counts are HyperLogLog
+    estimates within ``distinct_error`` relative error; ``cardinality_method``
+    tells callers which one they got.
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        distinct_exact_max_rows: int | None = DEFAULT_DISTINCT_EXACT_MAX_ROWS,
+        distinct_error: float = DEFAULT_DISTINCT_RELATIVE_ERROR,
+    ):
+        self.df = df
+        self.rows = len(df)
+        self.columns = len(df.columns)
+        self.column_names = df.columns.tolist()
+        self.distinct_exact_max_rows = distinct_exact_max_rows
+        self.distinct_error = distinct_error
+        self._distinct_counts: dict[str, int] = {}
+        self._estimated_distinct: set[str] = set()
+        self._row_index: RowIndex | None = None
+        self._datetimes: dict[str, tuple[pd.Series | None, str | None]] = {}
+        self._row_index_lock = threading.Lock()
+
+    def __getitem__(self, key: str):
+        return getattr(self, key)
+
+    def __getstate__(self) -> dict:
+        # Heavy stages may run in a process pool; locks do not pickle.
+        state = self.__dict__.copy()
+        del state["_row_index_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._row_index_lock = threading.Lock()
+
+    @cached_property
+    def numeric_columns(self) -> list[str]:
+        return self.df.select_dtypes(include="number").columns.tolist()
+
+    @cached_property
+    def categorical_columns(self) -> list[str]:
+        numeric = set(self.numeric_columns)
+        return [col for col in self.column_names if col not in numeric]
+
+    @cached_property
+    def dtype_classes(self) -> dict[str, str]:
+        numeric = set(self.numeric_columns)
+        return {
+            col: "numeric" if col in numeric else "categorical"
+            for col in self.column_names
+        }
+
+    @cached_property
+    def null_mask(self) -> pd.DataFrame:
+        return self.df.isna()
+
+    @cached_property
+    def null_counts(self) -> pd.Series:
+        return self.null_mask.sum()
+
+    @property
+    def row_index(self) -> RowIndex:
+        # Several concurrent stages read duplicates; the first one hashes, the rest wait.
+        with self._row_index_lock:
+            if self._row_index is None:
+                self._row_index = RowIndex(self.df)
+        return self._row_index
+
+    @cached_property
+    def duplicate_mask(self) -> pd.Series:
+        return self.row_index.duplicate_mask()
+
+    @cached_property
+    def duplicate_count(self) -> int:
+        return self.row_index.duplicate_count()
+
+    def datetime_values(self, column: str) -> pd.Series | None:
+        """Column parsed to UTC timestamps, or None if it is not datetime-like (parsed once)."""
+        if column not in self._datetimes:
+            self._datetimes[column] = parse_datetimes(self.df[column])
+        return self._datetimes[column][0]
+
+    def datetime_formats(self) -> dict[str, str]:
+        """Format of every datetime-like column; parses and caches each of them."""
+        formats = {}
+        for column in self.categorical_columns:
+            self.datetime_values(column)
+            if self._datetimes[column][1] is not None:
+                formats[column] = self._datetimes[column][1]
+        return formats
+
+    def numeric_frame(self) -> pd.DataFrame:
+        return self.df[self.numeric_columns]
+
+    def categorical_frame(self) -> pd.DataFrame:
+        return self.df[self.categorical_columns]
+
+    def non_null_count(self, column: str) -> int:
+        return self.rows - int(self.null_counts[column])
+
+    def distinct_count(self, column: str, dropna: bool = True) -> int:
+        if column not in self._distinct_counts:
+            if self.distinct_exact_max_rows is not None and self.rows > self.distinct_exact_max_rows:
+                series = self.df[column]
+                sketch = HyperLogLog.for_error(self.distinct_error)
+                sketch.add_hashes(hash_series(series[series.notna()]))
+                self._distinct_counts[column] = min(sketch.estimate(), self.non_null_count(column))
+                self._estimated_distinct.add(column)
+            else:
+                self._distinct_counts[column] = int(self.df[column].nunique(dropna=True))
+        count = self._distinct_counts[column]
+        if not dropna and self.null_counts[column] > 0:
+            count += 1
+        return count
+
+    @property
+    def distinct_relative_error(self) -> float:
+        """Standard error of the HyperLogLog estimates actually used (may beat ``distinct_error``)."""
+        return HyperLogLog.for_error(self.distinct_error).relative_error
+
+    def cardinality_method(self, column: str) -> str:
+        self.distinct_count(column)
+        return "hyperloglog" if column in self._estimated_distinct else "exact"
+
+    def cardinality_summary(self) -> dict:
+        estimated = [col for col in self.column_names if col in self._estimated_distinct]
+        return {
+            "method": "hyperloglog" if estimated else "exact",
+            "relative_error": round(self.distinct_relative_error, 4) if estimated else 0.0,
+            "estimated_columns": estimated,
+        }
+
+
 def build_dataset_profile(
-    df: pd.DataFrame
-):
-
-    numeric_columns  = df.select_dtypes(include = "number").columns.tolist()
-    categorical_columns = df.select_dtypes(exclude="number").columns.tolist()
-
-    profile = {
-
-        "rows": len(df),
-        "columns": len(df.columns),
-        "numeric_columns" : numeric_columns,
-        "categorical_columns" : categorical_columns,
-        "column_names": df.columns.tolist()
-    }
-
-    return profile
+    df: pd.DataFrame,
+    distinct_exact_max_rows: int | None = DEFAULT_DISTINCT_EXACT_MAX_ROWS,
+    distinct_error: float = DEFAULT_DISTINCT_RELATIVE_ERROR,
+) -> DatasetProfile:
+
+    return DatasetProfile(df, distinct_exact_max_rows, distinct_error)
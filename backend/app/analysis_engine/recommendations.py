@@ -20,6 +20,10 @@ def build_recommendations(report: dict) -> dict:
     if id_columns:
         actions.append("Remove identifier-like columns from model features to reduce memorization risk.")
 
+    near_duplicates = structural.get("near_duplicates", {}) if isinstance(structural.get("near_duplicates", {}), dict) else {}
+    if near_duplicates.get("near_duplicate_ratio", 0.0) >= 0.1:
+        actions.append("Deduplicate near-identical rows before splitting so validation rows do not mirror training rows.")
+
     target_diag = report.get("target_diagnostics", {}) if isinstance(report.get("target_diagnostics", {}), dict) else {}
     if target_diag.get("weak_signal_detected"):
         actions.append("Engineer higher-signal features or enrich data sources; current target signal is weak.")
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from .sketches import hash_series
+
+ROW_HASH_MULTIPLIER = np.uint64(0x100000001B3)
+
+NEAR_DUPLICATE_SAMPLE_ROWS = 200_000
+LSH_BANDS = 8
+LSH_ROWS_PER_BAND = 4
+MAX_BUCKET_SIZE = 50
+_BLOCK_ROWS = 50_000
+
+
+def combine_row_hashes(hashes: np.ndarray) -> np.ndarray:
+    """One 64-bit hash per row from a column-hash matrix (order-sensitive)."""
+    row_hash = np.zeros(hashes.shape[0], dtype=np.uint64)
+    for idx in range(hashes.shape[1]):
+        row_hash = row_hash * ROW_HASH_MULTIPLIER ^ hashes[:, idx]
+    return row_hash
+
+
+def _splitmix64(values: np.ndarray) -> np.ndarray:
+    values = values + np.uint64(0x9E3779B97F4A7C15)
+    values = (values ^ (values >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    values = (values ^ (values >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
+
+
+def _column_hashes(df: pd.DataFrame) -> np.ndarray:
+    return np.column_stack([hash_series(df[col]) for col in df.columns])
+
+
+class RowIndex:
+    """64-bit row hashes computed in one pass over the frame.
+
+    Exact duplicates are a sort over the row hashes. Near duplicates are looked for
+    in up to ``sample_rows`` rows: MinHash over each row's (column, value) tokens
+    with LSH banding proposes candidate pairs, which are then verified by counting
+    differing columns.
+    """
+
+    def __init__(self, df: pd.DataFrame, sample_rows: int = NEAR_DUPLICATE_SAMPLE_ROWS, seed: int = 42):
+        self.df = df
+        self.columns = df.columns.tolist()
+        self.sample_rows = sample_rows
+        self.seed = seed
+        self.row_hashes = np.zeros(len(df), dtype=np.uint64)
+        for col in self.columns:
+            self.row_hashes = self.row_hashes * ROW_HASH_MULTIPLIER ^ hash_series(df[col])
+
+    @property
+    def rows(self) -> int:
+        return len(self.row_hashes)
+
+    def duplicate_count(self) -> int:
+        if self.rows < 2:
+            return 0
+        ordered = np.sort(self.row_hashes)
+        return int(np.count_nonzero(ordered[1:] == ordered[:-1]))
+
+    def duplicate_mask(self) -> pd.Series:
+        return pd.Series(self.row_hashes).duplicated()
+
+    def _band_keys(self, positions: np.ndarray, bands: int, rows_per_band: int) -> np.ndarray:
+        permutations = bands * rows_per_band
+        rng = np.random.default_rng(self.seed)
+        multipliers = rng.integers(1, 2**63, size=permutations, dtype=np.uint64) | np.uint64(1)
+        offsets = rng.integers(0, 2**63, size=permutations, dtype=np.uint64)
+        # Salt by column so equal values in different columns are different tokens.
+        salts = _splitmix64(np.arange(len(self.columns), dtype=np.uint64) + np.uint64(self.seed))
+
+        keys = np.empty((len(positions), bands), dtype=np.uint64)
+        for start in range(0, len(positions), _BLOCK_ROWS):
+            block = positions[start : start + _BLOCK_ROWS]
+            tokens = _column_hashes(self.df.iloc[block]) ^ salts
+            signatures = np.empty((len(block), permutations), dtype=np.uint64)
+            for idx in range(permutations):
+                signatures[:, idx] = (tokens * multipliers[idx] + offsets[idx]).min(axis=1)
+            for band in range(bands):
+                keys[start : start + len(block), band] = combine_row_hashes(
+                    signatures[:, band * rows_per_band : (band + 1) * rows_per_band]
+                )
+        return keys
+
+    def near_duplicates(
+        self,
+        max_differing_columns: int | None = None,
+        bands: int = LSH_BANDS,
+        rows_per_band: int = LSH_ROWS_PER_BAND,
+    ) -> dict[str, Any]:
+        """Rows that match another row in all but ``max_differing_columns`` columns.
+
+        Exact duplicates are excluded (they are reported separately), as are LSH
+        buckets larger than ``MAX_BUCKET_SIZE``. Above ``sample_rows`` rows only a
+        uniform sample is searched, so the ratio then undercounts pairs split by it.
+        """
+        column_count = len(self.columns)
+        if column_count < 3 or self.rows < 2:
+            return {"skipped": True, "reason": "too_few_rows_or_columns"}
+        if max_differing_columns is None:
+            max_differing_columns = max(1, column_count // 10)
+
+        positions = np.arange(self.rows)
+        if self.rows > self.sample_rows:
+            rng = np.random.default_rng(self.seed)
+            positions = np.sort(rng.choice(self.rows, self.sample_rows, replace=False))
+        # Keep one representative per exact-duplicate group.
+        _, first = np.unique(self.row_hashes[positions], return_index=True)
+        positions = positions[np.sort(first)]
+
+        keys = self._band_keys(positions, bands, rows_per_band)
+        left_parts, right_parts = [], []
+        for band in range(bands):
+            order = np.argsort(keys[:, band], kind="stable")
+            ordered = keys[order, band]
+            starts = np.flatnonzero(np.r_[True, ordered[1:] != ordered[:-1]])
+            sizes = np.diff(np.r_[starts, len(ordered)])
+            # Huge buckets are low-entropy rows (mostly nulls/constants); pairing them is quadratic.
+            usable = (sizes > 1) & (sizes <= MAX_BUCKET_SIZE)
+            for start, size in zip(starts[usable], sizes[usable]):
+                members = order[start : start + size]
+                left, right = np.triu_indices(size, k=1)
+                left_parts.append(members[left])
+                right_parts.append(members[right])
+
+        pairs = np.empty((0, 2), dtype=np.int64)
+        differing = np.empty((0, column_count), dtype=bool)
+        if left_parts:
+            candidates = np.column_stack([np.concatenate(left_parts), np.concatenate(right_parts)])
+            pairs = np.unique(np.sort(candidates, axis=1), axis=0)
+            involved, inverse = np.unique(pairs, return_inverse=True)
+            hashes = _column_hashes(self.df.iloc[positions[involved]])
+            inverse = inverse.reshape(pairs.shape)
+            differing = hashes[inverse[:, 0]] != hashes[inverse[:, 1]]
+            counts = differing.sum(axis=1)
+            keep = (counts > 0) & (counts <= max_differing_columns)
+            pairs, differing = pairs[keep], differing[keep]
+
+        examples = [
+            {
+                "row_positions": [int(positions[left]), int(positions[right])],
+                "differing_columns": [self.columns[idx] for idx in np.flatnonzero(mask)],
+            }
+            for (left, right), mask in zip(pairs[:5], differing[:5])
+        ]
+        near_duplicate_rows = len(np.unique(pairs))
+        return {
+            "method": "minhash_lsh",
+            "sampled_rows": int(len(positions)),
+            "max_differing_columns": int(max_differing_columns),
+            "bands": bands,
+            "rows_per_band": rows_per_band,
+            "near_duplicate_pairs": int(len(pairs)),
+            "near_duplicate_rows": int(near_duplicate_rows),
+            "near_duplicate_ratio": round(float(near_duplicate_rows / max(len(positions), 1)), 4),
+            "examples": examples,
+        }
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pandas as pd
+
+# Above this many rows distinct counts switch from exact to HyperLogLog estimates.
+DEFAULT_DISTINCT_EXACT_MAX_ROWS = 1_000_000
+DEFAULT_DISTINCT_RELATIVE_ERROR = 0.01
+
+
+def hash_series(series: pd.Series) -> np.ndarray:
+    """64-bit hash per value, stable across chunks of the same column.
+
+    Numbers are hashed as float64 so an int chunk and a float (NaN-holding) chunk
+    of the same column hash identical values alike.
+    """
+    if pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    else:
+        values = series.to_numpy(dtype=object)
+    # categorize=True factorizes first, which costs a full nunique on high-cardinality columns.
+    return pd.util.hash_array(values, categorize=False)
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    _, exponent = np.frexp(values.astype(np.float64))
+    exponent = exponent.astype(np.int64)
+    # float64 rounding can lift values just below a power of two (past 2**53) onto it.
+    rounded_up = (exponent > 0) & ((values >> np.maximum(exponent - 1, 0).astype(np.uint64)) == 0)
+    return exponent - rounded_up
+
+
+class HyperLogLog:
+    """Mergeable HyperLogLog cardinality sketch over 64-bit hashes.
+
+    ``precision`` p gives 2**p one-byte registers and a relative standard error of
+    about 1.04 / sqrt(2**p); ``for_error`` picks the smallest p meeting a bound.
+    """
+
+    def __init__(self, precision: int = 14):
+        if not 4 <= precision <= 18:
+            raise ValueError("HyperLogLog precision must be between 4 and 18")
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    @classmethod
+    def for_error(cls, relative_error: float) -> "HyperLogLog":
+        precision = math.ceil(2 * math.log2(1.04 / relative_error))
+        return cls(min(max(precision, 4), 18))
+
+    @property
+    def relative_error(self) -> float:
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def add_hashes(self, hashes: np.ndarray) -> None:
+        if not len(hashes):
+            return
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        p = self.precision
+        width = 64 - p
+        index = (hashes >> np.uint64(width)).astype(np.int64)
+        rest = hashes & np.uint64((1 << width) - 1)
+        rank = (width - _bit_length(rest) + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches of different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self) -> int:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / float(np.sum(np.exp2(-self.registers.astype(np.float64))))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            # Small-range correction (linear counting).
+            return int(round(m * math.log(m / zeros)))
+        return int(round(raw))
+
+
+class DistinctCounter:
+    """Distinct values of one column: exact until ``exact_max_rows`` rows, then HyperLogLog.
+
+    Both phases consume the same hashes, so switching over loses nothing already seen
+    and counters built from different chunks merge either way.
+    """
+
+    def __init__(
+        self,
+        exact_max_rows: int | None = DEFAULT_DISTINCT_EXACT_MAX_ROWS,
+        relative_error: float = DEFAULT_DISTINCT_RELATIVE_ERROR,
+    ):
+        self.exact_max_rows = exact_max_rows
+        self.relative_error = relative_error
+        self.rows = 0
+        self._exact: list[np.ndarray] = []
+        self._exact_size = 0
+        self.sketch: HyperLogLog | None = None
+
+    @property
+    def estimated(self) -> bool:
+        return self.sketch is not None
+
+    def add_hashes(self, hashes: np.ndarray) -> None:
+        self.rows += len(hashes)
+        if self.sketch is not None:
+            self.sketch.add_hashes(hashes)
+            return
+        self._exact.append(np.unique(hashes))
+        self._exact_size += len(self._exact[-1])
+        if self.exact_max_rows is not None and self.rows > self.exact_max_rows:
+            self._to_sketch()
+        elif len(self._exact) > 1 and self._exact_size > max(1_000_000, 2 * len(self._exact[0])):
+            self._exact = [np.unique(np.concatenate(self._exact))]
+            self._exact_size = len(self._exact[0])
+
+    def _to_sketch(self) -> None:
+        self.sketch = HyperLogLog.for_error(self.relative_error)
+        for hashes in self._exact:
+            self.sketch.add_hashes(hashes)
+        self._exact = []
+        self._exact_size = 0
+
+    def merge(self, other: "DistinctCounter") -> "DistinctCounter":
+        self.rows += other.rows
+        if self.sketch is None and other.sketch is None:
+            self._exact.extend(other._exact)
+            self._exact_size += other._exact_size
+            if self.exact_max_rows is not None and self.rows > self.exact_max_rows:
+                self._to_sketch()
+            return self
+        if self.sketch is None:
+            self._to_sketch()
+        if other.sketch is not None:
+            self.sketch.merge(other.sketch)
+        else:
+            for hashes in other._exact:
+                self.sketch.add_hashes(hashes)
+        return self
+
+    def count(self) -> int:
+        if self.sketch is not None:
+            return self.sketch.estimate()
+        if not self._exact:
+            return 0
+        self._exact = [np.unique(np.concatenate(self._exact))]
+        self._exact_size = len(self._exact[0])
+        return self._exact_size
+
+
+DEFAULT_KLL_K = 2048
+SUMMARY_QUANTILES = tuple(round(q / 20, 2) for q in range(21))
+
+
+class KLLSketch:
+    """Mergeable KLL quantile sketch (Karnin, Lang & Liberty).
+
+    Level ``h`` holds items of weight ``2**h``; a full level is sorted and every other
+    item (random offset) is promoted. Memory is about ``3 * k`` floats and the rank
+    error roughly ``1 / k``. Until the first compaction the sketch is exact, and
+    ``quantiles`` then interpolates like ``numpy.quantile``.
+    """
+
+    def __init__(self, k: int = DEFAULT_KLL_K, seed: int = 42):
+        self.k = k
+        self.levels: list[np.ndarray] = [np.empty(0)]
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(int(math.ceil(self.k * (2 / 3) ** depth)), 2)
+
+    def update(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return
+        self.count += len(values)
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+        return self
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                paired = len(items) - len(items) % 2
+                offset = int(self._rng.integers(2))
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], items[offset:paired:2]])
+                self.levels[level] = items[paired:]
+            level += 1
+
+    @property
+    def exact(self) -> bool:
+        return len(self.levels) == 1
+
+    def _weighted_items(self) -> tuple[np.ndarray, np.ndarray]:
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(lvl), 2.0**h) for h, lvl in enumerate(self.levels)])
+        order = np.argsort(items, kind="stable")
+        return items[order], np.cumsum(weights[order])
+
+    def quantiles(self, qs) -> np.ndarray:
+        qs = np.asarray(qs, dtype=np.float64)
+        if not self.count:
+            return np.full(qs.shape, np.nan)
+        if self.exact:
+            return np.quantile(self.levels[0], qs)
+
+        items, cumulative = self._weighted_items()
+        positions = np.searchsorted(cumulative, qs * cumulative[-1], side="left")
+        result = items[np.clip(positions, 0, len(items) - 1)]
+        # Extremes are tracked exactly.
+        result = np.where(qs <= 0, self.min, np.where(qs >= 1, self.max, result))
+        return result
+
+    def fraction_below(self, values) -> np.ndarray:
+        """Estimated share of items strictly below each value."""
+        values = np.asarray(values, dtype=np.float64)
+        if not self.count:
+            return np.zeros(values.shape)
+        items, cumulative = self._weighted_items()
+        positions = np.searchsorted(items, values, side="left")
+        below = np.where(positions > 0, cumulative[np.maximum(positions - 1, 0)], 0.0)
+        return below / cumulative[-1]
+
+    def fraction_above(self, values) -> np.ndarray:
+        """Estimated share of items strictly above each value."""
+        values = np.asarray(values, dtype=np.float64)
+        if not self.count:
+            return np.zeros(values.shape)
+        items, cumulative = self._weighted_items()
+        positions = np.searchsorted(items, values, side="right")
+        at_or_below = np.where(positions > 0, cumulative[np.maximum(positions - 1, 0)], 0.0)
+        return 1.0 - at_or_below / cumulative[-1]
+
+    def summary(self, qs=SUMMARY_QUANTILES) -> dict:
+        """Compact, JSON-friendly view of the distribution for reports and plots."""
+        if not self.count:
+            return {"count": 0}
+        values = self.quantiles(qs)
+        return {
+            "count": int(self.count),
+            "min": round(float(self.min), 6),
+            "max": round(float(self.max), 6),
+            "exact": self.exact,
+            "quantiles": {f"{q:g}": round(float(v), 6) for q, v in zip(qs, values)},
+        }
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable
+
+from .instrumentation import StageFailed, log_stage_metrics, run_measured
+from .isolation import ResourceLimitExceeded, ResourceLimits, run_isolated
+
+logger = logging.getLogger(__name__)
+
+_POLL_SECONDS = 0.2
+
+
+class Stage:
+    """One node of the analysis DAG.
+
+    ``func`` is called with keyword arguments named after ``requires`` (hard inputs:
+    the stage is skipped if any of them failed) and ``uses`` (soft inputs: passed when
+    available, omitted otherwise). Its return value is published under ``name``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        requires: Iterable[str] = (),
+        uses: Iterable[str] = (),
+        heavy: bool = False,
+    ):
+        self.name = name
+        self.func = func
+        self.requires = tuple(requires)
+        self.uses = tuple(uses)
+        self.heavy = heavy
+
+    @property
+    def inputs(self) -> tuple[str, ...]:
+        return self.requires + self.uses
+
+
+class StageRunResult:
+    def __init__(self) -> None:
+        self.outputs: dict[str, Any] = {}
+        self.failed: list[str] = []
+        self.timed_out: set[str] = set()
+        self.skipped: dict[str, str] = {}
+        self.metrics: dict[str, dict[str, Any]] = {}
+
+
+def resolve_stage_plan(
+    stages: list[Stage],
+    available: Iterable[str],
+    only: Iterable[str] | None = None,
+) -> list[Stage]:
+    """Topologically order ``stages``; with ``only``, keep those plus their hard dependencies."""
+    by_name = {stage.name: stage for stage in stages}
+    available = set(available)
+
+    # Soft inputs (``uses``) may legitimately be absent, e.g. sections computed elsewhere.
+    for stage in stages:
+        unknown = [name for name in stage.requires if name not in by_name and name not in available]
+        if unknown:
+            raise ValueError(f"Stage '{stage.name}' depends on unknown input(s): {unknown}")
+
+    selected = set(by_name)
+    if only is not None:
+        selected = set()
+        frontier = [name for name in only]
+        while frontier:
+            name = frontier.pop()
+            if name in selected or name in available:
+                continue
+            if name not in by_name:
+                raise ValueError(f"Unknown stage '{name}'")
+            selected.add(name)
+            frontier.extend(by_name[name].requires)
+
+    ordered: list[Stage] = []
+    done = set(available)
+    remaining = [stage for stage in stages if stage.name in selected]
+    while remaining:
+        ready = [
+            stage
+            for stage in remaining
+            if all(name in done or name not in selected for name in stage.inputs)
+        ]
+        if not ready:
+            raise ValueError(f"Stage dependency cycle among: {[stage.name for stage in remaining]}")
+        for stage in ready:
+            ordered.append(stage)
+            done.add(stage.name)
+        remaining = [stage for stage in remaining if stage.name not in done]
+    return ordered
+
+
+def _run_measured_stage(_stage_name: str, _stage_func: Callable[..., Any], **kwargs: Any) -> tuple[Any, dict[str, Any]]:
+    # Stage inputs stay top-level keyword arguments so ``run_isolated`` can memory-map large ones.
+    return run_measured(_stage_name, _stage_func, kwargs)
+
+
+def _run_heavy_isolated(name: str, func: Callable[..., Any], kwargs: dict[str, Any], timeout: float):
+    try:
+        return run_isolated(
+            _run_measured_stage,
+            {"_stage_name": name, "_stage_func": func, **kwargs},
+            ResourceLimits(cpu_count=None, memory_mb=None, wall_seconds=timeout),
+        )
+    except ResourceLimitExceeded as exc:
+        if exc.limit == "wall_time":
+            raise TimeoutError(exc.detail) from exc
+        raise
+
+
+def run_stage_graph(
+    stages: list[Stage],
+    context: dict[str, Any],
+    only: Iterable[str] | None = None,
+    max_workers: int = 4,
+    stage_timeout: float = 600.0,
+    heavy_executor: str = "thread",
+    measure_peak: bool = False,
+) -> StageRunResult:
+    """Run every stage as soon as its inputs are settled, independent stages in parallel.
+
+    A stage that raises or exceeds ``stage_timeout`` is recorded in ``failed``; stages
+    that hard-require it are skipped. With ``heavy_executor="process"`` heavy stages
+    run in their own worker process, which is killed (with anything it started) on
+    timeout. Timed-out threads cannot be interrupted, so an abandoned thread stage may
+    keep running in the background until it returns. Wall/CPU
+    time and memory of every executed stage end up in ``metrics``; per-stage traced
+    peaks are only measured with ``measure_peak``, which requires ``max_workers=1``.
+    """
+    plan = resolve_stage_plan(stages, context, only)
+    planned = {stage.name for stage in plan}
+    result = StageRunResult()
+    result.outputs.update(context)
+    settled: set[str] = set(context)
+    started_at: dict[str, float] = {}
+    measure_peak = measure_peak and max_workers <= 1
+
+    def _timed(name: str, func: Callable[..., Any], kwargs: dict[str, Any]) -> Any:
+        started_at[name] = time.monotonic()
+        return run_measured(name, func, kwargs, measure_peak)
+
+    pool = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="analysis")
+    isolate_heavy = heavy_executor == "process"
+    # Isolated stages enforce their own timeout by killing their process.
+    isolated: set[str] = set()
+
+    waiting = list(plan)
+    pending: dict[Future, str] = {}
+
+    def _submit_ready() -> None:
+        nonlocal waiting
+        still_waiting = []
+        for stage in waiting:
+            blocked = [
+                name
+                for name in stage.requires
+                if name in settled and name not in result.outputs
+            ]
+            if blocked:
+                result.skipped[stage.name] = f"upstream_failed: {', '.join(blocked)}"
+                settled.add(stage.name)
+                continue
+            if not all(name in settled or name not in planned for name in stage.inputs):
+                still_waiting.append(stage)
+                continue
+
+            kwargs = {name: result.outputs[name] for name in stage.inputs if name in result.outputs}
+            if stage.heavy and isolate_heavy:
+                isolated.add(stage.name)
+                future = pool.submit(_run_heavy_isolated, stage.name, stage.func, kwargs, stage_timeout)
+            else:
+                future = pool.submit(_timed, stage.name, stage.func, kwargs)
+            pending[future] = stage.name
+        waiting = still_waiting
+
+    try:
+        _submit_ready()
+        while pending:
+            done, _ = wait(list(pending), timeout=_POLL_SECONDS, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = pending.pop(future)
+                try:
+                    result.outputs[name], result.metrics[name] = future.result()
+                except TimeoutError as exc:
+                    logger.error("%s timed out: %s", name, exc)
+                    result.failed.append(name)
+                    result.timed_out.add(name)
+                    result.metrics[name] = {"status": "timeout", "wall_seconds": stage_timeout}
+                except StageFailed as exc:
+                    logger.error(f"{name} failed", exc_info=exc.__cause__ or exc)
+                    result.failed.append(name)
+                    result.metrics[name] = exc.metrics
+                except Exception:
+                    logger.exception(f"{name} failed")
+                    result.failed.append(name)
+                settled.add(name)
+                if name in result.metrics:
+                    log_stage_metrics(name, result.metrics[name])
+
+            now = time.monotonic()
+            for future, name in list(pending.items()):
+                start = started_at.get(name)
+                if name not in isolated and start is not None and now - start > stage_timeout:
+                    logger.error("%s timed out after %.1fs", name, stage_timeout)
+                    future.cancel()
+                    pending.pop(future)
+                    result.failed.append(name)
+                    result.timed_out.add(name)
+                    result.metrics[name] = {"status": "timeout", "wall_seconds": round(now - start, 4)}
+                    settled.add(name)
+                    log_stage_metrics(name, result.metrics[name])
+
+            _submit_ready()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    for name in context:
+        result.outputs.pop(name, None)
+    return result
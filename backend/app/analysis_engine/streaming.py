@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import logging
+from functools import cached_property
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from pandas.errors import ParserError
+
+from app.utils.csv_ingestion import CsvChunkReader
+
+from .profile import DatasetProfile
+from .row_index import ROW_HASH_MULTIPLIER
+from .sketches import (
+    DEFAULT_DISTINCT_EXACT_MAX_ROWS,
+    DEFAULT_DISTINCT_RELATIVE_ERROR,
+    DistinctCounter,
+    hash_series,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_ROWS = 100_000
+DEFAULT_SAMPLE_ROWS = 100_000
+
+def _is_numeric_dtype(dtype: str) -> bool:
+    # Same definition as ``DatasetProfile.numeric_columns`` (select_dtypes("number")): bool is not numeric.
+    return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+
+
+def _merge_dtype(current: str | None, new: str) -> str:
+    """Dtype the whole column would get if the chunks had been parsed together."""
+    if current is None or current == new:
+        return new
+    if _is_numeric_dtype(current) and _is_numeric_dtype(new):
+        return "float64"
+    return "object"
+
+
+class StreamingProfile(DatasetProfile):
+    """``DatasetProfile`` accumulated chunk by chunk.
+
+    Row, null, distinct and duplicate counts cover the whole file; ``df`` is a row
+    sample (set by ``finalize``) for stages that still need actual values. Distinct
+    values per column and distinct rows (for the duplicate count) are kept as 8-byte
+    hashes until ``distinct_exact_max_rows`` rows, then as HyperLogLog sketches, so
+    memory does not grow with the row count. Without a limit the default applies.
+    """
+
+    def __init__(
+        self,
+        distinct_exact_max_rows: int | None = DEFAULT_DISTINCT_EXACT_MAX_ROWS,
+        distinct_error: float = DEFAULT_DISTINCT_RELATIVE_ERROR,
+    ) -> None:
+        if distinct_exact_max_rows is None:
+            distinct_exact_max_rows = DEFAULT_DISTINCT_EXACT_MAX_ROWS
+        super().__init__(pd.DataFrame(), distinct_exact_max_rows, distinct_error)
+        self.column_dtypes: dict[str, str] = {}
+        self._null_counts: dict[str, int] = {}
+        self._distinct: dict[str, DistinctCounter] = {}
+        self._distinct_rows = DistinctCounter(distinct_exact_max_rows, distinct_error)
+        self._duplicate_count = 0
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        if not self.column_names:
+            self.column_names = chunk.columns.tolist()
+            self.columns = len(self.column_names)
+
+        self.rows += len(chunk)
+        row_hash = np.zeros(len(chunk), dtype=np.uint64)
+        for col in chunk.columns:
+            series = chunk[col]
+            nulls = series.isna().to_numpy()
+            hashes = hash_series(series)
+
+            self.column_dtypes[col] = _merge_dtype(self.column_dtypes.get(col), str(series.dtype))
+            self._null_counts[col] = self._null_counts.get(col, 0) + int(nulls.sum())
+            self._distinct_counter(col).add_hashes(hashes[~nulls])
+            row_hash = row_hash * ROW_HASH_MULTIPLIER ^ hashes
+
+        # Same row hash as ``RowIndex``; duplicates are the rows minus the distinct rows.
+        self._distinct_rows.add_hashes(row_hash)
+
+    def merge(self, other: "StreamingProfile") -> "StreamingProfile":
+        if not self.column_names:
+            self.column_names = other.column_names
+            self.columns = other.columns
+        self.rows += other.rows
+        self._distinct_rows.merge(other._distinct_rows)
+        for col, dtype in other.column_dtypes.items():
+            self.column_dtypes[col] = _merge_dtype(self.column_dtypes.get(col), dtype)
+            self._null_counts[col] = self._null_counts.get(col, 0) + other._null_counts[col]
+            self._distinct_counter(col).merge(other._distinct[col])
+        return self
+
+    def finalize(self, sample: pd.DataFrame) -> "StreamingProfile":
+        self.df = sample
+        duplicates = max(self.rows - self._distinct_rows.count(), 0)
+        if self._distinct_rows.estimated and duplicates <= 3 * self.distinct_relative_error * self.rows:
+            # Within the sketch's noise; an all-unique file must not report duplicates.
+            duplicates = 0
+        self._duplicate_count = duplicates
+        self._distinct_rows = DistinctCounter(self.distinct_exact_max_rows, self.distinct_error)
+        for col, counter in self._distinct.items():
+            self._distinct_counts[col] = min(counter.count(), self.rows - self._null_counts[col])
+            if counter.estimated:
+                self._estimated_distinct.add(col)
+        self._distinct = {}
+        return self
+
+    def _distinct_counter(self, column: str) -> DistinctCounter:
+        if column not in self._distinct:
+            self._distinct[column] = DistinctCounter(self.distinct_exact_max_rows, self.distinct_error)
+        return self._distinct[column]
+
+    @cached_property
+    def numeric_columns(self) -> list[str]:
+        return [col for col in self.column_names if _is_numeric_dtype(self.column_dtypes.get(col, "object"))]
+
+    @cached_property
+    def null_counts(self) -> pd.Series:
+        return pd.Series(
+            [self._null_counts.get(col, 0) for col in self.column_names],
+            index=self.column_names,
+            dtype="int64",
+        )
+
+    @property
+    def duplicate_count(self) -> int:
+        return self._duplicate_count
+
+
+class _RowSampler:
+    """Uniform row sample of fixed size: keeps the rows with the smallest random keys."""
+
+    def __init__(self, size: int, seed: int = 42) -> None:
+        self.size = size
+        self._rng = np.random.default_rng(seed)
+        self._frame: pd.DataFrame | None = None
+        self._keys = np.empty(0)
+        self._offset = 0
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        chunk = chunk.set_axis(np.arange(self._offset, self._offset + len(chunk)))
+        self._offset += len(chunk)
+        keys = np.concatenate([self._keys, self._rng.random(len(chunk))])
+        frame = chunk if self._frame is None else pd.concat([self._frame, chunk])
+        if len(keys) > self.size:
+            keep = np.sort(np.argpartition(keys, self.size - 1)[: self.size])
+            keys = keys[keep]
+            frame = frame.iloc[keep]
+        self._frame = frame
+        self._keys = keys
+
+    def frame(self) -> pd.DataFrame:
+        if self._frame is None:
+            return pd.DataFrame()
+        return self._frame.reset_index(drop=True)
+
+
+class ChunkedScan:
+    def __init__(self, profile: StreamingProfile) -> None:
+        self.profile = profile
+        self.sample = pd.DataFrame()
+        self.outputs: dict[str, Any] = {}
+        self.failed: list[str] = []
+        self.warnings: list[str] = []
+        self.chunks = 0
+
+
+def _scan(
+    file_path: str,
+    analyzers,
+    target_column,
+    chunk_rows,
+    sample_rows,
+    engine,
+    distinct_exact_max_rows,
+    distinct_error,
+) -> ChunkedScan:
+    scan = ChunkedScan(StreamingProfile(distinct_exact_max_rows, distinct_error))
+    reader = CsvChunkReader(file_path, chunk_rows=chunk_rows, engine=engine)
+    sampler = _RowSampler(sample_rows)
+    states = {}
+    for analyzer in analyzers:
+        state = analyzer.streaming_state(target_column)
+        if state is not None:
+            states[analyzer.name] = state
+
+    for chunk in reader:
+        scan.chunks += 1
+        scan.profile.update(chunk)
+        sampler.update(chunk)
+        for state in states.values():
+            state.update(chunk)
+
+    scan.sample = sampler.frame()
+    scan.profile.finalize(scan.sample)
+    scan.warnings = reader.warnings
+
+    for name, state in states.items():
+        try:
+            scan.outputs[name] = state.finalize(scan.profile)
+        except Exception:
+            logger.exception(f"{name} failed")
+            scan.failed.append(name)
+    return scan
+
+
+def scan_csv_in_chunks(
+    file_path: str,
+    analyzers,
+    target_column: str | None = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    sample_rows: int = DEFAULT_SAMPLE_ROWS,
+    distinct_exact_max_rows: int | None = DEFAULT_DISTINCT_EXACT_MAX_ROWS,
+    distinct_error: float = DEFAULT_DISTINCT_RELATIVE_ERROR,
+) -> ChunkedScan:
+    """Single pass over the file in ``chunk_rows`` chunks.
+
+    Streams every analyzer that provides a ``streaming_state`` and keeps a uniform
+    ``sample_rows`` row sample for the rest, so memory is bounded by chunk and sample
+    size (plus the exact hash sets held by ``StreamingProfile``).
+    """
+    try:
+        return _scan(
+            file_path,
+            analyzers,
+            target_column,
+            chunk_rows,
+            sample_rows,
+            "c",
+            distinct_exact_max_rows,
+            distinct_error,
+        )
+    except (ParserError, ValueError, OverflowError) as exc:
+        logger.info("fast chunked csv parse failed, using tolerant parser: %s", exc)
+        return _scan(
+            file_path,
+            analyzers,
+            target_column,
+            chunk_rows,
+            sample_rows,
+            "python",
+            distinct_exact_max_rows,
+            distinct_error,
+        )
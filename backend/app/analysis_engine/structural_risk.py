@@ -4,25 +4,22 @@ from typing import Any
 
 import pandas as pd
 
+from .profile import DatasetProfile, build_dataset_profile
+from .row_index import RowIndex
 
 ID_NAME_HINTS = ("id", "uuid", "email", "account", "customer")
 
 
-def _is_datetime_like(series: pd.Series) -> bool:
-    if pd.api.types.is_datetime64_any_dtype(series):
-        return True
-    sample = series.dropna().astype("string").head(100)
-    if sample.empty:
-        return False
-    parsed = pd.to_datetime(sample, errors="coerce", utc=True)
-    return parsed.notna().mean() >= 0.8
-
-
 def run_structural_risk_analysis(
     df: pd.DataFrame,
     target_column: str | None,
+    profile: DatasetProfile | None = None,
+    row_index: RowIndex | None = None,
+    column_types: dict[str, str] | None = None,
 ) -> dict[str, Any]:
-    rows = len(df)
+    profile = profile or build_dataset_profile(df)
+    row_index = row_index or profile.row_index
+    rows = profile.rows
     if rows == 0:
         return {"skipped": True, "reason": "empty_dataframe"}
 
@@ -30,16 +27,17 @@ def run_structural_risk_analysis(
     repeated_entity_identifiers: list[dict[str, Any]] = []
     timestamp_leakage_candidates: list[dict[str, Any]] = []
 
-    duplicate_rows = int(df.duplicated().sum())
+    duplicate_rows = profile.duplicate_count
     duplicate_ratio = round(float(duplicate_rows / rows), 4)
+    near_duplicates = row_index.near_duplicates()
 
     for col in df.columns:
-        series = df[col]
-        non_null = series.dropna()
-        if non_null.empty:
+        non_null_count = profile.non_null_count(col)
+        if non_null_count == 0:
             continue
 
-        uniqueness_ratio = float(non_null.nunique()) / float(len(non_null))
+        distinct_count = profile.distinct_count(col)
+        uniqueness_ratio = float(distinct_count) / float(non_null_count)
         lower_name = col.lower()
         is_hint = any(hint in lower_name for hint in ID_NAME_HINTS)
         if uniqueness_ratio >= 0.98 or is_hint:
@@ -47,10 +45,15 @@ def run_structural_risk_analysis(
                 {
                     "column": col,
                     "uniqueness_ratio": round(float(uniqueness_ratio), 4),
+                    "uniqueness_estimated": profile.cardinality_method(col) != "exact",
                     "name_hint": is_hint,
                 }
             )
-            duplicate_entity_count = int(non_null.duplicated().sum())
+            duplicate_entity_count = non_null_count - distinct_count
+            if profile.cardinality_method(col) != "exact":
+                # A shortfall within three standard errors of the sketch is estimation noise.
+                if duplicate_entity_count <= 3 * profile.distinct_relative_error * non_null_count:
+                    duplicate_entity_count = 0
             if duplicate_entity_count > 0:
                 repeated_entity_identifiers.append(
                     {
@@ -62,8 +65,11 @@ def run_structural_risk_analysis(
         if col == target_column:
             continue
 
-        if _is_datetime_like(series):
-            parsed = pd.to_datetime(series, errors="coerce", utc=True)
+        # column_types (from the type-inference stage) already knows which columns parse.
+        if column_types is None or col in column_types:
+            parsed = profile.datetime_values(col)
+            if parsed is None:
+                continue
             parsed_non_null = parsed.dropna()
             if parsed_non_null.empty:
                 continue
@@ -81,7 +87,9 @@ def run_structural_risk_analysis(
         "id_columns": id_columns,
         "repeated_entity_identifiers": repeated_entity_identifiers,
         "timestamp_leakage_candidates": timestamp_leakage_candidates,
+        "near_duplicates": near_duplicates,
         "high_structural_risk": duplicate_ratio >= 0.1
+        or near_duplicates.get("near_duplicate_ratio", 0.0) >= 0.1
         or bool(id_columns)
         or any(item.get("monotonic") for item in timestamp_leakage_candidates),
     }
@@ -2,62 +2,163 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
 import pandas as pd
+from scipy import sparse
 
+from .feature_encoding import EncodedFeatures, encode_features
+from .isolation import ResourceLimitExceeded, ResourceLimits, resource_limit_result, run_isolated
+from .mutual_information import histogram_mutual_info, resolve_signal_engine
+from .profile import DatasetProfile, build_dataset_profile
 from .task_detection import detect_task_type
 
 
-def _prepare_features(df: pd.DataFrame, target_column: str) -> pd.DataFrame:
-    x = df.drop(columns=[target_column], errors="ignore").copy()
-    if x.empty:
-        return x
+def _classification_mi(x, y: np.ndarray, numeric_feature_count: int) -> np.ndarray:
+    from sklearn.feature_selection import mutual_info_classif
 
-    numeric_cols = x.select_dtypes(include="number").columns.tolist()
-    for col in numeric_cols:
-        x[col] = x[col].fillna(x[col].median())
-
-    categorical_cols = [col for col in x.columns if col not in numeric_cols]
-    for col in categorical_cols:
-        x[col] = x[col].astype("string").fillna("__MISSING__")
-
-    return pd.get_dummies(x, columns=categorical_cols, drop_first=False)
+    # Numerics use the continuous k-NN estimator; one-hot indicators are genuinely
+    # discrete, which also lets them stay sparse.
+    scores = []
+    if numeric_feature_count:
+        scores.append(
+            mutual_info_classif(
+                x[:, :numeric_feature_count].toarray(),
+                y,
+                discrete_features=False,
+                random_state=42,
+            )
+        )
+    if x.shape[1] > numeric_feature_count:
+        scores.append(
+            mutual_info_classif(
+                x[:, numeric_feature_count:],
+                y,
+                discrete_features=True,
+                random_state=42,
+            )
+        )
+    return np.concatenate(scores)
+
+
+def _classification_signal(x, y: np.ndarray, numeric_feature_count: int, signal_engine: str) -> tuple[str, np.ndarray]:
+    if resolve_signal_engine(signal_engine, len(y)) == "histogram":
+        return "mi_histogram", histogram_mutual_info(x, y, numeric_feature_count)
+    return "mi", _classification_mi(x, y, numeric_feature_count)
+
+
+# Null-indicator cells converted to float per block of the contingency product.
+_CHI2_BLOCK_CELLS = 4_000_000
+
+
+def _missingness_bias(null_mask: pd.DataFrame, y_cls: pd.Series) -> list[dict[str, Any]]:
+    """Chi-square test of missingness vs. target class for every column at once.
+
+    Multiplying the one-hot target by the null-indicator matrix gives the missing
+    counts of every 2 x K contingency table in one product; the statistic and
+    p-value follow for all columns together, with Yates' correction on 2 x 2
+    tables as ``chi2_contingency`` applies it.
+    """
+    from scipy.stats import chi2 as chi2_distribution
+
+    valid = y_cls.notna().to_numpy()
+    codes, classes = pd.factorize(y_cls[valid])
+    rows, class_count = len(codes), len(classes)
+    if class_count < 2 or null_mask.shape[1] == 0:
+        return []
+
+    target_one_hot = sparse.csr_matrix(
+        (np.ones(rows), (codes, np.arange(rows))),
+        shape=(class_count, rows),
+    )
+    mask = null_mask.to_numpy(dtype=bool)[valid]
+    missing = np.empty((class_count, mask.shape[1]))
+    block = max(1, _CHI2_BLOCK_CELLS // max(rows, 1))
+    for start in range(0, mask.shape[1], block):
+        missing[:, start : start + block] = target_one_hot @ mask[:, start : start + block].astype(np.float64)
+
+    class_totals = np.bincount(codes, minlength=class_count).astype(np.float64)
+    observed = np.stack([missing.T, class_totals - missing.T], axis=1)
+    row_totals = observed.sum(axis=2)
+    # A column missing everywhere or nowhere has a one-row table: nothing to test.
+    testable = (row_totals > 0).all(axis=1)
+    expected = row_totals[:, :, None] * class_totals[None, None, :] / rows
+    if class_count == 2:
+        deviation = expected - observed
+        observed = observed + np.sign(deviation) * np.minimum(0.5, np.abs(deviation))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        chi2 = ((observed - expected) ** 2 / expected).sum(axis=(1, 2))
+    p_values = chi2_distribution.sf(chi2, class_count - 1)
+
+    return [
+        {
+            "column": column,
+            "p_value": round(float(p_values[idx]), 6),
+            "chi2": round(float(chi2[idx]), 4),
+        }
+        for idx, column in enumerate(null_mask.columns)
+        if testable[idx] and p_values[idx] < 0.05
+    ]
 
 
-def run_target_diagnostics(df: pd.DataFrame, target_column: str | None) -> dict[str, Any]:
+def run_target_diagnostics(
+    df: pd.DataFrame,
+    target_column: str | None,
+    profile: DatasetProfile | None = None,
+    encoded_features: EncodedFeatures | None = None,
+    signal_engine: str = "auto",
+    isolation: ResourceLimits | None = None,
+) -> dict[str, Any]:
+    """Target signal, low-signal features and missingness bias.
+
+    Classification signal is mutual information, from sklearn's k-NN estimator or
+    (``signal_engine="histogram"``, or ``"auto"`` on large frames) from binned joint
+    histograms; ``signal_metric`` records which ("mi" or "mi_histogram"). With
+    ``isolation`` the mutual information runs in a resource-limited worker process;
+    if it passes a limit, ``signal_skipped`` says so and the rest is still reported.
+    """
     if not target_column:
         return {"skipped": True, "reason": "no_target_column"}
     if target_column not in df.columns:
         return {"skipped": True, "reason": "target_column_not_found"}
 
+    profile = profile or build_dataset_profile(df)
     y_raw = df[target_column]
-    task_type = detect_task_type(y_raw)
+    task_type = detect_task_type(y_raw, profile.distinct_count(target_column))
     if task_type == "unknown":
         return {"skipped": True, "reason": "empty_target"}
 
     mask = ~y_raw.isna()
-    x_encoded = _prepare_features(df.loc[mask], target_column)
+    encoded = encoded_features or encode_features(df, target_column, profile)
+    positions = np.flatnonzero(mask.to_numpy())
     y = y_raw.loc[mask]
 
-    if x_encoded.empty or y.empty:
+    if encoded is None or encoded.empty or y.empty:
         return {"skipped": True, "reason": "insufficient_features"}
+    x_encoded = encoded.take(positions)
+    feature_names = encoded.feature_names
 
     feature_signal_strength: dict[str, float] = {}
     low_signal_features: list[str] = []
     signal_metric = "mi"
+    signal_skipped: dict[str, Any] | None = None
 
     try:
-        from sklearn.feature_selection import f_regression, mutual_info_classif
+        from sklearn.feature_selection import f_regression
 
         if task_type == "classification":
             y_for_mi = pd.factorize(y.astype("string"))[0]
-            mi_scores = mutual_info_classif(
-                x_encoded,
-                y_for_mi,
-                discrete_features="auto",
-                random_state=42,
-            )
+            signal_args = {
+                "x": x_encoded,
+                "y": y_for_mi,
+                "numeric_feature_count": encoded.numeric_feature_count,
+                "signal_engine": signal_engine,
+            }
+            if isolation is not None:
+                signal_metric, mi_scores = run_isolated(_classification_signal, signal_args, isolation)
+            else:
+                signal_metric, mi_scores = _classification_signal(**signal_args)
             feature_signal_strength = {
-                col: round(float(score), 4) for col, score in zip(x_encoded.columns, mi_scores)
+                col: round(float(score), 4) for col, score in zip(feature_names, mi_scores)
             }
             low_signal_features = [
                 col for col, score in feature_signal_strength.items() if score < 0.005
@@ -65,20 +166,22 @@ def run_target_diagnostics(df: pd.DataFrame, target_column: str | None) -> dict[
         else:
             signal_metric = "f_score"
             y_num = pd.to_numeric(y, errors="coerce")
-            valid = ~y_num.isna()
-            x_valid = x_encoded.loc[valid]
+            valid = ~y_num.isna().to_numpy()
+            x_valid = x_encoded[valid]
             y_valid = y_num.loc[valid]
-            if x_valid.empty or y_valid.empty:
+            if x_valid.shape[0] == 0 or y_valid.empty:
                 return {"skipped": True, "reason": "target_not_numeric_for_regression"}
             f_scores, _ = f_regression(x_valid, y_valid)
             feature_signal_strength = {
                 col: round(float(score), 4)
-                for col, score in zip(x_valid.columns, f_scores)
+                for col, score in zip(feature_names, f_scores)
                 if pd.notna(score)
             }
             low_signal_features = [
                 col for col, score in feature_signal_strength.items() if score < 1.0
             ][:20]
+    except ResourceLimitExceeded as exc:
+        signal_skipped = resource_limit_result(exc)
     except Exception as exc:
         return {"skipped": True, "reason": f"signal_computation_failed: {exc}"}
 
@@ -94,41 +197,15 @@ def run_target_diagnostics(df: pd.DataFrame, target_column: str | None) -> dict[
     # Missingness correlated with target.
     target_missing_bias: list[dict[str, Any]] = []
     if task_type == "classification":
-        try:
-            from scipy.stats import chi2_contingency
-        except Exception:
-            chi2_contingency = None
-
-        y_cls = y_raw.astype("string")
-        for column in df.columns:
-            if column == target_column:
-                continue
-            missing_mask = df[column].isna()
-            if not missing_mask.any():
-                continue
-            contingency = pd.crosstab(missing_mask, y_cls)
-            if contingency.shape[0] < 2 or contingency.shape[1] < 2:
-                continue
-            if chi2_contingency is None:
-                break
-            chi2, p_value, _, _ = chi2_contingency(contingency.values)
-            if p_value < 0.05:
-                target_missing_bias.append(
-                    {
-                        "column": column,
-                        "p_value": round(float(p_value), 6),
-                        "chi2": round(float(chi2), 4),
-                    }
-                )
-
-    return {
-        "task_type": task_type,
-        "target_column": target_column,
-        "signal_metric": signal_metric,
-        "top_predictive_features": top_predictive_features,
-        "low_signal_features": low_signal_features,
-        "target_missing_bias": target_missing_bias[:20],
-        "weak_signal_detected": len(top_predictive_features) == 0
+        columns = [
+            column
+            for column in df.columns
+            if column != target_column and profile.null_counts[column]
+        ]
+        target_missing_bias = _missingness_bias(profile.null_mask[columns], y_raw.astype("string"))
+
+    weak_signal = (
+        len(top_predictive_features) == 0
         or (
             task_type == "classification"
             and top_predictive_features[0]["score"] < 0.02
@@ -137,5 +214,20 @@ def run_target_diagnostics(df: pd.DataFrame, target_column: str | None) -> dict[
             task_type == "regression"
             and top_predictive_features
             and top_predictive_features[0]["score"] < 5.0
-        ),
+        )
+    )
+    result = {
+        "task_type": task_type,
+        "target_column": target_column,
+        "signal_metric": signal_metric,
+        "top_predictive_features": top_predictive_features,
+        "low_signal_features": low_signal_features,
+        "target_missing_bias": target_missing_bias[:20],
+        "weak_signal_detected": weak_signal,
     }
+    if signal_skipped is not None:
+        # No signal was measured, which says nothing about whether it is weak.
+        result["signal_metric"] = None
+        result["signal_skipped"] = signal_skipped
+        result["weak_signal_detected"] = False
+    return result
@@ -3,13 +3,14 @@ from __future__ import annotations
 import pandas as pd
 
 
-def detect_task_type(target: pd.Series) -> str:
+def detect_task_type(target: pd.Series, unique_count: int | None = None) -> str:
     non_null = target.dropna()
     if non_null.empty:
         return "unknown"
 
     if pd.api.types.is_numeric_dtype(non_null):
-        unique_count = int(non_null.nunique())
+        if unique_count is None:
+            unique_count = int(non_null.nunique())
         unique_ratio = float(unique_count) / float(len(non_null))
         if unique_count <= 20 and unique_ratio <= 0.05:
             return "classification"
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from collections import Counter
+
+import pandas as pd
+from pandas.tseries.api import guess_datetime_format
+
+DATETIME_SAMPLE_ROWS = 100
+DATETIME_GUESS_VALUES = 10
+DATETIME_MIN_PARSED_RATIO = 0.8
+
+NATIVE_DATETIME = "datetime64"
+MIXED_DATETIME = "mixed"
+
+
+def parse_datetimes(series: pd.Series) -> tuple[pd.Series | None, str | None]:
+    """UTC timestamps for a datetime-like column, plus the format that parsed it.
+
+    The format is guessed once from a few sample values and confirmed on a
+    ``DATETIME_SAMPLE_ROWS`` sample, then the whole column is parsed with it in one
+    vectorized call. Columns whose values share no single format fall back to
+    per-element ("mixed") parsing; numeric and boolean columns are never dates.
+    Returns ``(None, None)`` for columns that are not datetime-like.
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return pd.to_datetime(series, utc=True), NATIVE_DATETIME
+    if pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+        return None, None
+
+    sample = series.dropna().astype("string").head(DATETIME_SAMPLE_ROWS)
+    if sample.empty:
+        return None, None
+
+    guesses = Counter(guess_datetime_format(value) for value in sample.head(DATETIME_GUESS_VALUES))
+    guesses.pop(None, None)
+    for datetime_format, _ in guesses.most_common():
+        parsed = pd.to_datetime(sample, format=datetime_format, errors="coerce", utc=True)
+        if parsed.notna().mean() >= DATETIME_MIN_PARSED_RATIO:
+            return pd.to_datetime(series, format=datetime_format, errors="coerce", utc=True), datetime_format
+
+    parsed = pd.to_datetime(sample, format=MIXED_DATETIME, errors="coerce", utc=True)
+    if parsed.notna().mean() >= DATETIME_MIN_PARSED_RATIO:
+        return pd.to_datetime(series, format=MIXED_DATETIME, errors="coerce", utc=True), MIXED_DATETIME
+    return None, None
@@ -1,10 +1,21 @@
 from __future__ import annotations
 
+import logging
+import multiprocessing
+import threading
+import time
 from io import BytesIO
+from multiprocessing.connection import Connection, wait
+from typing import Any
 
-import pandas as pd
+import numpy as np
 
-from app.utils.csv_ingestion import load_tolerant_csv
+from app.analysis_engine.data_loader import load_dataframe
+from app.analysis_engine.plot_data import PLOT_SAMPLE_ROWS, build_plot_data
+
+logger = logging.getLogger(__name__)
+
+NUMERIC_DISTRIBUTION_COLUMNS = 4
 
 PLOT_NAMES = {
     "missing_heatmap",
@@ -14,114 +25,343 @@ PLOT_NAMES = {
     "correlation_heatmap",
 }
 
+# One render worker per plot type renders a dataset's plots side by side.
+DEFAULT_PLOT_WORKERS = len(PLOT_NAMES)
+PLOT_RENDER_TIMEOUT_SECONDS = 60.0
+# How often a render waiting for a free worker re-checks.
+_RENDER_SLOT_POLL_SECONDS = 0.25
 
-def _get_plt():
-    try:
-        import matplotlib
+_render_pool: "_RenderPool | None" = None
+_render_pool_workers: int | None = None
+_render_pool_lock = threading.Lock()
 
-        matplotlib.use("Agg")
-        import matplotlib.pyplot as plt  # noqa: WPS433
 
-        return plt
+def _require_matplotlib() -> None:
+    try:
+        import matplotlib  # noqa: F401
     except Exception as exc:
         raise RuntimeError(f"matplotlib_unavailable: {exc}")
 
 
-def _finalize_png(plt) -> bytes:
+def _figure(figsize):
+    # Figure objects carry their own Agg canvas; nothing touches pyplot's global state.
+    from matplotlib.figure import Figure
+
+    return Figure(figsize=figsize)
+
+
+def _finalize_png(fig) -> bytes:
     buf = BytesIO()
-    plt.tight_layout(pad=1.2)
-    plt.savefig(buf, format="png", dpi=120, bbox_inches="tight", pad_inches=0.25)
-    plt.close()
-    buf.seek(0)
-    return buf.read()
+    fig.tight_layout(pad=1.2)
+    fig.savefig(buf, format="png", dpi=120, bbox_inches="tight", pad_inches=0.25)
+    return buf.getvalue()
+
 
+def _placeholder(message: str, figsize=(8, 3)) -> bytes:
+    fig = _figure(figsize)
+    ax = fig.subplots()
+    ax.text(0.5, 0.5, message, ha="center", va="center")
+    ax.axis("off")
+    return _finalize_png(fig)
 
-def _plot_missing_heatmap(df: pd.DataFrame) -> bytes:
-    plt = _get_plt()
-    top_missing = df.isna().mean().sort_values(ascending=False).head(15).index.tolist()
+
+def _plot_missing_heatmap(plot_data: dict) -> bytes:
+    missing = plot_data.get("missing") or {}
+    top_missing = missing.get("columns") or []
     if not top_missing:
-        plt.figure(figsize=(8, 3))
-        plt.text(0.5, 0.5, "No missing values detected", ha="center", va="center")
-        plt.axis("off")
-        return _finalize_png(plt)
-    plt.figure(figsize=(10, 4))
-    matrix = df[top_missing].isna().astype(int).head(500)
-    plt.imshow(matrix.T, aspect="auto", interpolation="nearest")
-    plt.yticks(range(len(top_missing)), top_missing)
-    plt.xlabel("Row sample")
-    plt.title("Missing Data Heatmap (Top Columns)")
-    return _finalize_png(plt)
-
-
-def _plot_target_distribution(df: pd.DataFrame, target_column: str | None) -> bytes:
-    plt = _get_plt()
-    plt.figure(figsize=(8, 4))
-    if not target_column or target_column not in df.columns:
-        plt.text(0.5, 0.5, "Target column unavailable", ha="center", va="center")
-        plt.axis("off")
-        return _finalize_png(plt)
-    value_counts = df[target_column].astype("string").value_counts(dropna=False).head(20)
-    value_counts.plot(kind="bar")
-    plt.title(f"Target Distribution: {target_column}")
-    plt.ylabel("Count")
-    return _finalize_png(plt)
-
-
-def _plot_feature_importance(report: dict) -> bytes:
-    plt = _get_plt()
-    plt.figure(figsize=(8, 4))
+        return _placeholder("No missing values detected")
+    matrix = np.zeros((len(top_missing), int(missing.get("mask_rows", 0))), dtype=int)
+    for idx, col in enumerate(top_missing):
+        matrix[idx, missing["null_rows"].get(col, [])] = 1
+    fig = _figure((10, 4))
+    ax = fig.subplots()
+    ax.imshow(matrix, aspect="auto", interpolation="nearest")
+    ax.set_yticks(range(len(top_missing)), top_missing)
+    ax.set_xlabel("Row sample")
+    ax.set_title("Missing Data Heatmap (Top Columns)")
+    return _finalize_png(fig)
+
+
+def _plot_target_distribution(plot_data: dict) -> bytes:
+    target = plot_data.get("target_counts")
+    if not target:
+        return _placeholder("Target column unavailable", figsize=(8, 4))
+    labels = ["<NA>" if label is None else label for label in target["labels"]]
+    positions = range(len(labels))
+    fig = _figure((8, 4))
+    ax = fig.subplots()
+    ax.bar(positions, target["counts"], width=0.5)
+    ax.set_xticks(positions, labels, rotation=90)
+    ax.set_title(f"Target Distribution: {target['column']}")
+    ax.set_ylabel("Count")
+    return _finalize_png(fig)
+
+
+def _plot_feature_importance(importances: list[dict]) -> bytes:
+    if not importances:
+        return _placeholder("Feature importance unavailable", figsize=(8, 4))
+    labels = [item.get("feature", "") for item in importances[:10]]
+    scores = [float(item.get("score", 0.0)) for item in importances[:10]]
+    fig = _figure((8, 4))
+    ax = fig.subplots()
+    ax.barh(labels[::-1], scores[::-1])
+    ax.set_title("Top Predictive Features")
+    ax.set_xlabel("Signal Score")
+    return _finalize_png(fig)
+
+
+def _plot_numeric_distributions(plot_data: dict) -> bytes:
+    histograms = (plot_data.get("numeric_histograms") or [])[:NUMERIC_DISTRIBUTION_COLUMNS]
+    if not histograms:
+        return _placeholder("No numeric features")
+    fig = _figure((8, 2.2 * len(histograms)))
+    axes = fig.subplots(len(histograms), 1, squeeze=False)[:, 0]
+    for ax, histogram in zip(axes, histograms):
+        if histogram["edges"]:
+            ax.stairs(histogram["counts"], histogram["edges"], fill=True)
+        ax.set_title(histogram["column"])
+    return _finalize_png(fig)
+
+
+def _plot_correlation_heatmap(plot_data: dict) -> bytes:
+    correlation = plot_data.get("correlation")
+    if not correlation:
+        return _placeholder("No numeric features")
+    subset = correlation["columns"]
+    matrix = np.array(
+        [[np.nan if value is None else value for value in row] for row in correlation["matrix"]],
+        dtype=float,
+    )
+    fig = _figure((8, 6))
+    ax = fig.subplots()
+    ax.imshow(matrix, interpolation="nearest")
+    ax.set_xticks(range(len(subset)), subset, rotation=90, fontsize=7)
+    ax.set_yticks(range(len(subset)), subset, fontsize=7)
+    ax.set_title("Correlation Heatmap (Top Numeric Features)")
+    return _finalize_png(fig)
+
+
+_RENDERERS = {
+    "missing_heatmap": _plot_missing_heatmap,
+    "target_distribution": _plot_target_distribution,
+    "feature_importance": _plot_feature_importance,
+    "numeric_distribution": _plot_numeric_distributions,
+    "correlation_heatmap": _plot_correlation_heatmap,
+}
+
+
+def _render(plot_name: str, source: Any) -> bytes:
+    return _RENDERERS[plot_name](source)
+
+
+def _warm_render_worker() -> None:
+    """Pay matplotlib's import, Agg backend and font cache costs before the first plot."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    _placeholder("warm-up")
+
+
+def _render_worker_main(connection: Connection) -> None:
+    """Render plots sent over ``connection`` until it closes; errors go back as text."""
+    _warm_render_worker()
+    while True:
+        try:
+            task = connection.recv()
+        except EOFError:
+            return
+        if task is None:
+            return
+        name, source = task
+        try:
+            connection.send((True, _render(name, source)))
+        except Exception as exc:
+            connection.send((False, f"{type(exc).__name__}: {exc}"))
+
+
+class _RenderWorker:
+    """One warm render process rendering one plot at a time, so it can be killed on its own."""
+
+    def __init__(self, context) -> None:
+        self.connection, child = context.Pipe()
+        self.process = context.Process(target=_render_worker_main, args=(child,), daemon=True)
+        self.process.start()
+        child.close()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+    def stop(self) -> None:
+        try:
+            self.connection.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.connection.close()
+
+
+class _RenderPool:
+    """Fixed number of render workers handed out one plot at a time.
+
+    A plot only gets a worker once one is idle, so its timeout runs from when it
+    starts rendering, not from when it was queued. A worker that hangs or dies is
+    killed and replaced without touching the plots other workers are rendering.
+    """
+
+    def __init__(self, workers: int) -> None:
+        self._context = multiprocessing.get_context("spawn")
+        self._size = workers
+        self._idle: list[_RenderWorker] = []
+        self._busy: set[_RenderWorker] = set()
+        self._closed = False
+        self._available = threading.Condition()
+        # Start (and warm) every worker now rather than on the first upload.
+        for _ in range(workers):
+            self._idle.append(_RenderWorker(self._context))
+
+    def checkout(self, block: bool) -> _RenderWorker | None:
+        """An idle worker, or ``None`` if none freed up within one poll interval."""
+        with self._available:
+            if not self._idle and len(self._busy) >= self._size and block:
+                self._available.wait(timeout=_RENDER_SLOT_POLL_SECONDS)
+            if self._closed:
+                raise RuntimeError("render pool is shut down")
+            if self._idle:
+                worker = self._idle.pop()
+            elif len(self._busy) < self._size:
+                worker = _RenderWorker(self._context)
+            else:
+                return None
+            self._busy.add(worker)
+            return worker
+
+    def checkin(self, worker: _RenderWorker) -> None:
+        with self._available:
+            self._busy.discard(worker)
+            if self._closed:
+                worker.stop()
+                return
+            self._idle.append(worker)
+            self._available.notify()
+
+    def discard(self, worker: _RenderWorker) -> None:
+        """Kill ``worker``; a fresh one takes its place on the next checkout."""
+        worker.kill()
+        with self._available:
+            self._busy.discard(worker)
+            self._available.notify()
+
+    def shutdown(self) -> None:
+        with self._available:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            busy = list(self._busy)
+            self._available.notify_all()
+        for worker in idle:
+            worker.stop()
+        # Their renders see the pipe close and discard them.
+        for worker in busy:
+            worker.process.kill()
+
+
+def start_render_pool(workers: int = DEFAULT_PLOT_WORKERS) -> _RenderPool | None:
+    """Create the shared render pool (once) and start its workers; ``workers <= 0`` renders inline.
+
+    The first call fixes the pool size; later calls return the existing pool.
+    """
+    global _render_pool, _render_pool_workers
+    with _render_pool_lock:
+        if _render_pool_workers is None:
+            _render_pool_workers = max(int(workers), 0)
+        if _render_pool is None and _render_pool_workers:
+            _render_pool = _RenderPool(_render_pool_workers)
+        return _render_pool
+
+
+def shutdown_render_pool() -> None:
+    global _render_pool, _render_pool_workers
+    with _render_pool_lock:
+        pool, _render_pool, _render_pool_workers = _render_pool, None, None
+    if pool is not None:
+        pool.shutdown()
+
+
+def _legacy_plot_data(file_path: str, target_column: str | None) -> dict:
+    """Aggregates for reports stored before ``plot_data`` existed, from the first rows of the file."""
+    df, _ = load_dataframe(file_path, nrows=PLOT_SAMPLE_ROWS)
+    return build_plot_data(df.head(PLOT_SAMPLE_ROWS), target_column)
+
+
+def _plot_sources(
+    file_path: str,
+    report: dict,
+    target_column: str | None,
+    plot_names: set[str],
+) -> dict[str, Any]:
+    """What each plot is drawn from: the top predictive features, or the report's plot aggregates."""
+    plot_data = report.get("plot_data")
+    if not isinstance(plot_data, dict) and plot_names - {"feature_importance"}:
+        plot_data = _legacy_plot_data(file_path, target_column)
+    plot_data = plot_data or {}
+    target_diagnostics = report.get("target_diagnostics", {})
     importances = (
-        report.get("target_diagnostics", {}).get("top_predictive_features", [])
-        if isinstance(report.get("target_diagnostics", {}), dict)
+        target_diagnostics.get("top_predictive_features", [])
+        if isinstance(target_diagnostics, dict)
         else []
     )
+    return {name: importances if name == "feature_importance" else plot_data for name in plot_names}
+
+
+def _feature_importance_series(importances: list[dict]) -> dict[str, Any] | None:
     if not importances:
-        plt.text(0.5, 0.5, "Feature importance unavailable", ha="center", va="center")
-        plt.axis("off")
-        return _finalize_png(plt)
+        return None
+    return {
+        "features": [item.get("feature", "") for item in importances[:10]],
+        "scores": [float(item.get("score", 0.0)) for item in importances[:10]],
+    }
 
-    labels = [item.get("feature", "") for item in importances[:10]]
-    scores = [float(item.get("score", 0.0)) for item in importances[:10]]
-    plt.barh(labels[::-1], scores[::-1])
-    plt.title("Top Predictive Features")
-    plt.xlabel("Signal Score")
-    return _finalize_png(plt)
-
-
-def _plot_numeric_distributions(df: pd.DataFrame) -> bytes:
-    plt = _get_plt()
-    numeric_cols = df.select_dtypes(include="number").columns.tolist()[:4]
-    if not numeric_cols:
-        plt.figure(figsize=(8, 3))
-        plt.text(0.5, 0.5, "No numeric features", ha="center", va="center")
-        plt.axis("off")
-        return _finalize_png(plt)
-    fig, axes = plt.subplots(len(numeric_cols), 1, figsize=(8, 2.2 * len(numeric_cols)))
-    if len(numeric_cols) == 1:
-        axes = [axes]
-    for idx, col in enumerate(numeric_cols):
-        axes[idx].hist(df[col].dropna().values, bins=30)
-        axes[idx].set_title(col)
-    return _finalize_png(plt)
-
-
-def _plot_correlation_heatmap(df: pd.DataFrame) -> bytes:
-    plt = _get_plt()
-    numeric = df.select_dtypes(include="number")
-    if numeric.empty:
-        plt.figure(figsize=(8, 3))
-        plt.text(0.5, 0.5, "No numeric features", ha="center", va="center")
-        plt.axis("off")
-        return _finalize_png(plt)
-    corr = numeric.corr(numeric_only=True).abs()
-    subset = corr.mean().sort_values(ascending=False).head(20).index.tolist()
-    matrix = corr.loc[subset, subset]
-    plt.figure(figsize=(8, 6))
-    plt.imshow(matrix.values, interpolation="nearest")
-    plt.xticks(range(len(subset)), subset, rotation=90, fontsize=7)
-    plt.yticks(range(len(subset)), subset, fontsize=7)
-    plt.title("Correlation Heatmap (Top Numeric Features)")
-    return _finalize_png(plt)
+
+def _numeric_distribution_series(plot_data: dict) -> dict[str, Any] | None:
+    histograms = plot_data.get("numeric_histograms") or []
+    return {"histograms": histograms} if histograms else None
+
+
+def _missing_heatmap_series(plot_data: dict) -> dict[str, Any] | None:
+    missing = plot_data.get("missing") or {}
+    return missing if missing.get("columns") else None
+
+
+_SERIES = {
+    "missing_heatmap": _missing_heatmap_series,
+    "target_distribution": lambda plot_data: plot_data.get("target_counts"),
+    "feature_importance": _feature_importance_series,
+    "numeric_distribution": _numeric_distribution_series,
+    "correlation_heatmap": lambda plot_data: plot_data.get("correlation"),
+}
+
+
+def plot_series(
+    file_path: str,
+    report: dict,
+    target_column: str | None,
+    plot_name: str,
+) -> dict[str, Any] | None:
+    """The numbers behind one plot, for clients that draw it themselves.
+
+    Same source as the PNG, without rendering: labels/counts, histogram edges and
+    counts (every histogrammed column, not only the ones the PNG shows), the
+    correlation submatrix (``None`` where undefined) or the missing-value mask.
+    ``None`` where the PNG would show a placeholder.
+    """
+    if plot_name not in PLOT_NAMES:
+        raise ValueError(f"Unsupported plot '{plot_name}'")
+    source = _plot_sources(file_path, report, target_column, {plot_name})[plot_name]
+    return _SERIES[plot_name](source)
 
 
 def generate_plot_bytes(
@@ -130,6 +370,8 @@ def generate_plot_bytes(
     target_column: str | None,
     plot_name: str,
 ) -> bytes:
+    if plot_name not in PLOT_NAMES:
+        raise ValueError(f"Unsupported plot '{plot_name}'")
     generated = generate_all_plot_bytes(
         file_path=file_path,
         report=report,
@@ -137,7 +379,7 @@ def generate_plot_bytes(
         requested_plot_names={plot_name},
     )
     if plot_name not in generated:
-        raise ValueError(f"Unsupported plot '{plot_name}'")
+        raise RuntimeError(f"plot_render_failed: {plot_name}")
     return generated[plot_name]
 
 
@@ -147,21 +389,76 @@ def generate_all_plot_bytes(
     target_column: str | None,
     requested_plot_names: set[str] | None = None,
 ) -> dict[str, bytes]:
+    """Render the requested plots from ``report["plot_data"]``, concurrently on the render pool.
+
+    Only reports that predate ``plot_data`` fall back to reading ``file_path``. A
+    plot that fails is logged and left out of the result. So is one still rendering
+    ``PLOT_RENDER_TIMEOUT_SECONDS`` after it got a worker; that worker alone is
+    killed and replaced, so a hung render neither holds on to a worker nor takes
+    down plots rendering elsewhere.
+    """
     plot_names = requested_plot_names or PLOT_NAMES
     unsupported = [name for name in plot_names if name not in PLOT_NAMES]
     if unsupported:
         raise ValueError(f"Unsupported plot type(s): {unsupported}")
+    _require_matplotlib()
+    sources = _plot_sources(file_path, report, target_column, plot_names)
 
-    df, _ = load_tolerant_csv(file_path, nrows=120_000)
     output: dict[str, bytes] = {}
-    if "missing_heatmap" in plot_names:
-        output["missing_heatmap"] = _plot_missing_heatmap(df)
-    if "target_distribution" in plot_names:
-        output["target_distribution"] = _plot_target_distribution(df, target_column)
-    if "feature_importance" in plot_names:
-        output["feature_importance"] = _plot_feature_importance(report)
-    if "numeric_distribution" in plot_names:
-        output["numeric_distribution"] = _plot_numeric_distributions(df)
-    if "correlation_heatmap" in plot_names:
-        output["correlation_heatmap"] = _plot_correlation_heatmap(df)
+    pool = start_render_pool()
+    if pool is None:
+        for name in sorted(plot_names):
+            try:
+                output[name] = _render(name, sources[name])
+            except Exception:
+                logger.exception("plot %s failed to render", name)
+        return output
+
+    pending = sorted(plot_names)
+    running: dict[Connection, tuple[str, _RenderWorker, float]] = {}
+    while pending or running:
+        while pending:
+            try:
+                worker = pool.checkout(block=not running)
+            except RuntimeError:
+                logger.exception("plot %s could not be submitted", pending[0])
+                pending.pop(0)
+                continue
+            if worker is None:
+                break
+            name = pending.pop(0)
+            try:
+                worker.connection.send((name, sources[name]))
+            except OSError:
+                logger.exception("plot %s could not be submitted", name)
+                pool.discard(worker)
+                continue
+            running[worker.connection] = (name, worker, time.monotonic())
+        if not running:
+            continue
+
+        oldest = min(started for _, _, started in running.values())
+        timeout = max(oldest + PLOT_RENDER_TIMEOUT_SECONDS - time.monotonic(), 0.0)
+        if pending:
+            timeout = min(timeout, _RENDER_SLOT_POLL_SECONDS)
+        for connection in wait(list(running), timeout=timeout):
+            name, worker, _ = running.pop(connection)
+            try:
+                ok, payload = connection.recv()
+            except (EOFError, OSError):
+                logger.error("plot %s lost its render worker", name)
+                pool.discard(worker)
+                continue
+            pool.checkin(worker)
+            if ok:
+                output[name] = payload
+            else:
+                logger.error("plot %s failed to render: %s", name, payload)
+
+        now = time.monotonic()
+        for connection, (name, worker, started) in list(running.items()):
+            if now - started > PLOT_RENDER_TIMEOUT_SECONDS:
+                logger.error("plot %s timed out after %.0fs", name, PLOT_RENDER_TIMEOUT_SECONDS)
+                del running[connection]
+                pool.discard(worker)
     return output
@@ -15,11 +15,7 @@ from ...services.dataset_service import (
     get_dataset_status,
     get_datasets_for_user,
 )
-from ...utils.file_validation import (
-    validate_csv_structure,
-    validate_file_extension,
-    validate_file_size,
-)
+from ...utils.file_validation import validate_file_extension
 from ...workers.analysis_worker import process_dataset
 
 router = APIRouter(prefix="/datasets", tags=["datasets"])
@@ -33,6 +29,7 @@ def upload_dataset(
     name: str | None = Form(default=None),
     dataset_name: str | None = Form(default=None),
     target_column: str | None = Form(default=None),
+    render_plots: bool = Form(default=True),
     db: Session = Depends(get_db),
 ):
     resolved_name = (dataset_name or name or "").strip()
@@ -41,9 +38,8 @@ def upload_dataset(
     resolved_target = (target_column or "").strip()
 
     validate_file_extension(file)
-    validate_file_size(file)
-    validate_csv_structure(file)
 
+    # Size, emptiness, hashing and row counting happen while the file streams to disk.
     dataset = create_dataset(
         db=db,
         file=file,
@@ -51,6 +47,7 @@ def upload_dataset(
         target_column=resolved_target or None,
         user_id=context.user_id,
         session_id=context.session_id,
+        render_plots=render_plots,
     )
 
     background_tasks.add_task(process_dataset, dataset.id)
@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import Response
+from fastapi.responses import JSONResponse, Response
 from sqlalchemy.orm import Session
 
-from ...analysis_engine.visualization_engine import PLOT_NAMES
+from ...analysis_engine.visualization_engine import PLOT_NAMES, plot_series
 from ...core.dependencies import RequestContext, get_request_context
 from ...db.session import get_db
 from ...services.plot_manager import ensure_single_plot_for_dataset, get_plot_image_bytes
@@ -11,13 +11,7 @@ from ...services.report_service import get_authorized_report
 router = APIRouter(prefix="/plots", tags=["plots"])
 
 
-@router.get("/{dataset_id}/{plot_type}")
-def fetch_plot(
-    dataset_id: str,
-    plot_type: str,
-    context: RequestContext = Depends(get_request_context),
-    db: Session = Depends(get_db),
-):
+def _completed_report(db: Session, context: RequestContext, dataset_id: str, plot_type: str):
     if plot_type not in PLOT_NAMES:
         raise HTTPException(
             status_code=404,
@@ -37,6 +31,43 @@ def fetch_plot(
         raise HTTPException(status_code=403, detail="Access denied")
     if dataset.status != "completed" or not report:
         raise HTTPException(status_code=400, detail="Analysis not completed")
+    return dataset, report
+
+
+@router.get("/{dataset_id}/{plot_type}/data")
+def fetch_plot_data(
+    dataset_id: str,
+    plot_type: str,
+    context: RequestContext = Depends(get_request_context),
+    db: Session = Depends(get_db),
+):
+    dataset, report = _completed_report(db, context, dataset_id, plot_type)
+
+    try:
+        data = plot_series(
+            file_path=dataset.file_path,
+            report=report.report_json if isinstance(report.report_json, dict) else {},
+            target_column=dataset.target_column,
+            plot_name=plot_type,
+        )
+    except Exception:
+        raise HTTPException(status_code=500, detail="Plot data unavailable")
+
+    return JSONResponse(
+        content={"dataset_id": dataset_id, "plot_type": plot_type, "data": data},
+        # Per-user data behind auth: browsers may cache it, shared caches must not.
+        headers={"Cache-Control": "private, max-age=86400"},
+    )
+
+
+@router.get("/{dataset_id}/{plot_type}")
+def fetch_plot(
+    dataset_id: str,
+    plot_type: str,
+    context: RequestContext = Depends(get_request_context),
+    db: Session = Depends(get_db),
+):
+    dataset, report = _completed_report(db, context, dataset_id, plot_type)
 
     image_bytes = get_plot_image_bytes(db, dataset_id, plot_type)
     if not image_bytes:
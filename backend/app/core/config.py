@@ -13,6 +13,37 @@ class Settings(BaseSettings):
     CORS_ALLOW_ORIGIN_REGEX: str = (
         r"https?://(localhost|127\.0\.0\.1)(:\d+)?|https://.*\.vercel\.app"
     )
+    ANALYSIS_MAX_WORKERS: int = 4
+    ANALYSIS_STAGE_TIMEOUT_SECONDS: float = 600.0
+    # "thread" or "process": where model simulation runs; a process is killed on stage timeout.
+    ANALYSIS_HEAVY_STAGE_EXECUTOR: str = "thread"
+    # Adds tracemalloc deltas to report["performance"]; slows analysis noticeably.
+    ANALYSIS_TRACE_MEMORY: bool = False
+    # Files at or above this size are analyzed in chunks instead of loaded whole.
+    ANALYSIS_CHUNKED_THRESHOLD_MB: int = 64
+    ANALYSIS_CHUNK_ROWS: int = 100_000
+    ANALYSIS_CHUNKED_SAMPLE_ROWS: int = 100_000
+    # Distinct counts above this many rows are HyperLogLog estimates with this relative error.
+    ANALYSIS_DISTINCT_EXACT_MAX_ROWS: int = 1_000_000
+    ANALYSIS_DISTINCT_RELATIVE_ERROR: float = 0.01
+    # Mutual information estimator: "knn", "histogram", or "auto" (histogram on large frames).
+    ANALYSIS_SIGNAL_ENGINE: str = "auto"
+    # Baseline models: "hist_gradient_boosting" (fast default) or "forest" (random forest + logistic regression).
+    ANALYSIS_SIMULATION_ENGINE: str = "hist_gradient_boosting"
+    # "adaptive" grows the training sample until the validation score settles; "fixed" uses it all.
+    ANALYSIS_SIMULATION_SAMPLING: str = "adaptive"
+    ANALYSIS_SIMULATION_TIME_BUDGET_SECONDS: float = 120.0
+    # "holdout" (one 80/20 split) or "cross_validation" (out-of-bag forests, k-fold on this many jobs).
+    ANALYSIS_SIMULATION_VALIDATION: str = "holdout"
+    ANALYSIS_SIMULATION_CV_JOBS: int = -1
+    # Model simulation and mutual information run in a separate worker process under these
+    # limits (0 disables a limit) and report "resource_limit_exceeded" when they pass one.
+    ANALYSIS_ISOLATE_HEAVY_STAGES: bool = True
+    ANALYSIS_ISOLATION_CPU_COUNT: int = 2
+    ANALYSIS_ISOLATION_MEMORY_MB: float = 4096.0
+    ANALYSIS_ISOLATION_WALL_SECONDS: float = 300.0
+    # Pre-warmed processes rendering report plots concurrently; 0 renders them inline.
+    ANALYSIS_PLOT_WORKERS: int = 5
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
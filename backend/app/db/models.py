@@ -1,8 +1,8 @@
 import uuid
 
-from sqlalchemy import Column, DateTime, Integer, LargeBinary, String, UniqueConstraint
+from sqlalchemy import Boolean, Column, DateTime, Integer, LargeBinary, String, UniqueConstraint
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, true
 from sqlalchemy import ForeignKey, JSON
 
 
@@ -23,10 +23,13 @@ class Dataset(Base):
     session_id = Column(String, nullable=True)
     name = Column(String, nullable=False)
     file_path = Column(String, nullable=False)
+    content_hash = Column(String, nullable=True, index=True)
     status = Column(String, default="processing")
     target_column = Column(String, nullable=True)
     rows = Column(Integer, nullable=True)
     columns = Column(Integer, nullable=True)
+    # False when the client draws plots itself from /plots/{id}/{type}/data.
+    render_plots = Column(Boolean, nullable=False, default=True, server_default=true())
 
     created_at = Column(
         DateTime(timezone=True),
@@ -34,6 +34,8 @@ def ensure_datasets_table_columns(engine: Engine) -> None:
         existing = {col["name"] for col in inspector.get_columns("datasets")}
         required_sql = {
             "target_column": "ALTER TABLE datasets ADD COLUMN target_column VARCHAR",
+            "content_hash": "ALTER TABLE datasets ADD COLUMN content_hash VARCHAR",
+            "render_plots": "ALTER TABLE datasets ADD COLUMN render_plots BOOLEAN NOT NULL DEFAULT TRUE",
         }
 
         for name, ddl in required_sql.items():
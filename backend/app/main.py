@@ -1,9 +1,11 @@
 import re
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import Response
 
+from .analysis_engine.visualization_engine import shutdown_render_pool, start_render_pool
 from .api.routes.dataset_routes import router as dataset_router
 from .api.routes.plot_routes import router as plot_router
 from .api.routes.report_routes import router as report_router
@@ -16,7 +18,16 @@ from .db.session import engine
 
 setup_logging()
 
-app = FastAPI(title="SentinelAI API")
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    # Plot workers load matplotlib and fonts now rather than on the first analysis.
+    start_render_pool(settings.ANALYSIS_PLOT_WORKERS)
+    yield
+    shutdown_render_pool()
+
+
+app = FastAPI(title="SentinelAI API", lifespan=lifespan)
 
 app.add_middleware(RequestLoggingMiddleware)
 
@@ -1,7 +1,12 @@
 from sqlalchemy.orm import Session
 
 from ..db.models import AnalysisPlot, Dataset, Report
-from ..storage.file_storage import delete_file, save_uploaded_file
+from ..storage.file_storage import (
+    delete_unreferenced_file,
+    discard_upload,
+    publish_upload,
+    save_uploaded_file,
+)
 from ..utils.dataframe_loader import extract_dataset_metadata
 import logging
 
@@ -13,29 +18,53 @@ def create_dataset(
     target_column: str | None,
     user_id=None,
     session_id=None,
+    render_plots: bool = True,
 ):
-    dataset_id, path = save_uploaded_file(file)
+    dataset_id, path, content_hash, scan = save_uploaded_file(file)
 
-    rows, columns = extract_dataset_metadata(path)
+    try:
+        rows, columns = extract_dataset_metadata(scan)
+    except Exception:
+        discard_upload(dataset_id, path)
+        raise
 
     dataset = Dataset(
         id=dataset_id,
         name=dataset_name,
         file_path=path,
+        content_hash=content_hash,
         target_column=target_column,
         user_id=user_id,
         session_id=session_id,
         rows=rows,
         columns=columns,
+        render_plots=render_plots,
         status="uploaded",
     )
 
     db.add(dataset)
-    db.commit()
+    try:
+        db.commit()
+    except Exception:
+        discard_upload(dataset_id, path)
+        raise
+    # Only now that the row is visible to concurrent deletes does the blob get published.
+    publish_upload(dataset_id, path)
     db.refresh(dataset)
     return dataset
 
 
+def release_dataset_file(db: Session, path: str, dataset_id: str | None = None) -> None:
+    # Uploads are content-addressed: only remove the blob once no other dataset references it.
+    def is_referenced() -> bool:
+        query = db.query(Dataset).filter(Dataset.file_path == path)
+        if dataset_id:
+            query = query.filter(Dataset.id != dataset_id)
+        return query.count() > 0
+
+    delete_unreferenced_file(path, is_referenced)
+
+
 def get_datasets_for_user(
     db,
     user_id,
@@ -132,11 +161,12 @@ def delete_dataset(
     for plot in plots:
         db.delete(plot)
 
-    # Delete file from storage.
-    delete_file(dataset.file_path)
-
+    file_path = dataset.file_path
     db.delete(dataset)
     db.commit()
 
+    # Delete file from storage unless another dataset shares the same content.
+    release_dataset_file(db, file_path, dataset_id)
+
 
     return "deleted"
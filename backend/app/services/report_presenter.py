@@ -18,6 +18,7 @@ def build_report_view(
             "created_at": str(dataset.created_at) if getattr(dataset, "created_at", None) else None,
             "status": getattr(dataset, "status", None),
             "target_column": getattr(dataset, "target_column", None),
+            "render_plots": getattr(dataset, "render_plots", True) is not False,
         },
         "sentinel_score": score,
         "dataset_difficulty": score_v2_meta.get("dataset_difficulty"),
@@ -39,5 +40,6 @@ def build_report_view(
             "model_simulation": payload.get("model_simulation", {}),
             "structural_risk": payload.get("structural_risk", {}),
             "recommendations": payload.get("recommendations", {}),
+            "performance": payload.get("performance", {}),
         },
     }
@@ -1,7 +1,15 @@
+import hashlib
+import json
 import logging
+import os
 import uuid
-import shutil
 from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+
+from ..utils.csv_ingestion import CsvRecordCounter
+from ..utils.file_validation import validate_csv_structure, validate_file_size
 
 _BACKEND_ROOT = Path(__file__).resolve().parent.parent.parent
 UPLOAD_DIR = _BACKEND_ROOT / "uploads"
@@ -9,34 +17,125 @@ UPLOAD_DIR = _BACKEND_ROOT / "uploads"
 UPLOAD_DIR.mkdir(exist_ok=True)
 logger = logging.getLogger(__name__)
 
+_COPY_CHUNK_BYTES = 1024 * 1024
+_HEAD_SAMPLE_BYTES = 1024 * 1024
+
+
+def _incoming_path(dataset_id: str, path: str) -> Path:
+    return UPLOAD_DIR / f".incoming-{dataset_id}{Path(path).suffix}"
+
 
 def save_uploaded_file(file):
+    """Stream an upload to disk once, validating, hashing and scanning it on the way.
+
+    Files are stored by content hash, so identical uploads share one blob (and its
+    columnar cache). The upload stays staged until ``publish_upload`` (or
+    ``discard_upload``), which callers run once the dataset row is committed.
+    Returns (dataset_id, blob path, sha256 hex digest, CsvRecordCounter).
+    """
 
     dataset_id = str(uuid.uuid4())
 
     extension = Path(file.filename).suffix.lower()
 
-    safe_filename = f"{dataset_id}{extension}"
+    incoming_path = UPLOAD_DIR / f".incoming-{dataset_id}{extension}"
+
+    counter = CsvRecordCounter(head_limit=_HEAD_SAMPLE_BYTES)
+    digest = hashlib.sha256()
+
+    try:
+        with incoming_path.open("wb") as buffer:
+            while chunk := file.file.read(_COPY_CHUNK_BYTES):
+                validate_file_size(counter.size_bytes + len(chunk))
+                counter.update(chunk)
+                digest.update(chunk)
+                buffer.write(chunk)
+
+        validate_csv_structure(counter.head)
+    except Exception:
+        incoming_path.unlink(missing_ok=True)
+        raise
+
+    content_hash = digest.hexdigest()
+    save_path = UPLOAD_DIR / f"{content_hash}{extension}"
+
+    return dataset_id, str(save_path), content_hash, counter
+
+
+def publish_upload(dataset_id: str, path: str) -> None:
+    """Move a staged upload to its blob path, unless an identical blob is already there.
+
+    Runs after the dataset row is committed: a concurrent ``delete_unreferenced_file``
+    either sees that row or has already moved the old blob away, so the path always
+    ends up backed by a file.
+    """
+    incoming_path = _incoming_path(dataset_id, path)
+    save_path = Path(path)
+    if save_path.exists():
+        incoming_path.unlink(missing_ok=True)
+    else:
+        incoming_path.replace(save_path)
 
-    save_path = UPLOAD_DIR / safe_filename
 
+def discard_upload(dataset_id: str, path: str) -> None:
+    _incoming_path(dataset_id, path).unlink(missing_ok=True)
 
-    with save_path.open("wb") as buffer:
 
-        shutil.copyfileobj(
+def columnar_cache_paths(path: str) -> tuple[Path, Path]:
+    source = Path(path)
+    return source.with_suffix(".feather"), source.with_suffix(".ingestion.json")
 
-            file.file,
 
-            buffer,
+def write_columnar_cache(path: str, df: pd.DataFrame, warnings: list[str]) -> bool:
+    """Persist a parsed upload as an uncompressed Feather file so later reads can mmap it.
+
+    Both files are written under unique temporary names and moved into place, the
+    warnings first, so concurrent analyses of one blob never share a temporary file
+    and a reader never sees a new Feather file next to half-written warnings.
+    """
+    try:
+        from pyarrow import feather
+    except Exception:
+        return False
+
+    cache_path, warnings_path = columnar_cache_paths(path)
+    token = uuid.uuid4().hex
+    tmp_cache_path = cache_path.with_name(f".{cache_path.name}.{token}.tmp")
+    tmp_warnings_path = warnings_path.with_name(f".{warnings_path.name}.{token}.tmp")
+    try:
+        tmp_warnings_path.write_text(json.dumps({"warnings": warnings}), encoding="utf-8")
+        feather.write_feather(df, str(tmp_cache_path), compression="uncompressed")
+        os.replace(tmp_warnings_path, warnings_path)
+        os.replace(tmp_cache_path, cache_path)
+        return True
+    except Exception:
+        logger.exception("columnar cache write failed for path=%s", path)
+        tmp_warnings_path.unlink(missing_ok=True)
+        tmp_cache_path.unlink(missing_ok=True)
+        return False
 
-            length=1024 * 1024
 
-        )
+def read_columnar_cache(path: str) -> tuple[pd.DataFrame, list[str]] | None:
+    cache_path, warnings_path = columnar_cache_paths(path)
+    try:
+        if not cache_path.exists() or not warnings_path.exists():
+            return None
+        if cache_path.stat().st_mtime < Path(path).stat().st_mtime:
+            return None
 
+        from pyarrow import feather
 
-    return dataset_id, str(save_path)
+        table = feather.read_table(str(cache_path), memory_map=True)
+        warnings = json.loads(warnings_path.read_text(encoding="utf-8")).get("warnings", [])
+        return table.to_pandas(), list(warnings)
+    except Exception:
+        logger.exception("columnar cache read failed for path=%s", path)
+        return None
 
 
+def _delete_columnar_cache(path: str) -> None:
+    for sidecar in columnar_cache_paths(path):
+        sidecar.unlink(missing_ok=True)
 
 
 def delete_file(path: str):
@@ -44,8 +143,43 @@ def delete_file(path: str):
     try:
 
         file_path = Path(path)
+        _delete_columnar_cache(path)
         if file_path.exists():
             file_path.unlink()
 
     except Exception:
         logger.exception("file delete failed for path=%s", path)
+
+
+def delete_unreferenced_file(path: str, is_referenced: Callable[[], bool]) -> None:
+    """Delete a shared blob unless ``is_referenced()`` reports a dataset still using it.
+
+    The blob is moved aside before the check is repeated. A dataset committed
+    after the first check, whose upload found the blob present, gets the file back
+    instead of pointing at a deleted one.
+    """
+    if is_referenced():
+        return
+
+    file_path = Path(path)
+    aside_path = file_path.with_name(f".deleting-{uuid.uuid4()}{file_path.suffix}")
+    try:
+        try:
+            file_path.replace(aside_path)
+        except FileNotFoundError:
+            aside_path = None
+
+        if is_referenced():
+            if aside_path is not None:
+                if file_path.exists():
+                    aside_path.unlink()
+                else:
+                    aside_path.replace(file_path)
+            return
+
+        if aside_path is not None:
+            aside_path.unlink()
+        # A blob published since then belongs to a newer upload; only its cache goes.
+        _delete_columnar_cache(path)
+    except Exception:
+        logger.exception("file delete failed for path=%s", path)
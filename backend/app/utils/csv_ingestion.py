@@ -1,11 +1,22 @@
 from __future__ import annotations
 
 import csv
+import io
+import logging
 from collections import Counter
+from warnings import WarningMessage, catch_warnings, simplefilter
 
+import numpy as np
 import pandas as pd
+from pandas.errors import ParserError, ParserWarning
+
+logger = logging.getLogger(__name__)
 
 _DELIMITER_CANDIDATES = [",", ";", "\t", "|"]
+_SCAN_CHUNK_BYTES = 1024 * 1024
+_QUOTE = ord('"')
+_NEWLINE = ord("\n")
+_CARRIAGE_RETURN = ord("\r")
 
 
 def _detect_primary_delimiter(header_line: str) -> str:
@@ -14,8 +25,149 @@ def _detect_primary_delimiter(header_line: str) -> str:
     return primary if occurrences > 0 else ","
 
 
-def inspect_csv_issues(file_path: str, max_lines: int = 2000) -> tuple[str, int, list[str]]:
-    with open(file_path, "r", encoding="utf-8", errors="replace", newline="") as handle:
+class CsvRecordCounter:
+    """Counts CSV records over byte chunks, ignoring newlines inside quoted fields.
+
+    Quoting follows pandas' C parser: a quote opens a quoted field only at the start
+    of a field (file start, after the delimiter or a line break); inside one, ``""``
+    is an escaped quote and a single quote closes it. Quotes anywhere else are
+    literal characters.
+    """
+
+    def __init__(self, head_limit: int = 64 * 1024) -> None:
+        self.size_bytes = 0
+        self.newlines = 0
+        self.head = b""
+        self.head_record_end = 0
+        self._head_limit = head_limit
+        self._in_quotes = False
+        self._last_byte = b""
+        self._delimiter: str | None = None
+        # Byte before the data still to scan, and a trailing quote run held back
+        # because the next chunk may continue it.
+        self._previous_byte = b""
+        self._carry = b""
+
+    def update(self, chunk: bytes) -> None:
+        if not chunk:
+            return
+        offset = self.size_bytes
+        head_part = max(self._head_limit - offset, 0)
+        self.size_bytes += len(chunk)
+        if head_part:
+            self.head += chunk[:head_part]
+        self._last_byte = chunk[-1:]
+        if self._delimiter is None and b"\n" in self.head:
+            first_line = self.head.split(b"\n", 1)[0].decode("utf-8", errors="replace")
+            self._delimiter = _detect_primary_delimiter(first_line)
+
+        start = offset - len(self._carry)
+        data = self._carry + chunk
+        self._carry = b""
+
+        if b'"' not in data:
+            if not self._in_quotes:
+                self.newlines += data.count(b"\n")
+                last = data.rfind(b"\n", 0, max(self._head_limit - start, 0))
+                if last >= 0:
+                    self.head_record_end = start + last + 1
+            self._previous_byte = data[-1:]
+            return
+
+        scanned = data.rstrip(b'"')
+        self._carry = data[len(scanned):]
+        if scanned:
+            self._scan(scanned, start)
+
+    def _field_start_bytes(self) -> np.ndarray:
+        delimiters = [self._delimiter] if self._delimiter else _DELIMITER_CANDIDATES
+        return np.array([ord(d) for d in delimiters] + [_NEWLINE, _CARRIAGE_RETURN], dtype=np.uint8)
+
+    def _scan(self, data: bytes, start: int) -> None:
+        values = np.frombuffer(data, dtype=np.uint8)
+        newline_positions = np.flatnonzero(values == _NEWLINE)
+        quote_positions = np.flatnonzero(values == _QUOTE)
+        if not quote_positions.size:
+            self._count_records(newline_positions if not self._in_quotes else newline_positions[:0], start)
+            self._previous_byte = data[-1:]
+            return
+
+        # Runs of consecutive quotes. Per run the quoted state changes as
+        #   odd length at a field start:      toggles (opens, or closes a field ending in a separator)
+        #   odd length elsewhere:             closes (or stays a literal outside quotes)
+        #   even length:                      unchanged ("" pairs are escapes / an empty field)
+        first_in_run = np.r_[True, np.diff(quote_positions) != 1]
+        run_starts = quote_positions[first_in_run]
+        run_lengths = np.diff(np.r_[np.flatnonzero(first_in_run), quote_positions.size])
+        before = values[np.maximum(run_starts - 1, 0)]
+        at_field_start = np.isin(before, self._field_start_bytes())
+        if run_starts[0] == 0:
+            at_field_start[0] = not self._previous_byte or self._previous_byte[0] in self._field_start_bytes()
+
+        odd = (run_lengths & 1).astype(bool)
+        toggles = np.cumsum(odd & at_field_start)
+        closes = odd & ~at_field_start
+        last_close = np.maximum.accumulate(np.where(closes, np.arange(run_starts.size), -1))
+        since_close = toggles - np.where(last_close >= 0, toggles[np.maximum(last_close, 0)], 0)
+        initial = np.where(last_close >= 0, False, self._in_quotes)
+        quoted_after_run = initial ^ (since_close & 1).astype(bool)
+
+        runs_before = np.searchsorted(run_starts, newline_positions)
+        inside = np.where(runs_before > 0, quoted_after_run[np.maximum(runs_before - 1, 0)], self._in_quotes)
+        self._count_records(newline_positions[~inside], start)
+        self._in_quotes = bool(quoted_after_run[-1])
+        self._previous_byte = data[-1:]
+
+    def _count_records(self, record_ends: np.ndarray, start: int) -> None:
+        self.newlines += int(record_ends.size)
+        in_head = record_ends[record_ends < self._head_limit - start]
+        if in_head.size:
+            self.head_record_end = start + int(in_head[-1]) + 1
+
+    def head_sample(self) -> bytes:
+        """Leading bytes cut at the last complete record (the whole file if it fit)."""
+        if self.size_bytes <= len(self.head):
+            return self.head
+        return self.head[: self.head_record_end]
+
+    def header_columns(self) -> tuple[str, int]:
+        text = self.head.decode("utf-8", errors="replace")
+        first_line = text.split("\n", 1)[0]
+        if not first_line.strip():
+            return ",", 0
+        delimiter = _detect_primary_delimiter(first_line)
+        header = next(csv.reader(io.StringIO(text, newline=""), delimiter=delimiter), [])
+        return delimiter, len(header)
+
+    def data_rows(self) -> int:
+        records = self.newlines
+        if self._last_byte and self._last_byte != b"\n":
+            records += 1
+        return max(records - 1, 0)
+
+
+def scan_csv(file_path: str, chunk_size: int = _SCAN_CHUNK_BYTES) -> tuple[int, int, int]:
+    """Single streaming pass returning (data rows, header columns, size in bytes)."""
+    counter = CsvRecordCounter()
+    with open(file_path, "rb") as handle:
+        while chunk := handle.read(chunk_size):
+            counter.update(chunk)
+    _, columns = counter.header_columns()
+    return counter.data_rows(), columns, counter.size_bytes
+
+
+def _open_text(source: str | bytes):
+    if isinstance(source, bytes):
+        return io.TextIOWrapper(io.BytesIO(source), encoding="utf-8", errors="replace", newline="")
+    return open(source, "r", encoding="utf-8", errors="replace", newline="")
+
+
+def _open_binary(source: str | bytes):
+    return io.BytesIO(source) if isinstance(source, bytes) else source
+
+
+def inspect_csv_issues(source: str | bytes, max_lines: int = 2000) -> tuple[str, int, list[str]]:
+    with _open_text(source) as handle:
         first_line = handle.readline()
         if not first_line:
             return ",", 0, ["CSV appears to be empty."]
@@ -71,8 +223,32 @@ def inspect_csv_issues(file_path: str, max_lines: int = 2000) -> tuple[str, int,
     return primary_delimiter, expected_columns, warnings
 
 
-def load_tolerant_csv(file_path: str, nrows: int | None = None) -> tuple[pd.DataFrame, list[str]]:
-    primary_delimiter, expected_columns, warnings = inspect_csv_issues(file_path)
+def _count_skipped_lines(caught: list[WarningMessage]) -> int:
+    skipped = 0
+    for item in caught:
+        if issubclass(item.category, ParserWarning):
+            skipped += str(item.message).count("Skipping line")
+    return skipped
+
+
+def _read_csv_fast(source: str | bytes, delimiter: str, nrows: int | None) -> tuple[pd.DataFrame, int]:
+    # The C tokenizer reports each bad line as a ParserWarning instead of calling back,
+    # so malformed rows are counted from the captured warnings.
+    with catch_warnings(record=True) as caught:
+        simplefilter("always", ParserWarning)
+        df = pd.read_csv(
+            _open_binary(source),
+            nrows=nrows,
+            low_memory=True,
+            encoding_errors="replace",
+            engine="c",
+            delimiter=delimiter,
+            on_bad_lines="warn",
+        )
+    return df, _count_skipped_lines(caught)
+
+
+def _read_csv_tolerant(source: str | bytes, delimiter: str, nrows: int | None) -> tuple[pd.DataFrame, int]:
     skipped_rows = 0
 
     def _on_bad_lines(_: list[str]) -> None:
@@ -81,14 +257,27 @@ def load_tolerant_csv(file_path: str, nrows: int | None = None) -> tuple[pd.Data
         return None
 
     df = pd.read_csv(
-        file_path,
+        _open_binary(source),
         nrows=nrows,
-        low_memory=True,
         encoding_errors="replace",
         engine="python",
-        delimiter=primary_delimiter,
+        delimiter=delimiter,
         on_bad_lines=_on_bad_lines,
     )
+    return df, skipped_rows
+
+
+def load_tolerant_csv(source: str | bytes, nrows: int | None = None) -> tuple[pd.DataFrame, list[str]]:
+    """Parse a CSV path (or an in-memory byte sample) and collect ingestion warnings."""
+    primary_delimiter, expected_columns, warnings = inspect_csv_issues(source)
+
+    # Fast path first; the python engine only runs when the C tokenizer cannot recover
+    # (e.g. unterminated quotes or oversized fields), not merely because rows are ragged.
+    try:
+        df, skipped_rows = _read_csv_fast(source, primary_delimiter, nrows)
+    except (ParserError, ValueError, OverflowError) as exc:
+        logger.info("fast csv parse failed, using tolerant parser: %s", exc)
+        df, skipped_rows = _read_csv_tolerant(source, primary_delimiter, nrows)
 
     if expected_columns and len(df.columns) != expected_columns:
         warnings.append(
@@ -98,3 +287,65 @@ def load_tolerant_csv(file_path: str, nrows: int | None = None) -> tuple[pd.Data
         warnings.append(f"Skipped {skipped_rows} malformed row(s) during parsing.")
 
     return df, warnings
+
+
+class CsvChunkReader:
+    """Iterate a CSV as DataFrame chunks under the same tolerance rules as ``load_tolerant_csv``.
+
+    Parser errors propagate; callers retry with ``engine="python"`` from the start.
+    ``warnings`` is complete once iteration has finished.
+    """
+
+    def __init__(self, source: str, chunk_rows: int = 100_000, engine: str = "c") -> None:
+        self.source = source
+        self.chunk_rows = chunk_rows
+        self.engine = engine
+        self.delimiter, self.expected_columns, self.warnings = inspect_csv_issues(source)
+        self.skipped_rows = 0
+        self.parsed_columns: int | None = None
+
+    def _reader(self):
+        if self.engine == "python":
+
+            def _on_bad_lines(_: list[str]) -> None:
+                self.skipped_rows += 1
+                return None
+
+            return pd.read_csv(
+                self.source,
+                chunksize=self.chunk_rows,
+                encoding_errors="replace",
+                engine="python",
+                delimiter=self.delimiter,
+                on_bad_lines=_on_bad_lines,
+            )
+        return pd.read_csv(
+            self.source,
+            chunksize=self.chunk_rows,
+            low_memory=True,
+            encoding_errors="replace",
+            engine="c",
+            delimiter=self.delimiter,
+            on_bad_lines="warn",
+        )
+
+    def __iter__(self):
+        with self._reader() as reader:
+            while True:
+                with catch_warnings(record=True) as caught:
+                    simplefilter("always", ParserWarning)
+                    try:
+                        chunk = next(reader)
+                    except StopIteration:
+                        break
+                self.skipped_rows += _count_skipped_lines(caught)
+                if self.parsed_columns is None:
+                    self.parsed_columns = len(chunk.columns)
+                yield chunk
+
+        if self.expected_columns and self.parsed_columns is not None and self.parsed_columns != self.expected_columns:
+            self.warnings.append(
+                f"Header suggests {self.expected_columns} column(s), parser produced {self.parsed_columns} column(s)."
+            )
+        if self.skipped_rows:
+            self.warnings.append(f"Skipped {self.skipped_rows} malformed row(s) during parsing.")
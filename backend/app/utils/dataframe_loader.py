@@ -1,10 +1,11 @@
 from fastapi import HTTPException
-from .csv_ingestion import load_tolerant_csv
+from .csv_ingestion import CsvRecordCounter, load_tolerant_csv
 
-def extract_dataset_metadata(path: str):
+def extract_dataset_metadata(scan: CsvRecordCounter):
 
     try:
-        df, _ = load_tolerant_csv(path, nrows=5000)
+        # Parse the head captured while streaming the upload instead of re-reading the file.
+        df, _ = load_tolerant_csv(scan.head_sample(), nrows=5000)
 
     except Exception:
 
@@ -15,10 +16,6 @@ def extract_dataset_metadata(path: str):
         )
 
 
-    # Count newline bytes to avoid platform text-decoding errors (e.g., cp1252 on Windows).
-    with open(path, "rb") as f:
-        rows = f.read().count(b"\n") - 1
-    if rows < 0:
-        rows = 0
+    rows = scan.data_rows()
     columns = len(df.columns)
     return rows, columns
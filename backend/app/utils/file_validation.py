@@ -3,6 +3,7 @@ from pathlib import Path
 from fastapi import HTTPException, UploadFile
 
 MAX_FILE_SIZE_MB = 100
+MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024
 ALLOWED_EXTENSIONS = {".csv"}
 
 
@@ -12,18 +13,12 @@ def validate_file_extension(file: UploadFile) -> None:
         raise HTTPException(status_code=400, detail="Only CSV files allowed")
 
 
-def validate_file_size(file: UploadFile) -> None:
-    file.file.seek(0, 2)
-    size = file.file.tell()
-    file.file.seek(0)
-
-    if size > MAX_FILE_SIZE_MB * 1024 * 1024:
+def validate_file_size(size: int) -> None:
+    # Called with the running byte count while the upload streams to disk.
+    if size > MAX_FILE_SIZE_BYTES:
         raise HTTPException(status_code=413, detail="File too large. Max size 100MB")
 
 
-def validate_csv_structure(file: UploadFile) -> None:
-    sample = file.file.read(4096)
-    file.file.seek(0)
-
+def validate_csv_structure(sample: bytes) -> None:
     if not sample:
         raise HTTPException(status_code=400, detail="CSV is empty")
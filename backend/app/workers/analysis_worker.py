@@ -1,14 +1,157 @@
+import copy
+import hashlib
+import json
 import logging
+import os
 
 from sqlalchemy.orm import Session
 
-from ..analysis_engine.pipeline import run_pipeline
-from ..db.models import Dataset, Report
+from ..analysis_engine.isolation import ResourceLimits
+from ..analysis_engine.instrumentation import StageTimer, log_stage_metrics
+from ..analysis_engine.pipeline import ENGINE_VERSION, run_pipeline
+from ..core.config import settings
+from ..db.models import AnalysisPlot, Dataset, Report
 from ..db.session import SessionLocal
 from ..services.plot_manager import upsert_plots_for_dataset
 logger = logging.getLogger(__name__)
 
 
+def _settings_fingerprint() -> str:
+    """Hash of the settings that change report contents (not just how fast it is produced)."""
+    content_settings = {
+        "chunked_threshold_mb": settings.ANALYSIS_CHUNKED_THRESHOLD_MB,
+        "chunk_rows": settings.ANALYSIS_CHUNK_ROWS,
+        "chunked_sample_rows": settings.ANALYSIS_CHUNKED_SAMPLE_ROWS,
+        "distinct_exact_max_rows": settings.ANALYSIS_DISTINCT_EXACT_MAX_ROWS,
+        "distinct_relative_error": settings.ANALYSIS_DISTINCT_RELATIVE_ERROR,
+        "signal_engine": settings.ANALYSIS_SIGNAL_ENGINE,
+        "simulation_engine": settings.ANALYSIS_SIMULATION_ENGINE,
+        "simulation_sampling": settings.ANALYSIS_SIMULATION_SAMPLING,
+        "simulation_time_budget_seconds": settings.ANALYSIS_SIMULATION_TIME_BUDGET_SECONDS,
+        "simulation_validation": settings.ANALYSIS_SIMULATION_VALIDATION,
+        # Limits decide whether heavy stages finish or report resource_limit_exceeded.
+        "isolate_heavy_stages": settings.ANALYSIS_ISOLATE_HEAVY_STAGES,
+        "isolation_cpu_count": settings.ANALYSIS_ISOLATION_CPU_COUNT,
+        "isolation_memory_mb": settings.ANALYSIS_ISOLATION_MEMORY_MB,
+        "isolation_wall_seconds": settings.ANALYSIS_ISOLATION_WALL_SECONDS,
+    }
+    encoded = json.dumps(content_settings, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+# Section reasons that say a run was cut short rather than describing the data.
+_DEGRADED_REASONS = (
+    "stage_timeout",
+    "stage_failed",
+    "resource_limit_exceeded",
+    "upstream_failed",
+    "signal_computation_failed",
+    "sklearn_unavailable",
+)
+
+
+def _is_degraded(report_json: dict) -> bool:
+    """Whether a report is missing results a fresh run could produce."""
+    if report_json.get("failed_analyzers") or report_json.get("failed_stages"):
+        return True
+    for section in report_json.values():
+        if not isinstance(section, dict):
+            continue
+        if str(section.get("reason", "")).startswith(_DEGRADED_REASONS):
+            return True
+        if section.get("signal_skipped"):
+            return True
+    return False
+
+
+def _find_reusable_report(db: Session, dataset: Dataset) -> tuple[Dataset, Report] | tuple[None, None]:
+    """Latest complete analysis of identical content and target on the current engine version and settings."""
+    if not dataset.content_hash:
+        return None, None
+
+    query = db.query(Dataset).filter(
+        Dataset.content_hash == dataset.content_hash,
+        Dataset.id != dataset.id,
+        Dataset.status == "completed",
+    )
+    if dataset.target_column:
+        query = query.filter(Dataset.target_column == dataset.target_column)
+    else:
+        query = query.filter(Dataset.target_column.is_(None))
+
+    fingerprint = _settings_fingerprint()
+    for source in query.order_by(Dataset.created_at.desc()).all():
+        report = (
+            db.query(Report)
+            .filter(Report.dataset_id == source.id)
+            .order_by(Report.created_at.desc())
+            .first()
+        )
+        report_json = report.report_json if report else None
+        if (
+            isinstance(report_json, dict)
+            and report_json.get("engine_version") == ENGINE_VERSION
+            and report_json.get("settings_fingerprint") == fingerprint
+            and not _is_degraded(report_json)
+        ):
+            return source, report
+    return None, None
+
+
+def _reuse_report(db: Session, dataset: Dataset, source: Dataset, source_report: Report) -> None:
+    report_json = copy.deepcopy(source_report.report_json)
+    # A flag only: the source dataset may belong to someone else.
+    report_json["reused"] = True
+
+    if dataset.render_plots is not False:
+        for plot in db.query(AnalysisPlot).filter(AnalysisPlot.dataset_id == source.id).all():
+            db.add(
+                AnalysisPlot(
+                    dataset_id=dataset.id,
+                    plot_type=plot.plot_type,
+                    image_data=plot.image_data,
+                )
+            )
+        db.flush()
+        # The source may not have rendered PNGs (render_plots off); draw the missing
+        # ones from the copied plot data.
+        report_json["available_plots"] = upsert_plots_for_dataset(
+            db=db,
+            dataset_id=dataset.id,
+            file_path=dataset.file_path,
+            report_json=report_json,
+            target_column=dataset.target_column,
+        )
+    else:
+        report_json["available_plots"] = []
+
+    db.add(
+        Report(
+            dataset_id=dataset.id,
+            report_json=report_json,
+            score=source_report.score,
+        )
+    )
+
+
+def _use_chunked_mode(file_path: str) -> bool:
+    try:
+        size = os.path.getsize(file_path)
+    except OSError:
+        return False
+    return size >= settings.ANALYSIS_CHUNKED_THRESHOLD_MB * 1024 * 1024
+
+
+def _isolation_limits() -> ResourceLimits | None:
+    if not settings.ANALYSIS_ISOLATE_HEAVY_STAGES:
+        return None
+    return ResourceLimits(
+        cpu_count=settings.ANALYSIS_ISOLATION_CPU_COUNT,
+        memory_mb=settings.ANALYSIS_ISOLATION_MEMORY_MB,
+        wall_seconds=settings.ANALYSIS_ISOLATION_WALL_SECONDS,
+    )
+
+
 def process_dataset(dataset_id: str) -> None:
     db: Session = SessionLocal()
     dataset: Dataset | None = None
@@ -21,19 +164,57 @@ def process_dataset(dataset_id: str) -> None:
         dataset.status = "processing"
         db.commit()
 
+        source, source_report = _find_reusable_report(db, dataset)
+        if source is not None:
+            logger.info(
+                "reusing report for dataset_id=%s from dataset_id=%s", dataset.id, source.id
+            )
+            _reuse_report(db, dataset, source, source_report)
+            dataset.status = "completed"
+            db.commit()
+            return
+
         report_json, score = run_pipeline(
             dataset.file_path,
             target_column=dataset.target_column,
+            max_workers=settings.ANALYSIS_MAX_WORKERS,
+            stage_timeout=settings.ANALYSIS_STAGE_TIMEOUT_SECONDS,
+            heavy_executor=settings.ANALYSIS_HEAVY_STAGE_EXECUTOR,
+            trace_memory=settings.ANALYSIS_TRACE_MEMORY,
+            chunked=_use_chunked_mode(dataset.file_path),
+            chunk_rows=settings.ANALYSIS_CHUNK_ROWS,
+            sample_rows=settings.ANALYSIS_CHUNKED_SAMPLE_ROWS,
+            distinct_exact_max_rows=settings.ANALYSIS_DISTINCT_EXACT_MAX_ROWS,
+            distinct_error=settings.ANALYSIS_DISTINCT_RELATIVE_ERROR,
+            signal_engine=settings.ANALYSIS_SIGNAL_ENGINE,
+            simulation_engine=settings.ANALYSIS_SIMULATION_ENGINE,
+            simulation_sampling=settings.ANALYSIS_SIMULATION_SAMPLING,
+            simulation_time_budget=settings.ANALYSIS_SIMULATION_TIME_BUDGET_SECONDS,
+            simulation_validation=settings.ANALYSIS_SIMULATION_VALIDATION,
+            simulation_cv_jobs=settings.ANALYSIS_SIMULATION_CV_JOBS,
+            isolation=_isolation_limits(),
         )
-        available_plots = upsert_plots_for_dataset(
-            db=db,
-            dataset_id=dataset.id,
-            file_path=dataset.file_path,
-            report_json=report_json if isinstance(report_json, dict) else {},
-            target_column=dataset.target_column,
-        )
+        # Clients that draw plots from /plots/{id}/{type}/data skip the PNGs here;
+        # fetching a PNG later (e.g. for an export) still renders it on demand.
+        if dataset.render_plots is not False:
+            timer = StageTimer().start()
+            available_plots = upsert_plots_for_dataset(
+                db=db,
+                dataset_id=dataset.id,
+                file_path=dataset.file_path,
+                report_json=report_json if isinstance(report_json, dict) else {},
+                target_column=dataset.target_column,
+            )
+            plot_metrics = timer.stop()
+            log_stage_metrics("plots", plot_metrics)
+            if isinstance(report_json, dict):
+                report_json["available_plots"] = available_plots
+                report_json.setdefault("performance", {}).setdefault("stages", {})["plots"] = plot_metrics
+        elif isinstance(report_json, dict):
+            report_json["available_plots"] = []
+
         if isinstance(report_json, dict):
-            report_json["available_plots"] = available_plots
+            report_json["settings_fingerprint"] = _settings_fingerprint()
 
         report = Report(
             dataset_id=dataset.id,
@@ -0,0 +1,78 @@
+"""Compare the fast C-engine ingestion path with the tolerant python-engine path.
+
+Run from ``backend/``:  python -m benchmarks.bench_csv_ingestion [--rows 500000]
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from app.utils.csv_ingestion import _read_csv_tolerant, inspect_csv_issues, load_tolerant_csv
+
+
+def _write_clean(path: Path, rows: int) -> None:
+    rng = np.random.default_rng(42)
+    pd.DataFrame(
+        {
+            "id": np.arange(rows),
+            "amount": rng.normal(100, 15, rows).round(3),
+            "count": rng.integers(0, 50, rows),
+            "city": rng.choice(["berlin", "paris", "rome", "oslo"], rows),
+            "label": rng.integers(0, 2, rows),
+        }
+    ).to_csv(path, index=False)
+
+
+def _write_malformed(path: Path, rows: int) -> None:
+    _write_clean(path, rows)
+    lines = path.read_text().splitlines()
+    # Every 1000th row gains an unquoted comma, every 5000th row loses a field.
+    for idx in range(10, len(lines), 1000):
+        lines[idx] = lines[idx] + ",extra"
+    for idx in range(20, len(lines), 5000):
+        lines[idx] = lines[idx].rsplit(",", 1)[0]
+    path.write_text("\n".join(lines) + "\n")
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, writer in (("clean", _write_clean), ("malformed", _write_malformed)):
+            path = Path(tmp) / f"{label}.csv"
+            writer(path, args.rows)
+            delimiter, _, _ = inspect_csv_issues(str(path))
+
+            fast_df, fast_warnings = load_tolerant_csv(str(path))
+            slow_df, slow_skipped = _read_csv_tolerant(str(path), delimiter, None)
+            assert fast_df.shape == slow_df.shape, (fast_df.shape, slow_df.shape)
+
+            fast = _time(lambda: load_tolerant_csv(str(path)), args.repeat)
+            slow = _time(lambda: _read_csv_tolerant(str(path), delimiter, None), args.repeat)
+            size_mb = path.stat().st_size / (1024 * 1024)
+            print(
+                f"{label:<10} size={size_mb:6.1f}MB rows={len(fast_df)} "
+                f"fast={fast:6.2f}s python={slow:6.2f}s speedup={slow / fast:5.1f}x "
+                f"skipped_python={slow_skipped} warnings={fast_warnings}"
+            )
+
+
+if __name__ == "__main__":
+    main()
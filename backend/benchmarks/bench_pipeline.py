@@ -0,0 +1,95 @@
+"""End-to-end run_pipeline wall time on a synthetic wide dataset.
+
+Run from ``backend/``:  python -m benchmarks.bench_pipeline [--rows 50000 --cols 300 --target]
+
+Per-stage wall/CPU time and memory of the last run are printed from report["performance"].
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from app.analysis_engine.pipeline import run_pipeline
+
+
+def build_wide_frame(rows: int, cols: int, seed: int = 42) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    data: dict[str, np.ndarray] = {}
+    for idx in range(cols):
+        kind = idx % 4
+        if kind == 0:
+            values = rng.normal(0, 1, rows)
+            values[rng.random(rows) < 0.05] = np.nan
+        elif kind == 1:
+            values = rng.integers(0, 1000, rows)
+        elif kind == 2:
+            values = rng.choice([f"cat_{i}" for i in range(20)], rows)
+        else:
+            values = rng.choice([f"val_{i}" for i in range(rows // 2)], rows)
+        data[f"f{idx}"] = values
+    data["customer_id"] = np.arange(rows)
+    data["target"] = rng.integers(0, 2, rows)
+    return pd.DataFrame(data)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--cols", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--target", action="store_true", help="run target-aware stages too")
+    parser.add_argument("--workers", type=int, default=4, help="1 gives clean per-stage memory figures")
+    parser.add_argument("--trace-memory", action="store_true", help="add tracemalloc deltas per stage")
+    parser.add_argument("--chunked", action="store_true", help="use the out-of-core chunked mode")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    warnings.simplefilter("ignore")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "wide.csv"
+        build_wide_frame(args.rows, args.cols).to_csv(path, index=False)
+        target = "target" if args.target else None
+
+        run_pipeline(str(path), target_column=target)  # warm the columnar cache
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            report, _ = run_pipeline(
+                str(path),
+                target_column=target,
+                max_workers=args.workers,
+                trace_memory=args.trace_memory,
+                chunked=args.chunked,
+            )
+            timings.append(time.perf_counter() - start)
+
+        print(
+            f"rows={args.rows} cols={args.cols + 2} target={bool(target)} chunked={args.chunked} "
+            f"best={min(timings):.2f}s mean={sum(timings) / len(timings):.2f}s "
+            f"failed={report.get('failed_analyzers')}"
+        )
+        stages = report["performance"]["stages"]
+        for name in sorted(stages, key=lambda key: stages[key].get("wall_seconds") or 0, reverse=True):
+            metrics = stages[name]
+            traced = ""
+            if "traced_delta_mb" in metrics:
+                traced = f" traced_delta={metrics['traced_delta_mb']}MB"
+            if "traced_peak_mb" in metrics:
+                traced += f" traced_peak={metrics['traced_peak_mb']}MB"
+            print(
+                f"  {name:<20} wall={metrics.get('wall_seconds')}s cpu={metrics.get('cpu_seconds')}s "
+                f"rss_delta={metrics.get('rss_delta_mb')}MB{traced}"
+            )
+        print(f"  process peak RSS {report['performance'].get('process_peak_rss_mb')}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Histogram vs k-NN mutual information for target diagnostics.
+
+Run from ``backend/``:  python -m benchmarks.bench_signal_engine [--rows 200000]
+
+Times both estimators on the same encoded synthetic frame (features with known
+signal, pure noise, low-cardinality integers and categoricals) and checks that they
+agree: per-feature absolute difference, rank correlation on the informative
+features, and how often they agree on the ``< 0.005`` low-signal cut.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from scipy.stats import spearmanr
+
+from app.analysis_engine.feature_encoding import encode_features
+from app.analysis_engine.mutual_information import histogram_mutual_info
+from app.analysis_engine.target_diagnostics import _classification_mi
+
+LOW_SIGNAL_THRESHOLD = 0.005
+
+
+def build_signal_frame(rows: int, classes: int = 3, seed: int = 42) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    target = rng.integers(0, classes, rows)
+    data: dict[str, np.ndarray] = {}
+    for idx in range(10):
+        data[f"signal_{idx}"] = target * (idx / 10) + rng.normal(size=rows)
+        data[f"noise_{idx}"] = rng.normal(size=rows)
+    for idx in range(5):
+        data[f"int_{idx}"] = rng.integers(0, 5, rows) + (target == 1) * (idx % 2)
+        letters = np.array(list("abcdefgh"))
+        data[f"cat_{idx}"] = np.where(
+            rng.random(rows) < 0.06 * idx,
+            letters[target % len(letters)],
+            rng.choice(letters[:4], rows),
+        )
+    data["target"] = target
+    return pd.DataFrame(data)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--classes", type=int, default=3)
+    args = parser.parse_args()
+
+    df = build_signal_frame(args.rows, args.classes)
+    encoded = encode_features(df, "target")
+    y = df["target"].to_numpy()
+
+    start = time.perf_counter()
+    knn = _classification_mi(encoded.matrix, y, encoded.numeric_feature_count)
+    knn_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    histogram = histogram_mutual_info(encoded.matrix, y, encoded.numeric_feature_count)
+    histogram_seconds = time.perf_counter() - start
+
+    informative = (knn >= LOW_SIGNAL_THRESHOLD) | (histogram >= LOW_SIGNAL_THRESHOLD)
+    rank = spearmanr(knn[informative], histogram[informative])[0] if informative.sum() > 2 else float("nan")
+    print(
+        f"rows={args.rows} features={len(encoded.feature_names)} "
+        f"knn={knn_seconds:.2f}s histogram={histogram_seconds:.3f}s "
+        f"speedup={knn_seconds / histogram_seconds:.0f}x"
+    )
+    print(
+        f"  max_abs_diff={np.abs(knn - histogram).max():.4f} "
+        f"spearman_informative={rank:.3f} "
+        f"low_signal_agreement={np.mean((knn < LOW_SIGNAL_THRESHOLD) == (histogram < LOW_SIGNAL_THRESHOLD)):.2f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import io
+
+import pandas as pd
+import pytest
+
+from app.utils.csv_ingestion import CsvRecordCounter
+
+
+def _count(data: bytes, chunk_size: int, head_limit: int = 64 * 1024) -> CsvRecordCounter:
+    counter = CsvRecordCounter(head_limit=head_limit)
+    for start in range(0, len(data), chunk_size):
+        counter.update(data[start : start + chunk_size])
+    return counter
+
+
+CASES = {
+    "stray_quote_in_unquoted_field": b'a,b\n1,12" pipe\n2,x\n3,y\n4,z\n',
+    "quote_inside_unquoted_field": b'a,b\n1,ab"cd\n2,"x"y\n3,z\n',
+    "quoted_newline": b'a,b\n1,"x\ny"\n2,z\n',
+    "doubled_quotes": b'a,b\n1,"he said ""hi"""\n2,""\n3,""""\n',
+    "crlf_with_quoted_newline": b'a,b\r\n1,"q\r\n"\r\n2,3\r\n',
+    "no_trailing_newline": b'a,b\n"1","2"\n"3\n4","5"',
+    "semicolon_delimiter": b'a;b\n1;"x;\n"\n2;3\n',
+}
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1 << 20])
+def test_data_rows_match_pandas(name, chunk_size):
+    data = CASES[name]
+    separator = ";" if name == "semicolon_delimiter" else ","
+    expected = len(pd.read_csv(io.BytesIO(data), sep=separator))
+
+    assert _count(data, chunk_size).data_rows() == expected
+
+
+def test_stray_quote_does_not_swallow_the_head_sample():
+    data = b'a,b\n1,12" pipe\n2,x\n3,y\n4,z\n' * 4
+    counter = _count(data, chunk_size=5, head_limit=24)
+
+    assert counter.head_sample() == b'a,b\n1,12" pipe\n2,x\n3,y\n'
+
+
+def test_head_sample_never_cuts_inside_a_quoted_field():
+    data = b'a,b\n1,"x\ny"\n2,z\n'
+    counter = _count(data, chunk_size=3, head_limit=10)
+
+    assert counter.head_sample() == b"a,b\n"
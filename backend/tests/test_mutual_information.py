@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+from scipy import sparse
+
+from app.analysis_engine.mutual_information import (
+    DEFAULT_MI_BINS,
+    _quantile_codes,
+    histogram_mutual_info,
+    resolve_signal_engine,
+)
+
+sklearn_metrics = pytest.importorskip("sklearn.metrics")
+feature_selection = pytest.importorskip("sklearn.feature_selection")
+
+
+def _one_hot(codes: np.ndarray) -> np.ndarray:
+    return np.eye(int(codes.max()) + 1)[codes]
+
+
+@pytest.fixture()
+def classification():
+    rng = np.random.default_rng(0)
+    rows = 2_000
+    y = rng.integers(0, 3, rows)
+    numeric = np.column_stack(
+        [
+            y + rng.normal(0, 0.5, rows),  # informative
+            rng.normal(0, 1, rows),  # noise
+            rng.integers(0, 3, rows).astype(float),  # few distinct values
+        ]
+    )
+    categories = np.where(rng.random(rows) < 0.7, y, rng.integers(0, 3, rows))
+    one_hot = np.column_stack([_one_hot(categories), _one_hot(rng.integers(0, 2, rows))])
+    return numeric, one_hot, y
+
+
+def test_one_hot_columns_match_sklearn_discrete_estimate(classification):
+    numeric, one_hot, y = classification
+    x = sparse.csr_matrix(np.hstack([numeric, one_hot]))
+
+    scores = histogram_mutual_info(x, y, numeric_feature_count=numeric.shape[1])
+    expected = feature_selection.mutual_info_classif(one_hot, y, discrete_features=True)
+
+    assert np.allclose(scores[numeric.shape[1] :], expected, atol=1e-12)
+
+
+def test_numeric_columns_match_binned_plug_in_estimate(classification):
+    numeric, _, y = classification
+
+    scores = histogram_mutual_info(sparse.csr_matrix(numeric), y, numeric_feature_count=numeric.shape[1])
+
+    for idx, score in enumerate(scores):
+        codes = _quantile_codes(numeric[:, idx], DEFAULT_MI_BINS)
+        plug_in = sklearn_metrics.mutual_info_score(codes, y)
+        # Miller-Madow: (occupied bins - 1)(classes - 1) / 2n.
+        correction = (len(np.unique(codes)) - 1) * (len(np.unique(y)) - 1) / (2 * len(y))
+        assert score == pytest.approx(max(plug_in - correction, 0.0), abs=1e-12)
+
+
+def test_numeric_scores_track_the_knn_estimator(classification):
+    numeric, _, y = classification
+
+    scores = histogram_mutual_info(sparse.csr_matrix(numeric), y, numeric_feature_count=numeric.shape[1])
+    knn = feature_selection.mutual_info_classif(numeric, y, discrete_features=False, random_state=0)
+
+    assert np.argmax(scores) == np.argmax(knn) == 0
+    assert scores[0] == pytest.approx(knn[0], rel=0.2)
+    assert scores[1] < 0.01
+
+
+def test_resolve_signal_engine():
+    assert resolve_signal_engine("knn", 10**7) == "knn"
+    assert resolve_signal_engine("histogram", 10) == "histogram"
+    assert resolve_signal_engine("auto", 10) == "knn"
+    assert resolve_signal_engine("auto", 10**6) == "histogram"
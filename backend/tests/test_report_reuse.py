@@ -0,0 +1,159 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.analysis_engine.pipeline import ENGINE_VERSION
+from app.analysis_engine.visualization_engine import PLOT_NAMES
+from app.db.models import AnalysisPlot, Base, Dataset, Report
+from app.workers.analysis_worker import _find_reusable_report, _reuse_report, _settings_fingerprint
+
+_NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture()
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine, autoflush=False)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def _report_json(**overrides):
+    report_json = {
+        "engine_version": ENGINE_VERSION,
+        "settings_fingerprint": _settings_fingerprint(),
+        "failed_analyzers": [],
+        "failed_stages": [],
+        "target_diagnostics": {"task_type": "classification"},
+        "model_simulation": {"baseline_score": 0.9},
+        "plot_data": {},
+    }
+    report_json.update(overrides)
+    return report_json
+
+
+def _completed(db, minutes_ago, report_json, target_column="label", user_id="owner"):
+    dataset = Dataset(
+        user_id=user_id,
+        name="d",
+        file_path="/tmp/d.csv",
+        content_hash="hash",
+        status="completed",
+        target_column=target_column,
+        created_at=_NOW - timedelta(minutes=minutes_ago),
+    )
+    db.add(dataset)
+    db.flush()
+    db.add(Report(dataset_id=dataset.id, report_json=report_json, score=80))
+    db.flush()
+    return dataset
+
+
+def _new_upload(db, target_column="label", render_plots=True):
+    dataset = Dataset(
+        user_id="someone-else",
+        name="d",
+        file_path="/tmp/d.csv",
+        content_hash="hash",
+        status="processing",
+        target_column=target_column,
+        render_plots=render_plots,
+        created_at=_NOW,
+    )
+    db.add(dataset)
+    db.flush()
+    return dataset
+
+
+def test_reuses_latest_complete_report(db):
+    _completed(db, 30, _report_json())
+    latest = _completed(db, 10, _report_json())
+
+    source, report = _find_reusable_report(db, _new_upload(db))
+
+    assert source.id == latest.id
+    assert report.dataset_id == latest.id
+
+
+@pytest.mark.parametrize(
+    "degraded",
+    [
+        {"failed_analyzers": ["outliers"]},
+        {"failed_stages": ["encoded_features"]},
+        {"model_simulation": {"skipped": True, "reason": "stage_timeout"}},
+        {"model_simulation": {"skipped": True, "reason": "stage_failed"}},
+        {"model_simulation": {"skipped": True, "reason": "resource_limit_exceeded", "limit": "memory"}},
+        {"model_simulation": {"skipped": True, "reason": "upstream_failed: task_type"}},
+        {"target_diagnostics": {"task_type": "classification", "signal_skipped": {"skipped": True}}},
+    ],
+)
+def test_skips_degraded_reports(db, degraded):
+    complete = _completed(db, 30, _report_json())
+    _completed(db, 10, _report_json(**degraded))
+
+    source, _ = _find_reusable_report(db, _new_upload(db))
+
+    assert source.id == complete.id
+
+
+def test_data_driven_skips_are_reusable(db):
+    # Skips that describe the dataset (not a cut-short run) are as good as a fresh run.
+    reusable = _completed(db, 10, _report_json(model_simulation={"skipped": True, "reason": "target_has_single_class"}))
+
+    source, _ = _find_reusable_report(db, _new_upload(db))
+
+    assert source.id == reusable.id
+
+
+@pytest.mark.parametrize(
+    "stale",
+    [{"engine_version": "0.0.0"}, {"settings_fingerprint": "other"}],
+)
+def test_skips_reports_from_other_versions_or_settings(db, stale):
+    _completed(db, 10, _report_json(**stale))
+
+    assert _find_reusable_report(db, _new_upload(db)) == (None, None)
+
+
+def test_requires_same_target(db):
+    _completed(db, 10, _report_json(), target_column="other")
+    _completed(db, 5, _report_json(), target_column=None)
+
+    assert _find_reusable_report(db, _new_upload(db)) == (None, None)
+
+
+def test_reuse_copies_plots_without_identifying_the_source(db):
+    source = _completed(db, 10, _report_json())
+    for plot_type in PLOT_NAMES:
+        db.add(AnalysisPlot(dataset_id=source.id, plot_type=plot_type, image_data=b"png"))
+    db.flush()
+    dataset = _new_upload(db)
+
+    _reuse_report(db, dataset, *_find_reusable_report(db, dataset))
+    db.flush()
+
+    report = db.query(Report).filter(Report.dataset_id == dataset.id).one()
+    assert report.report_json["reused"] is True
+    assert source.id not in str(report.report_json)
+    assert report.report_json["available_plots"] == sorted(PLOT_NAMES)
+    assert db.query(AnalysisPlot).filter(AnalysisPlot.dataset_id == dataset.id).count() == len(PLOT_NAMES)
+
+
+def test_reuse_skips_plots_when_rendering_is_off(db):
+    source = _completed(db, 10, _report_json())
+    db.add(AnalysisPlot(dataset_id=source.id, plot_type="missing_heatmap", image_data=b"png"))
+    db.flush()
+    dataset = _new_upload(db, render_plots=False)
+
+    _reuse_report(db, dataset, *_find_reusable_report(db, dataset))
+    db.flush()
+
+    report = db.query(Report).filter(Report.dataset_id == dataset.id).one()
+    assert report.report_json["available_plots"] == []
+    assert db.query(AnalysisPlot).filter(AnalysisPlot.dataset_id == dataset.id).count() == 0
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.analysis_engine.row_index import RowIndex
+
+
+def _frame_with_duplicates(rows: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(
+        {
+            "small_int": rng.integers(0, 4, rows),
+            "float": rng.choice([0.5, 1.5, np.nan], rows),
+            "text": rng.choice(["a", "b", None], rows),
+            "flag": rng.choice([True, False], rows),
+        }
+    )
+    # Exact copies of earlier rows on top of the collisions the small domains produce.
+    copies = df.sample(n=rows // 10, random_state=seed)
+    return pd.concat([df, copies], ignore_index=True)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_duplicate_count_matches_pandas(seed):
+    df = _frame_with_duplicates(2_000, seed)
+    index = RowIndex(df)
+
+    assert index.duplicate_count() == int(df.duplicated().sum())
+    assert index.duplicate_mask().tolist() == df.duplicated().tolist()
+
+
+def test_unique_rows_and_tiny_frames():
+    unique = pd.DataFrame({"id": np.arange(1_000), "value": np.arange(1_000) * 0.5})
+
+    assert RowIndex(unique).duplicate_count() == 0
+    assert RowIndex(unique.head(1)).duplicate_count() == 0
+    assert RowIndex(unique.head(0)).duplicate_count() == 0
+
+
+def test_column_order_matters():
+    # Same values in swapped columns are different rows.
+    df = pd.DataFrame({"a": [1, 2, 1], "b": [2, 1, 2]})
+
+    assert RowIndex(df).duplicate_count() == int(df.duplicated().sum()) == 1
@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.analysis_engine.sketches import DistinctCounter, HyperLogLog, KLLSketch, hash_series
+
+
+def _chunks(series: pd.Series, count: int) -> list[pd.Series]:
+    size = -(-len(series) // count)
+    return [series.iloc[start : start + size] for start in range(0, len(series), size)]
+
+
+def _random_hashes(count: int, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).integers(0, np.iinfo(np.uint64).max, size=count, dtype=np.uint64)
+
+
+@pytest.mark.parametrize("distinct", [100, 10_000, 300_000])
+@pytest.mark.parametrize("relative_error", [0.01, 0.02])
+def test_hyperloglog_estimate_within_error_bound(distinct, relative_error):
+    sketch = HyperLogLog.for_error(relative_error)
+    hashes = _random_hashes(distinct)
+    # Every value seen three times: repeats must not move the estimate.
+    for _ in range(3):
+        sketch.add_hashes(hashes)
+
+    assert sketch.relative_error <= relative_error
+    # Four standard errors: a flaky failure here would mean a broken estimator.
+    assert abs(sketch.estimate() - distinct) <= 4 * sketch.relative_error * distinct + 1
+
+
+def test_hyperloglog_merge_matches_single_sketch():
+    hashes = _random_hashes(50_000)
+    whole = HyperLogLog(12)
+    whole.add_hashes(hashes)
+    left, right = HyperLogLog(12), HyperLogLog(12)
+    left.add_hashes(hashes[:20_000])
+    right.add_hashes(hashes[15_000:])
+
+    assert np.array_equal(left.merge(right).registers, whole.registers)
+    with pytest.raises(ValueError):
+        HyperLogLog(12).merge(HyperLogLog(13))
+
+
+def test_distinct_counter_is_exact_below_threshold():
+    values = pd.Series(np.random.default_rng(1).integers(0, 5_000, size=20_000))
+    counter = DistinctCounter(exact_max_rows=100_000)
+    for chunk in _chunks(values, 7):
+        counter.add_hashes(hash_series(chunk))
+
+    assert not counter.estimated
+    assert counter.count() == values.nunique()
+
+
+def test_distinct_counter_switches_to_sketch_and_merges_across_chunks():
+    values = pd.Series(np.arange(200_000, dtype=np.int64) % 150_000)
+    chunks = _chunks(values, 4)
+    counters = []
+    for chunk in chunks:
+        counter = DistinctCounter(exact_max_rows=60_000, relative_error=0.01)
+        counter.add_hashes(hash_series(chunk))
+        counters.append(counter)
+    merged = counters[0]
+    for counter in counters[1:]:
+        merged.merge(counter)
+
+    assert merged.estimated
+    assert merged.rows == len(values)
+    assert abs(merged.count() - 150_000) <= 0.04 * 150_000
+
+
+def test_hash_series_matches_int_and_float_chunks():
+    as_int = pd.Series([1, 2, 3], dtype=np.int64)
+    as_float = pd.Series([1.0, 2.0, np.nan])
+
+    assert np.array_equal(hash_series(as_int)[:2], hash_series(as_float)[:2])
+
+
+QUANTILES = np.linspace(0, 1, 21)
+
+
+def _rank_errors(values: np.ndarray, estimates: np.ndarray) -> np.ndarray:
+    ordered = np.sort(values)
+    low = np.searchsorted(ordered, estimates, side="left") / len(values)
+    high = np.searchsorted(ordered, estimates, side="right") / len(values)
+    # Distance from each requested rank to the rank range the estimate occupies.
+    return np.maximum(np.maximum(low - QUANTILES, QUANTILES - high), 0.0)
+
+
+def test_kll_is_exact_until_first_compaction():
+    values = np.random.default_rng(2).normal(size=1_000)
+    sketch = KLLSketch(k=2048)
+    sketch.update(np.append(values, np.nan))
+
+    assert sketch.exact
+    assert sketch.count == len(values)
+    assert np.allclose(sketch.quantiles(QUANTILES), np.quantile(values, QUANTILES))
+
+
+@pytest.mark.parametrize("k", [256, 2048])
+def test_kll_rank_error_within_bound(k):
+    values = np.random.default_rng(3).lognormal(size=400_000)
+    sketch = KLLSketch(k=k)
+    for start in range(0, len(values), 50_000):
+        sketch.update(values[start : start + 50_000])
+
+    assert not sketch.exact
+    # The rank error is about 1/k; allow a wide margin over it.
+    assert _rank_errors(values, sketch.quantiles(QUANTILES)).max() <= 4 / k
+    assert sketch.quantiles([0.0, 1.0]).tolist() == [values.min(), values.max()]
+    thresholds = np.quantile(values, [0.1, 0.5, 0.9])
+    assert np.allclose(sketch.fraction_below(thresholds), [0.1, 0.5, 0.9], atol=4 / k)
+    assert np.allclose(sketch.fraction_above(thresholds), [0.9, 0.5, 0.1], atol=4 / k)
+
+
+def test_kll_merge_keeps_rank_error_bound():
+    rng = np.random.default_rng(4)
+    parts = [rng.normal(loc, 1.0, size=100_000) for loc in (0.0, 3.0, -2.0)]
+    merged = KLLSketch(k=1024)
+    for part in parts:
+        sketch = KLLSketch(k=1024)
+        sketch.update(part)
+        merged.merge(sketch)
+    values = np.concatenate(parts)
+
+    assert merged.count == len(values)
+    assert _rank_errors(values, merged.quantiles(QUANTILES)).max() <= 4 / 1024
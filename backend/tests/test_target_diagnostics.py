@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.stats import chi2_contingency
+
+from app.analysis_engine.target_diagnostics import _missingness_bias
+
+
+def _null_mask(target: pd.Series, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    rows = len(target)
+    codes = pd.factorize(target)[0]
+    columns = {
+        "random": rng.random(rows) < 0.2,
+        "rare": rng.random(rows) < 0.01,
+        "never": np.zeros(rows, dtype=bool),
+        "always": np.ones(rows, dtype=bool),
+    }
+    # Missing far more often in some classes than others.
+    for strength in (0.05, 0.2, 0.5):
+        columns[f"biased_{strength}"] = rng.random(rows) < 0.1 + strength * (codes == 0)
+    return pd.DataFrame(columns)
+
+
+def _scipy_results(null_mask: pd.DataFrame, target: pd.Series) -> dict[str, tuple[float, float]]:
+    results = {}
+    for column in null_mask.columns:
+        table = pd.crosstab(null_mask[column], target).to_numpy()
+        if table.shape[0] < 2:
+            continue
+        chi2, p_value, _, _ = chi2_contingency(table)
+        results[column] = (chi2, p_value)
+    return results
+
+
+@pytest.mark.parametrize("classes", [["no", "yes"], ["a", "b", "c"], ["a", "b", "c", "d", "e"]])
+def test_missingness_bias_matches_chi2_contingency(classes):
+    rng = np.random.default_rng(len(classes))
+    target = pd.Series(rng.choice(classes, 3_000))
+    null_mask = _null_mask(target, len(classes))
+
+    flagged = {item["column"]: item for item in _missingness_bias(null_mask, target)}
+    expected = _scipy_results(null_mask, target)
+
+    assert set(flagged) == {column for column, (_, p_value) in expected.items() if p_value < 0.05}
+    for column, item in flagged.items():
+        chi2, p_value = expected[column]
+        assert item["chi2"] == pytest.approx(chi2, abs=1e-3)
+        assert item["p_value"] == pytest.approx(p_value, abs=1e-6)
+
+
+def test_missingness_bias_ignores_rows_without_target():
+    rng = np.random.default_rng(7)
+    target = pd.Series(rng.choice(["x", "y", None], 2_000))
+    null_mask = _null_mask(target, 7)
+
+    valid = target.notna()
+    flagged = {item["column"] for item in _missingness_bias(null_mask, target)}
+    expected = _scipy_results(null_mask[valid], target[valid])
+
+    assert flagged == {column for column, (_, p_value) in expected.items() if p_value < 0.05}
+
+
+def test_missingness_bias_needs_two_classes():
+    target = pd.Series(["only"] * 100)
+
+    assert _missingness_bias(_null_mask(target, 0), target) == []
@@ -0,0 +1,193 @@
+type PlotDataChartProps = {
+  plotType: string;
+  data: Record<string, unknown>;
+  title: string;
+};
+
+type Histogram = {
+  column: string;
+  counts: number[];
+  edges: number[];
+};
+
+const WIDTH = 480;
+const HEIGHT = 300;
+const NUMERIC_DISTRIBUTION_COLUMNS = 4;
+
+function asNumbers(value: unknown): number[] {
+  return Array.isArray(value) ? value.map((item) => Number(item) || 0) : [];
+}
+
+function asStrings(value: unknown): string[] {
+  return Array.isArray(value) ? value.map((item) => String(item)) : [];
+}
+
+function shortLabel(label: string, max = 14) {
+  return label.length > max ? `${label.slice(0, max - 1)}…` : label;
+}
+
+function BarChart({ labels, values, horizontal }: { labels: string[]; values: number[]; horizontal: boolean }) {
+  const max = Math.max(...values, 0) || 1;
+  if (horizontal) {
+    const labelWidth = 120;
+    const rowHeight = (HEIGHT - 20) / Math.max(labels.length, 1);
+    return (
+      <>
+        {labels.map((label, index) => {
+          const width = ((WIDTH - labelWidth - 16) * values[index]) / max;
+          const y = 10 + index * rowHeight;
+          return (
+            <g key={label}>
+              <text x={labelWidth - 6} y={y + rowHeight / 2} textAnchor="end" dominantBaseline="middle" className="fill-slate-300 text-[10px]">
+                {shortLabel(label, 18)}
+              </text>
+              <rect x={labelWidth} y={y + 2} width={width} height={Math.max(rowHeight - 4, 1)} className="fill-cyan-400/80" />
+            </g>
+          );
+        })}
+      </>
+    );
+  }
+
+  const slot = (WIDTH - 20) / Math.max(labels.length, 1);
+  return (
+    <>
+      {labels.map((label, index) => {
+        const height = ((HEIGHT - 40) * values[index]) / max;
+        const x = 10 + index * slot;
+        return (
+          <g key={label}>
+            <rect x={x + slot * 0.15} y={HEIGHT - 24 - height} width={slot * 0.7} height={height} className="fill-cyan-400/80" />
+            <text x={x + slot / 2} y={HEIGHT - 10} textAnchor="middle" className="fill-slate-300 text-[10px]">
+              {shortLabel(label)}
+            </text>
+          </g>
+        );
+      })}
+    </>
+  );
+}
+
+function Histograms({ histograms }: { histograms: Histogram[] }) {
+  const shown = histograms.slice(0, NUMERIC_DISTRIBUTION_COLUMNS);
+  const columns = shown.length > 1 ? 2 : 1;
+  const rows = Math.ceil(shown.length / columns);
+  const cellWidth = WIDTH / columns;
+  const cellHeight = HEIGHT / Math.max(rows, 1);
+  return (
+    <>
+      {shown.map((histogram, index) => {
+        const counts = asNumbers(histogram.counts);
+        const max = Math.max(...counts, 0) || 1;
+        const x0 = (index % columns) * cellWidth;
+        const y0 = Math.floor(index / columns) * cellHeight;
+        const barWidth = (cellWidth - 16) / Math.max(counts.length, 1);
+        return (
+          <g key={histogram.column}>
+            <text x={x0 + 8} y={y0 + 12} className="fill-slate-300 text-[10px]">
+              {shortLabel(histogram.column, 28)}
+            </text>
+            {counts.map((count, bin) => {
+              const height = ((cellHeight - 28) * count) / max;
+              return (
+                <rect
+                  key={bin}
+                  x={x0 + 8 + bin * barWidth}
+                  y={y0 + cellHeight - 8 - height}
+                  width={Math.max(barWidth - 1, 1)}
+                  height={height}
+                  className="fill-cyan-400/80"
+                />
+              );
+            })}
+          </g>
+        );
+      })}
+    </>
+  );
+}
+
+function correlationColor(value: number | null) {
+  if (value === null || Number.isNaN(value)) return "rgb(51, 65, 85)";
+  const strength = Math.min(Math.abs(value), 1);
+  return value >= 0 ? `rgba(34, 211, 238, ${0.15 + 0.85 * strength})` : `rgba(251, 113, 133, ${0.15 + 0.85 * strength})`;
+}
+
+function CorrelationGrid({ columns, matrix }: { columns: string[]; matrix: (number | null)[][] }) {
+  const labelSpace = 90;
+  const cell = Math.min((WIDTH - labelSpace) / Math.max(columns.length, 1), (HEIGHT - 20) / Math.max(columns.length, 1));
+  return (
+    <>
+      {columns.map((column, row) => (
+        <g key={column}>
+          <text x={labelSpace - 6} y={10 + row * cell + cell / 2} textAnchor="end" dominantBaseline="middle" className="fill-slate-300 text-[10px]">
+            {shortLabel(column)}
+          </text>
+          {columns.map((other, col) => {
+            const value = matrix[row]?.[col] ?? null;
+            return (
+              <rect key={other} x={labelSpace + col * cell} y={10 + row * cell} width={cell - 1} height={cell - 1} fill={correlationColor(value)}>
+                <title>{`${column} / ${other}: ${value === null ? "n/a" : value.toFixed(2)}`}</title>
+              </rect>
+            );
+          })}
+        </g>
+      ))}
+    </>
+  );
+}
+
+function MissingGrid({ data }: { data: Record<string, unknown> }) {
+  const columns = asStrings(data.columns);
+  const maskRows = Number(data.mask_rows) || 1;
+  const nullRows = (data.null_rows ?? {}) as Record<string, unknown>;
+  const cellWidth = (WIDTH - 20) / Math.max(columns.length, 1);
+  const rowHeight = (HEIGHT - 40) / maskRows;
+  return (
+    <>
+      {columns.map((column, index) => {
+        const x = 10 + index * cellWidth;
+        return (
+          <g key={column}>
+            <rect x={x} y={10} width={cellWidth - 2} height={HEIGHT - 40} className="fill-slate-800" />
+            {asNumbers(nullRows[column]).map((row) => (
+              <rect key={row} x={x} y={10 + row * rowHeight} width={cellWidth - 2} height={Math.max(rowHeight, 1)} className="fill-amber-300" />
+            ))}
+            <text x={x + cellWidth / 2} y={HEIGHT - 14} textAnchor="middle" className="fill-slate-300 text-[10px]">
+              {shortLabel(column, 10)}
+            </text>
+          </g>
+        );
+      })}
+    </>
+  );
+}
+
+export default function PlotDataChart({ plotType, data, title }: PlotDataChartProps) {
+  let content: JSX.Element | null = null;
+  if (plotType === "target_distribution") {
+    content = <BarChart labels={asStrings(data.labels)} values={asNumbers(data.counts)} horizontal={false} />;
+  } else if (plotType === "feature_importance") {
+    content = <BarChart labels={asStrings(data.features)} values={asNumbers(data.scores)} horizontal />;
+  } else if (plotType === "numeric_distribution") {
+    content = <Histograms histograms={(data.histograms as Histogram[]) ?? []} />;
+  } else if (plotType === "correlation_heatmap") {
+    content = (
+      <CorrelationGrid columns={asStrings(data.columns)} matrix={(data.matrix as (number | null)[][]) ?? []} />
+    );
+  } else if (plotType === "missing_heatmap") {
+    content = <MissingGrid data={data} />;
+  }
+
+  if (!content) return null;
+  return (
+    <svg
+      viewBox={`0 0 ${WIDTH} ${HEIGHT}`}
+      role="img"
+      aria-label={title}
+      className="h-72 w-full bg-slate-950 p-2 md:h-80"
+    >
+      {content}
+    </svg>
+  );
+}
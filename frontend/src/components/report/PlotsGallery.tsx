@@ -1,10 +1,12 @@
 import { useEffect, useMemo, useState } from "react";
 
-import { getReportPlotBlob } from "../../services/reportApi";
+import { getReportPlotBlob, getReportPlotData } from "../../services/reportApi";
+import PlotDataChart from "./PlotDataChart";
 
 type PlotsGalleryProps = {
   datasetId: string;
   availablePlots?: string[];
+  renderPlots?: boolean;
 };
 
 type PlotItem = {
@@ -41,38 +43,57 @@ const PLOT_CATALOG: PlotItem[] = [
   },
 ];
 
-export default function PlotsGallery({ datasetId, availablePlots }: PlotsGalleryProps) {
+export default function PlotsGallery({ datasetId, availablePlots, renderPlots = true }: PlotsGalleryProps) {
   const [urls, setUrls] = useState<Record<string, string>>({});
+  const [series, setSeries] = useState<Record<string, Record<string, unknown>>>({});
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
 
-  const items = useMemo(() => {
+  // Without rendered PNGs every plot is drawn here from its data, where the report has any.
+  const candidates = useMemo(() => {
+    if (!renderPlots) return PLOT_CATALOG;
     const allowed = new Set(availablePlots ?? []);
     return PLOT_CATALOG.filter((plot) => allowed.has(plot.key));
-  }, [availablePlots]);
-
-  if (items.length === 0) return null;
+  }, [availablePlots, renderPlots]);
 
   useEffect(() => {
     let cancelled = false;
     const activeUrls: string[] = [];
 
+    async function loadSeries(key: string, nextSeries: Record<string, Record<string, unknown>>) {
+      const payload = await getReportPlotData(datasetId, key);
+      if (payload.data) nextSeries[key] = payload.data;
+    }
+
     async function loadPlots() {
       setLoading(true);
       setError(null);
 
       try {
         const nextUrls: Record<string, string> = {};
+        const nextSeries: Record<string, Record<string, unknown>> = {};
         await Promise.all(
-          items.map(async (item) => {
-            const blob = await getReportPlotBlob(datasetId, item.key);
-            const objectUrl = URL.createObjectURL(blob);
-            activeUrls.push(objectUrl);
-            nextUrls[item.key] = objectUrl;
+          candidates.map(async (item) => {
+            if (!renderPlots) {
+              await loadSeries(item.key, nextSeries);
+              return;
+            }
+            try {
+              const blob = await getReportPlotBlob(datasetId, item.key);
+              const objectUrl = URL.createObjectURL(blob);
+              activeUrls.push(objectUrl);
+              nextUrls[item.key] = objectUrl;
+            } catch {
+              // A PNG that cannot be rendered is drawn from its data instead, when there is any.
+              await loadSeries(item.key, nextSeries).catch(() => undefined);
+            }
           })
         );
 
-        if (!cancelled) setUrls(nextUrls);
+        if (!cancelled) {
+          setUrls(nextUrls);
+          setSeries(nextSeries);
+        }
       } catch (err: unknown) {
         if (!cancelled) {
           setError(err instanceof Error ? err.message : "Unable to load plots.");
@@ -82,13 +103,16 @@ export default function PlotsGallery({ datasetId, availablePlots }: PlotsGallery
       }
     }
 
-    loadPlots();
+    if (candidates.length > 0) loadPlots();
 
     return () => {
       cancelled = true;
       activeUrls.forEach((url) => URL.revokeObjectURL(url));
     };
-  }, [datasetId, items]);
+  }, [datasetId, candidates, renderPlots]);
+
+  const items = renderPlots || loading ? candidates : candidates.filter((item) => series[item.key]);
+  if (items.length === 0) return null;
 
   return (
     <section className="rounded-2xl border border-white/10 bg-slate-950/70 p-5 backdrop-blur-sm">
@@ -126,6 +150,8 @@ export default function PlotsGallery({ datasetId, availablePlots }: PlotsGallery
                     className="h-72 w-full object-contain bg-slate-950 p-2 md:h-80"
                     loading="lazy"
                   />
+                ) : series[item.key] ? (
+                  <PlotDataChart plotType={item.key} data={series[item.key]} title={item.title} />
                 ) : (
                   <div className="flex h-72 items-center justify-center text-xs text-slate-400 md:h-80">
                     Plot unavailable
@@ -6,6 +6,7 @@ export type ReportDatasetMeta = {
   target_column?: string | null;
   created_at?: string;
   status?: string;
+  render_plots?: boolean;
 };
 
 export type ReportViewData = {
@@ -162,7 +162,11 @@ export default function Report({ datasetId, onBackToDashboard, onDeleted }: Repo
               </aside>
             </section>
 
-            <PlotsGallery datasetId={datasetId} availablePlots={data.available_plots} />
+            <PlotsGallery
+              datasetId={datasetId}
+              availablePlots={data.available_plots}
+              renderPlots={data.dataset.render_plots !== false}
+            />
           </div>
         ) : null}
       </div>
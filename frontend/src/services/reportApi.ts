@@ -13,6 +13,7 @@ export type ReportView = {
     target_column?: string | null;
     created_at?: string;
     status?: string;
+    render_plots?: boolean;
   };
   sentinel_score: number;
   dataset_difficulty?: string | null;
@@ -47,3 +48,13 @@ export async function getReportPlotBlob(datasetId: string, plotName: string) {
 
   return res.blob();
 }
+
+export type ReportPlotData = {
+  dataset_id: string;
+  plot_type: string;
+  data: Record<string, unknown> | null;
+};
+
+export async function getReportPlotData(datasetId: string, plotName: string) {
+  return api.fetchJson<ReportPlotData>(`/plots/${datasetId}/${plotName}/data`);
+}